@@ -0,0 +1,108 @@
+"""
+Benchmark sequential per-ticker InfluxDB reads with and without client reuse.
+
+Writes test price data of several tickers under a dedicated frequency tag,
+reads it back ticker by ticker, once with a fresh client per request
+(closing the shared client before each one) and once with the client
+reused across requests, and removes the written price data afterwards.
+
+Requires InfluxDB configured in the environment (i.e. .env).
+"""
+
+from statistics import median
+from time import perf_counter
+
+import pandas as pd
+
+from apollo.connectors.database.influxdb_connector import (
+    InfluxDbConnector,
+    close_influxdb_clients,
+    get_influxdb_client,
+)
+from apollo.settings import (
+    INFLUXDB_BUCKET,
+    INFLUXDB_MEASUREMENT,
+    INFLUXDB_ORG,
+    INFLUXDB_TOKEN,
+    INFLUXDB_URL,
+)
+
+# Frequency tag price data is written under,
+# so that it does not mix with real price data
+BENCHMARK_FREQUENCY = "benchmark"
+
+TICKERS = [f"BENCHMARK{number}" for number in range(20)]
+ROUNDS = 5
+
+
+def time_sequential_reads(
+    influxdb_connector: InfluxDbConnector,
+    reuse_client: bool,
+) -> float:
+    """
+    Time reading price data of every ticker one after another.
+
+    :param influxdb_connector: InfluxDB connector to read with.
+    :param reuse_client: Flag to reuse client across requests.
+    :returns: Seconds taken to read price data of every ticker.
+    """
+
+    started = perf_counter()
+
+    for ticker in TICKERS:
+        # Closing the shared client forces a new
+        # connection, as a client per request did
+        if not reuse_client:
+            close_influxdb_clients()
+
+        influxdb_connector.get_last_record_date(ticker, BENCHMARK_FREQUENCY)
+        influxdb_connector.read_price_data(
+            ticker=ticker,
+            frequency=BENCHMARK_FREQUENCY,
+            start_date="",
+            end_date="",
+            max_period=True,
+        )
+
+    return perf_counter() - started
+
+
+influxdb_connector = InfluxDbConnector()
+
+price_data = pd.read_csv("tests/test_data/SPY.csv", index_col="date", parse_dates=True)
+
+for ticker in TICKERS:
+    influxdb_connector.write_price_data(
+        BENCHMARK_FREQUENCY,
+        price_data.assign(ticker=ticker),
+    )
+
+try:
+    for reuse_client in (False, True):
+        timings = [
+            time_sequential_reads(influxdb_connector, reuse_client)
+            for _ in range(ROUNDS)
+        ]
+
+        print(  # noqa: T201
+            f"{'Reused' if reuse_client else 'Fresh'} client: "
+            f"{len(TICKERS)} tickers, median {median(timings):.3f}s, "
+            f"best {min(timings):.3f}s, "
+            f"{median(timings) / len(TICKERS) * 1000:.1f}ms per ticker",
+        )
+
+finally:
+    get_influxdb_client(
+        url=str(INFLUXDB_URL),
+        org=INFLUXDB_ORG,
+        token=INFLUXDB_TOKEN,
+    ).delete_api().delete(
+        start="1970-01-01T00:00:00Z",
+        stop="2100-01-01T00:00:00Z",
+        predicate=(
+            f'_measurement="{INFLUXDB_MEASUREMENT}" '
+            f'AND frequency="{BENCHMARK_FREQUENCY}"'
+        ),
+        bucket=str(INFLUXDB_BUCKET),
+        org=INFLUXDB_ORG,
+    )
@@ -5,8 +5,9 @@ from pathlib import Path
 from backtesting import Backtest
 from pandas import DataFrame, Series
 
+from apollo.backtesters.native_backtesting_engine import NativeBacktestingEngine
 from apollo.backtesters.strategy_simulation_agent import StrategySimulationAgent
-from apollo.settings import PLOT_DIR, TRDS_DIR
+from apollo.settings import PLOT_DIR, TRDS_DIR, BacktestingEngine
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +17,16 @@ logger = logging.getLogger(__name__)
 # Sortino ratio for a strategy that has no negative returns
 warnings.filterwarnings("ignore")
 
+# Price columns renamed to the format
+# backtesting library and native engines expect
+BACKTESTING_COLUMNS = {
+    "open": "Open",
+    "high": "High",
+    "low": "Low",
+    "close": "Close",
+    "volume": "Volume",
+}
+
 
 class BacktestingRunner:
     """Backtesting Runner class that facilitates the backtesting process."""
@@ -29,6 +40,7 @@ class BacktestingRunner:
         tp_volatility_multiplier: float,
         write_result_plot: bool = False,
         write_result_trades: bool = False,
+        engine: BacktestingEngine = BacktestingEngine.BACKTESTING_PY,
     ) -> None:
         """
         Construct Backtesting runner.
@@ -42,24 +54,26 @@ class BacktestingRunner:
         :param tp_volatility_multiplier: Take profit volatility multiplier.
         :param write_result_plot: Flag to write backtesting plot.
         :param write_result_trades: Flag to write backtesting trades.
+        :param engine: Engine to run backtesting process with.
+
+        :raises ValueError: If plot is requested from native engine.
         """
 
-        dataframe.rename(
-            columns={
-                "open": "Open",
-                "high": "High",
-                "low": "Low",
-                "close": "Close",
-                "volume": "Volume",
-            },
-            inplace=True,
-        )
+        # Only backtesting library is able to plot the results
+        if write_result_plot and engine == BacktestingEngine.NATIVE:
+            raise ValueError("Native engine does not support writing result plot.")
+
+        dataframe.rename(columns=BACKTESTING_COLUMNS, inplace=True)
 
         self._dataframe = dataframe
         self._strategy_name = strategy_name
         self._lot_size_cash = lot_size_cash
         self._write_result_plot = write_result_plot
         self._write_result_trades = write_result_trades
+        self._engine = engine
+
+        self._sl_volatility_multiplier = sl_volatility_multiplier
+        self._tp_volatility_multiplier = tp_volatility_multiplier
 
         self._strategy_sim_agent = StrategySimulationAgent
         self._strategy_sim_agent.sl_volatility_multiplier = sl_volatility_multiplier
@@ -73,6 +87,18 @@ class BacktestingRunner:
         Log statistics with slight name changes to display proper strategy name.
         """
 
+        # Simulate the same execution rules natively
+        # and skip the backtesting library altogether
+        if self._engine == BacktestingEngine.NATIVE:
+            stats = NativeBacktestingEngine(
+                dataframe=self._dataframe,
+                lot_size_cash=self._lot_size_cash,
+                sl_volatility_multiplier=self._sl_volatility_multiplier,
+                tp_volatility_multiplier=self._tp_volatility_multiplier,
+            ).run()
+
+            return self._finalize_stats(stats)
+
         backtesting_process = Backtest(
             data=self._dataframe,
             strategy=self._strategy_sim_agent,
@@ -95,6 +121,16 @@ class BacktestingRunner:
                 filename=f"{PLOT_DIR}/{self._strategy_name}.html",
             )
 
+        return self._finalize_stats(stats)
+
+    def _finalize_stats(self, stats: Series) -> Series:
+        """
+        Write trades if requested and rename the strategy in statistics.
+
+        :param stats: Series with backtesting statistics.
+        :returns: Series with backtesting statistics.
+        """
+
         if self._write_result_trades:
             # Make sure directory for trades exists
             if not Path.is_dir(TRDS_DIR):
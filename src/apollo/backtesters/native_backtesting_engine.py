@@ -0,0 +1,1201 @@
+import sys
+from collections.abc import Callable, Sequence
+from typing import TypeVar, cast
+
+import numpy as np
+import pandas as pd
+
+# NOTE: private internals of the backtesting library are used
+# to match its statistics exactly, hence its version is pinned
+# in requirements.txt and must be bumped with care
+from backtesting._stats import compute_stats, geometric_mean
+from backtesting._util import _data_period
+
+from apollo.settings import LONG_SIGNAL, SHORT_SIGNAL
+
+# NOTE: Numba is an optional dependency,
+# if available, simulation is compiled,
+# otherwise, it runs as pure Python loop
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover
+    njit = None
+
+FunctionType = TypeVar("FunctionType", bound=Callable)
+
+# Fraction of equity backtesting library
+# allocates to each order by default
+FULL_EQUITY_FRACTION = 1 - sys.float_info.epsilon
+
+# Maximum number of simultaneously queued orders,
+# entry, close, stop loss and take profit of a single trade
+ORDER_QUEUE_CAPACITY = 8
+
+# Columns of the order queue
+ORDER_KIND = 0
+ORDER_SIZE = 1
+ORDER_PRICE = 2
+ORDER_PARENT = 3
+ORDER_ID = 4
+
+# Kinds of queued orders
+ENTRY_ORDER = 0.0
+CLOSE_ORDER = 1.0
+STOP_LOSS_ORDER = 2.0
+TAKE_PROFIT_ORDER = 3.0
+
+# Fields of the account state
+ACCOUNT_CASH = 0
+ACCOUNT_ORDERS = 1
+ACCOUNT_NEXT_ORDER_ID = 2
+ACCOUNT_CLOSED_TRADES = 3
+ACCOUNT_NEXT_TRADE_ID = 4
+
+# Fields of the open trade state
+TRADE_IS_OPEN = 0
+TRADE_ID = 1
+TRADE_SIZE = 2
+TRADE_ENTRY_PRICE = 3
+TRADE_ENTRY_BAR = 4
+TRADE_SL = 5
+TRADE_TP = 6
+
+# Columns of closed trades records
+CLOSED_SIZE = 0
+CLOSED_ENTRY_BAR = 1
+CLOSED_EXIT_BAR = 2
+CLOSED_ENTRY_PRICE = 3
+CLOSED_EXIT_PRICE = 4
+CLOSED_SL = 5
+CLOSED_TP = 6
+
+
+def _compile(function: FunctionType) -> FunctionType:
+    """
+    Compile function with Numba if it is available.
+
+    :param function: Function to compile.
+    :returns: Compiled function or the function itself.
+    """
+
+    return njit(cache=True)(function) if njit is not None else function
+
+
+@_compile
+def _find_order(
+    orders: np.ndarray,
+    account: np.ndarray,
+    order_id: float,
+) -> int:
+    """
+    Find position of the order in the queue.
+
+    :param orders: Order queue.
+    :param account: Account state.
+    :param order_id: Id of the order to find.
+    :returns: Position of the order or -1 if the order is not queued.
+    """
+
+    for index in range(int(account[ACCOUNT_ORDERS])):
+        if orders[index, ORDER_ID] == order_id:
+            return index
+
+    return -1
+
+
+@_compile
+def _find_contingent_order(
+    orders: np.ndarray,
+    account: np.ndarray,
+    kind: float,
+    trade_id: float,
+) -> int:
+    """
+    Find position of stop loss or take profit order of the trade in the queue.
+
+    :param orders: Order queue.
+    :param account: Account state.
+    :param kind: Kind of contingent order.
+    :param trade_id: Id of the parent trade.
+    :returns: Position of the order or -1 if the order is not queued.
+    """
+
+    for index in range(int(account[ACCOUNT_ORDERS])):
+        if (
+            orders[index, ORDER_KIND] == kind
+            and orders[index, ORDER_PARENT] == trade_id
+        ):
+            return index
+
+    return -1
+
+
+@_compile
+def _remove_order(orders: np.ndarray, account: np.ndarray, index: int) -> None:
+    """
+    Remove the order from the queue, preserving order of the rest.
+
+    :param orders: Order queue.
+    :param account: Account state.
+    :param index: Position of the order to remove.
+    """
+
+    count = int(account[ACCOUNT_ORDERS])
+
+    orders[index : count - 1] = orders[index + 1 : count]
+    account[ACCOUNT_ORDERS] = count - 1
+
+
+@_compile
+def _insert_order(
+    orders: np.ndarray,
+    account: np.ndarray,
+    index: int,
+    kind: float,
+    size: float,
+    price: float,
+    parent: float,
+) -> None:
+    """
+    Insert new order into the queue at given position.
+
+    :param orders: Order queue.
+    :param account: Account state.
+    :param index: Position to insert the order at.
+    :param kind: Kind of the order.
+    :param size: Size of the order, negative for short orders.
+    :param price: Limit or stop price of the order.
+    :param parent: Id of the parent trade, -1 for entry orders.
+    """
+
+    count = int(account[ACCOUNT_ORDERS])
+
+    orders[index + 1 : count + 1] = orders[index:count].copy()
+    orders[index, ORDER_KIND] = kind
+    orders[index, ORDER_SIZE] = size
+    orders[index, ORDER_PRICE] = price
+    orders[index, ORDER_PARENT] = parent
+    orders[index, ORDER_ID] = account[ACCOUNT_NEXT_ORDER_ID]
+
+    account[ACCOUNT_ORDERS] = count + 1
+    account[ACCOUNT_NEXT_ORDER_ID] += 1
+
+
+@_compile
+def _record_closed_trade(
+    account: np.ndarray,
+    closed_trades: np.ndarray,
+    trade: np.ndarray,
+    size: float,
+    price: float,
+    bar: int,
+    sl: float,
+    tp: float,
+) -> None:
+    """
+    Record closed trade (or its closed part) and settle its profit or loss.
+
+    Trades are only counted if there is no room left for their records.
+
+    :param account: Account state.
+    :param closed_trades: Closed trades records.
+    :param trade: Open trade state.
+    :param size: Closed size of the trade.
+    :param price: Exit price.
+    :param bar: Exit bar.
+    :param sl: Last stop loss of the trade.
+    :param tp: Last take profit of the trade.
+    """
+
+    record = int(account[ACCOUNT_CLOSED_TRADES])
+
+    if record < closed_trades.shape[0]:
+        closed_trades[record, CLOSED_SIZE] = size
+        closed_trades[record, CLOSED_ENTRY_BAR] = trade[TRADE_ENTRY_BAR]
+        closed_trades[record, CLOSED_EXIT_BAR] = bar
+        closed_trades[record, CLOSED_ENTRY_PRICE] = trade[TRADE_ENTRY_PRICE]
+        closed_trades[record, CLOSED_EXIT_PRICE] = price
+        closed_trades[record, CLOSED_SL] = sl
+        closed_trades[record, CLOSED_TP] = tp
+
+    account[ACCOUNT_CLOSED_TRADES] = record + 1
+    account[ACCOUNT_CASH] += size * (price - trade[TRADE_ENTRY_PRICE])
+
+
+@_compile
+def _close_trade(
+    orders: np.ndarray,
+    account: np.ndarray,
+    closed_trades: np.ndarray,
+    trade: np.ndarray,
+    price: float,
+    bar: int,
+) -> None:
+    """
+    Close the open trade and cancel its stop loss and take profit orders.
+
+    :param orders: Order queue.
+    :param account: Account state.
+    :param closed_trades: Closed trades records.
+    :param trade: Open trade state.
+    :param price: Exit price.
+    :param bar: Exit bar.
+    """
+
+    # Closed trade keeps its last brackets
+    _record_closed_trade(
+        account,
+        closed_trades,
+        trade,
+        trade[TRADE_SIZE],
+        price,
+        bar,
+        trade[TRADE_SL],
+        trade[TRADE_TP],
+    )
+
+    for kind in (STOP_LOSS_ORDER, TAKE_PROFIT_ORDER):
+        index = _find_contingent_order(orders, account, kind, trade[TRADE_ID])
+
+        if index >= 0:
+            _remove_order(orders, account, index)
+
+    trade[TRADE_IS_OPEN] = 0.0
+
+
+@_compile
+def _get_equity(account: np.ndarray, trade: np.ndarray, close: float) -> float:
+    """
+    Get current equity, cash plus unrealized profit or loss.
+
+    :param account: Account state.
+    :param trade: Open trade state.
+    :param close: Current close price.
+    :returns: Current equity.
+    """
+
+    if not trade[TRADE_IS_OPEN]:
+        return account[ACCOUNT_CASH] + 0.0
+
+    return account[ACCOUNT_CASH] + (
+        close * trade[TRADE_SIZE] - trade[TRADE_SIZE] * trade[TRADE_ENTRY_PRICE]
+    )
+
+
+@_compile
+def _get_margin_available(
+    account: np.ndarray,
+    trade: np.ndarray,
+    close: float,
+) -> float:
+    """
+    Get margin available for new orders.
+
+    :param account: Account state.
+    :param trade: Open trade state.
+    :param close: Current close price.
+    :returns: Available margin.
+    """
+
+    margin_used = abs(trade[TRADE_SIZE]) * close if trade[TRADE_IS_OPEN] else 0.0
+
+    return max(0.0, _get_equity(account, trade, close) - margin_used)
+
+
+@_compile
+def _fill_entry_order(
+    orders: np.ndarray,
+    account: np.ndarray,
+    closed_trades: np.ndarray,
+    trade: np.ndarray,
+    order_size: float,
+    price: float,
+    close: float,
+    bar: int,
+) -> None:
+    """
+    Fill the entry order, sizing it by available margin.
+
+    :param orders: Order queue.
+    :param account: Account state.
+    :param closed_trades: Closed trades records.
+    :param trade: Open trade state.
+    :param order_size: Size of the order as a fraction of equity.
+    :param price: Fill price.
+    :param close: Current close price.
+    :param bar: Fill bar.
+    """
+
+    # Size the order in whole units
+    units = float(
+        int((_get_margin_available(account, trade, close) * abs(order_size)) // price),
+    )
+
+    # Not enough margin even for a single unit
+    if not units:
+        return
+
+    need_size = units if order_size > 0 else -units
+
+    # Close or reduce opposite-facing trade first
+    if trade[TRADE_IS_OPEN] == 1.0 and (trade[TRADE_SIZE] > 0) != (order_size > 0):
+        if abs(need_size) >= abs(trade[TRADE_SIZE]):
+            need_size += trade[TRADE_SIZE]
+            _close_trade(orders, account, closed_trades, trade, price, bar)
+        else:
+            trade[TRADE_SIZE] += need_size
+
+            for kind in (STOP_LOSS_ORDER, TAKE_PROFIT_ORDER):
+                index = _find_contingent_order(orders, account, kind, trade[TRADE_ID])
+
+                if index >= 0:
+                    orders[index, ORDER_SIZE] = -trade[TRADE_SIZE]
+
+            # Reduced part is closed without brackets
+            _record_closed_trade(
+                account,
+                closed_trades,
+                trade,
+                -need_size,
+                price,
+                bar,
+                np.nan,
+                np.nan,
+            )
+
+            need_size = 0.0
+
+    # Broker cancels the order if there is not enough margin to cover it
+    if abs(need_size) * price > _get_margin_available(account, trade, close):
+        return
+
+    if need_size:
+        trade[TRADE_IS_OPEN] = 1.0
+        trade[TRADE_ID] = account[ACCOUNT_NEXT_TRADE_ID]
+        trade[TRADE_SIZE] = need_size
+        trade[TRADE_ENTRY_PRICE] = price
+        trade[TRADE_ENTRY_BAR] = bar
+        trade[TRADE_SL] = np.nan
+        trade[TRADE_TP] = np.nan
+
+        account[ACCOUNT_NEXT_TRADE_ID] += 1
+
+
+@_compile
+def _cancel_order(
+    orders: np.ndarray,
+    account: np.ndarray,
+    trade: np.ndarray,
+    index: int,
+) -> None:
+    """
+    Cancel the order, detaching it from its trade if it is contingent.
+
+    :param orders: Order queue.
+    :param account: Account state.
+    :param trade: Open trade state.
+    :param index: Position of the order to cancel.
+    """
+
+    kind = orders[index, ORDER_KIND]
+    is_trade_order = (
+        trade[TRADE_IS_OPEN] == 1.0 and orders[index, ORDER_PARENT] == trade[TRADE_ID]
+    )
+
+    if is_trade_order and kind == STOP_LOSS_ORDER:
+        trade[TRADE_SL] = np.nan
+
+    if is_trade_order and kind == TAKE_PROFIT_ORDER:
+        trade[TRADE_TP] = np.nan
+
+    _remove_order(orders, account, index)
+
+
+@_compile
+def _process_orders(
+    orders: np.ndarray,
+    account: np.ndarray,
+    closed_trades: np.ndarray,
+    trade: np.ndarray,
+    open_price: float,
+    high_price: float,
+    low_price: float,
+    close_price: float,
+    previous_close_price: float,
+    bar: int,
+) -> None:
+    """
+    Process queued orders against the current bar.
+
+    Orders are processed in the queue order:
+
+    * Close orders are market orders filled at previous close.
+    * Stop loss orders are filled once stop price is touched.
+    * Take profit and entry orders are filled once limit price is touched.
+
+    Orders that are not filled remain queued.
+
+    :param orders: Order queue.
+    :param account: Account state.
+    :param closed_trades: Closed trades records.
+    :param trade: Open trade state.
+    :param open_price: Open of the current bar.
+    :param high_price: High of the current bar.
+    :param low_price: Low of the current bar.
+    :param close_price: Close of the current bar.
+    :param previous_close_price: Close of the previous bar.
+    :param bar: Current bar.
+    """
+
+    # Iterate over snapshot of the queue,
+    # since processing removes orders from it
+    order_ids = orders[: int(account[ACCOUNT_ORDERS]), ORDER_ID].copy()
+
+    for order_id in order_ids:
+        index = _find_order(orders, account, order_id)
+
+        # Order was already removed along with its trade
+        if index < 0:
+            continue
+
+        kind = orders[index, ORDER_KIND]
+        size = orders[index, ORDER_SIZE]
+        price = orders[index, ORDER_PRICE]
+
+        is_long = size > 0
+        is_parent_open = (
+            trade[TRADE_IS_OPEN] == 1.0
+            and orders[index, ORDER_PARENT] == trade[TRADE_ID]
+        )
+
+        # Close orders are filled on close of the bar they were placed on
+        if kind == CLOSE_ORDER:
+            _remove_order(orders, account, index)
+
+            if is_parent_open:
+                _close_trade(
+                    orders,
+                    account,
+                    closed_trades,
+                    trade,
+                    previous_close_price,
+                    bar - 1,
+                )
+
+            continue
+
+        # Stop order turns into market order once stop price is touched,
+        # and is filled at stop price or worse if the price gapped through
+        if kind == STOP_LOSS_ORDER:
+            if not (high_price >= price if is_long else low_price <= price):
+                continue
+
+            fill_price = max(open_price, price) if is_long else min(open_price, price)
+
+        # Limit order is filled at limit price or better
+        else:
+            if not (low_price <= price if is_long else high_price >= price):
+                continue
+
+            fill_price = min(open_price, price) if is_long else max(open_price, price)
+
+        # Stop loss and take profit close their trade
+        if kind != ENTRY_ORDER:
+            if is_parent_open:
+                _close_trade(orders, account, closed_trades, trade, fill_price, bar)
+
+            continue
+
+        _remove_order(orders, account, index)
+        _fill_entry_order(
+            orders,
+            account,
+            closed_trades,
+            trade,
+            size,
+            fill_price,
+            close_price,
+            bar,
+        )
+
+
+@_compile
+def _place_entry_order(
+    orders: np.ndarray,
+    account: np.ndarray,
+    trade: np.ndarray,
+    size: float,
+    limit_price: float,
+) -> None:
+    """
+    Place limit entry order exclusively.
+
+    Cancel pending non-contingent orders and close open trade beforehand.
+
+    :param orders: Order queue.
+    :param account: Account state.
+    :param trade: Open trade state.
+    :param size: Size of the order as a fraction of equity.
+    :param limit_price: Limit entry price.
+
+    :raises ValueError: If limit entry price is not finite.
+    """
+
+    if not -np.inf < limit_price < np.inf:
+        raise ValueError("Limit entry price must be finite.")
+
+    # NOTE: this mirrors the library, which cancels orders
+    # while iterating over the queue, skipping the order
+    # that follows each cancelled one
+    index = 0
+    while index < account[ACCOUNT_ORDERS]:
+        kind = orders[index, ORDER_KIND]
+
+        if kind in (ENTRY_ORDER, CLOSE_ORDER):
+            _cancel_order(orders, account, trade, index)
+
+        index += 1
+
+    # Close the open trade on close
+    if trade[TRADE_IS_OPEN] == 1.0:
+        _insert_order(
+            orders,
+            account,
+            0,
+            CLOSE_ORDER,
+            -trade[TRADE_SIZE],
+            np.nan,
+            trade[TRADE_ID],
+        )
+
+    _insert_order(
+        orders,
+        account,
+        int(account[ACCOUNT_ORDERS]),
+        ENTRY_ORDER,
+        size,
+        limit_price,
+        -1.0,
+    )
+
+
+@_compile
+def _set_trade_brackets(
+    orders: np.ndarray,
+    account: np.ndarray,
+    trade: np.ndarray,
+    stop_loss: float,
+    take_profit: float,
+) -> None:
+    """
+    Replace stop loss and take profit orders of the open trade.
+
+    Stop loss orders are queued first, take profit orders last.
+
+    :param orders: Order queue.
+    :param account: Account state.
+    :param trade: Open trade state.
+    :param stop_loss: Stop loss price.
+    :param take_profit: Take profit price.
+
+    :raises ValueError: If any of the prices is not positive and finite.
+    """
+
+    for kind, price in ((STOP_LOSS_ORDER, stop_loss), (TAKE_PROFIT_ORDER, take_profit)):
+        index = _find_contingent_order(orders, account, kind, trade[TRADE_ID])
+
+        if index >= 0:
+            _cancel_order(orders, account, trade, index)
+
+        if not 0 < price < np.inf:
+            raise ValueError("Stop loss and take profit must be positive and finite.")
+
+        if kind == STOP_LOSS_ORDER:
+            _insert_order(
+                orders,
+                account,
+                0,
+                kind,
+                -trade[TRADE_SIZE],
+                price,
+                trade[TRADE_ID],
+            )
+            trade[TRADE_SL] = price
+        else:
+            _insert_order(
+                orders,
+                account,
+                int(account[ACCOUNT_ORDERS]),
+                kind,
+                -trade[TRADE_SIZE],
+                price,
+                trade[TRADE_ID],
+            )
+            trade[TRADE_TP] = price
+
+
+@_compile
+def _manage_orders(
+    orders: np.ndarray,
+    account: np.ndarray,
+    trade: np.ndarray,
+    close_price: float,
+    average_true_range: float,
+    signal: float,
+    sl_volatility_multiplier: float,
+    tp_volatility_multiplier: float,
+) -> None:
+    """
+    Manage orders on close of the current bar.
+
+    Mirrors Strategy Simulation Agent, please see its next method.
+
+    :param orders: Order queue.
+    :param account: Account state.
+    :param trade: Open trade state.
+    :param close_price: Close of the current bar.
+    :param average_true_range: Average True Range of the current bar.
+    :param signal: Signal of the current bar.
+    :param sl_volatility_multiplier: Stop loss volatility multiplier.
+    :param tp_volatility_multiplier: Take profit volatility multiplier.
+    """
+
+    # Calculate trailing stop loss and take profit
+    long_sl = close_price - average_true_range * sl_volatility_multiplier
+    long_tp = close_price + average_true_range * tp_volatility_multiplier
+
+    short_sl = close_price + average_true_range * sl_volatility_multiplier
+    short_tp = close_price - average_true_range * tp_volatility_multiplier
+
+    # Cancel the first outstanding order,
+    # as the agent does with unfilled orders
+    if account[ACCOUNT_ORDERS] > 0:
+        _cancel_order(orders, account, trade, 0)
+
+    if signal != 0:
+        # Calculate limit entry price for long and short signals
+        long_limit = close_price + average_true_range * tp_volatility_multiplier / 2
+        short_limit = close_price - average_true_range * tp_volatility_multiplier / 2
+
+        if signal == LONG_SIGNAL:
+            # Skip if we already have long position
+            if trade[TRADE_IS_OPEN] == 1.0 and trade[TRADE_SIZE] > 0:
+                return
+
+            _place_entry_order(orders, account, trade, FULL_EQUITY_FRACTION, long_limit)
+
+        if signal == SHORT_SIGNAL:
+            # Skip if we already have short position
+            if trade[TRADE_IS_OPEN] == 1.0 and trade[TRADE_SIZE] < 0:
+                return
+
+            _place_entry_order(
+                orders,
+                account,
+                trade,
+                -FULL_EQUITY_FRACTION,
+                short_limit,
+            )
+
+    # Assign trailing stop loss and take profit to open trade
+    if trade[TRADE_IS_OPEN] == 1.0:
+        if trade[TRADE_SIZE] > 0:
+            _set_trade_brackets(orders, account, trade, long_sl, long_tp)
+        else:
+            _set_trade_brackets(orders, account, trade, short_sl, short_tp)
+
+
+@_compile
+def _advance_bar(
+    orders: np.ndarray,
+    account: np.ndarray,
+    closed_trades: np.ndarray,
+    trade: np.ndarray,
+    equity: np.ndarray,
+    open_prices: np.ndarray,
+    high_prices: np.ndarray,
+    low_prices: np.ndarray,
+    close_prices: np.ndarray,
+    average_true_range: np.ndarray,
+    signals: np.ndarray,
+    sl_volatility_multiplier: float,
+    tp_volatility_multiplier: float,
+    bar: int,
+) -> bool:
+    """
+    Advance the simulation by a single bar.
+
+    Queued orders are processed against prices of the bar first,
+    then, orders are managed on its close based on its signal.
+
+    :param orders: Order queue.
+    :param account: Account state.
+    :param closed_trades: Closed trades records.
+    :param trade: Open trade state.
+    :param equity: Equity curve to record equity of the bar into.
+    :param open_prices: Array of opens.
+    :param high_prices: Array of highs.
+    :param low_prices: Array of lows.
+    :param close_prices: Array of closes.
+    :param average_true_range: Array of Average True Range values.
+    :param signals: Array of signals.
+    :param sl_volatility_multiplier: Stop loss volatility multiplier.
+    :param tp_volatility_multiplier: Take profit volatility multiplier.
+    :param bar: Bar to advance by.
+    :returns: False if we are out of money and simulation is over, True otherwise.
+    """
+
+    _process_orders(
+        orders,
+        account,
+        closed_trades,
+        trade,
+        open_prices[bar],
+        high_prices[bar],
+        low_prices[bar],
+        close_prices[bar],
+        close_prices[bar - 1],
+        bar,
+    )
+
+    equity[bar] = _get_equity(account, trade, close_prices[bar])
+
+    # Stop the simulation if we are out of money
+    if equity[bar] <= 0:
+        if trade[TRADE_IS_OPEN] == 1.0:
+            _close_trade(
+                orders,
+                account,
+                closed_trades,
+                trade,
+                close_prices[bar],
+                bar,
+            )
+
+        account[ACCOUNT_CASH] = 0.0
+        equity[bar:] = 0.0
+
+        return False
+
+    _manage_orders(
+        orders,
+        account,
+        trade,
+        close_prices[bar],
+        average_true_range[bar],
+        signals[bar],
+        sl_volatility_multiplier,
+        tp_volatility_multiplier,
+    )
+
+    return True
+
+
+def _simulate_trades(
+    open_prices: np.ndarray,
+    high_prices: np.ndarray,
+    low_prices: np.ndarray,
+    close_prices: np.ndarray,
+    average_true_range: np.ndarray,
+    signals: np.ndarray,
+    sl_volatility_multiplier: float,
+    tp_volatility_multiplier: float,
+    cash: float,
+) -> tuple[np.ndarray, np.ndarray, float]:
+    """
+    Simulate trade execution over the whole series.
+
+    :param open_prices: Array of opens.
+    :param high_prices: Array of highs.
+    :param low_prices: Array of lows.
+    :param close_prices: Array of closes.
+    :param average_true_range: Array of Average True Range values.
+    :param signals: Array of signals.
+    :param sl_volatility_multiplier: Stop loss volatility multiplier.
+    :param tp_volatility_multiplier: Take profit volatility multiplier.
+    :param cash: Initial cash amount.
+    :returns: Equity curve, closed trades records and final cash.
+    """
+
+    bars = close_prices.shape[0]
+
+    # Equity is not recorded for the first bar
+    equity = np.full(bars, np.nan)
+
+    orders = np.zeros((ORDER_QUEUE_CAPACITY, 5))
+
+    account = np.zeros(5)
+    account[ACCOUNT_CASH] = cash
+
+    trade = np.zeros(7)
+
+    # Each bar can at most open one trade and reduce another
+    closed_trades = np.full((2 * bars + 1, 7), np.nan)
+
+    for bar in range(1, bars):
+        if not _advance_bar(
+            orders,
+            account,
+            closed_trades,
+            trade,
+            equity,
+            open_prices,
+            high_prices,
+            low_prices,
+            close_prices,
+            average_true_range,
+            signals,
+            sl_volatility_multiplier,
+            tp_volatility_multiplier,
+            bar,
+        ):
+            break
+
+    return (
+        equity,
+        closed_trades[: int(account[ACCOUNT_CLOSED_TRADES])],
+        account[ACCOUNT_CASH],
+    )
+
+
+def _simulate_trades_batch(
+    open_prices: np.ndarray,
+    high_prices: np.ndarray,
+    low_prices: np.ndarray,
+    close_prices: np.ndarray,
+    average_true_range: np.ndarray,
+    signals: np.ndarray,
+    sl_volatility_multipliers: np.ndarray,
+    tp_volatility_multipliers: np.ndarray,
+    cash: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Simulate trade execution for many pairs of multipliers in a single pass.
+
+    Independent account states of all pairs are advanced together bar by bar,
+    closed trades are only counted, not recorded.
+
+    :param open_prices: Array of opens.
+    :param high_prices: Array of highs.
+    :param low_prices: Array of lows.
+    :param close_prices: Array of closes.
+    :param average_true_range: Array of Average True Range values.
+    :param signals: Array of signals.
+    :param sl_volatility_multipliers: Array of stop loss volatility multipliers.
+    :param tp_volatility_multipliers: Array of take profit volatility multipliers.
+    :param cash: Initial cash amount.
+    :returns: Equity curves, numbers of closed trades and final cash of each pair.
+    """
+
+    bars = close_prices.shape[0]
+    pairs = sl_volatility_multipliers.shape[0]
+
+    # Equity is not recorded for the first bar
+    equity = np.full((pairs, bars), np.nan)
+
+    orders = np.zeros((pairs, ORDER_QUEUE_CAPACITY, 5))
+
+    accounts = np.zeros((pairs, 5))
+    accounts[:, ACCOUNT_CASH] = cash
+
+    trades = np.zeros((pairs, 7))
+
+    # No room for records, trades are only counted
+    closed_trades = np.empty((pairs, 0, 7))
+
+    # Pairs that are not out of money yet
+    is_running = np.ones(pairs, dtype=np.bool_)
+
+    for bar in range(1, bars):
+        for pair in range(pairs):
+            if not is_running[pair]:
+                continue
+
+            is_running[pair] = _advance_bar(
+                orders[pair],
+                accounts[pair],
+                closed_trades[pair],
+                trades[pair],
+                equity[pair],
+                open_prices,
+                high_prices,
+                low_prices,
+                close_prices,
+                average_true_range,
+                signals,
+                sl_volatility_multipliers[pair],
+                tp_volatility_multipliers[pair],
+                bar,
+            )
+
+    return (
+        equity,
+        accounts[:, ACCOUNT_CLOSED_TRADES].astype(np.int64),
+        accounts[:, ACCOUNT_CASH].copy(),
+    )
+
+
+# Compile the simulations if Numba is available
+_simulate_trades_kernel = _compile(_simulate_trades)
+_simulate_trades_batch_kernel = _compile(_simulate_trades_batch)
+
+
+class NativeBacktestingEngine:
+    """
+    Native Backtesting Engine class.
+
+    Simulates execution rules of Strategy Simulation Agent
+    over NumPy arrays instead of per-bar callbacks of backtesting library:
+
+    * Signals are entered with limit orders.
+    * Market orders are filled on close (trade on close).
+    * Each new entry closes the open trade (exclusive orders).
+    * Open trade is bracketed with trailing ATR stop loss and take profit.
+    * Unfilled orders are cancelled on the next bar.
+
+    Produces the same statistics as backtesting library,
+    calculated by the library itself from simulated trades and equity.
+    """
+
+    def __init__(
+        self,
+        dataframe: pd.DataFrame,
+        lot_size_cash: float,
+        sl_volatility_multiplier: float,
+        tp_volatility_multiplier: float,
+    ) -> None:
+        """
+        Construct Native Backtesting Engine.
+
+        :param dataframe: Dataframe with OHLC columns, ATR and signals.
+        :param lot_size_cash: Initial cash amount to backtest with.
+        :param sl_volatility_multiplier: Stop loss volatility multiplier.
+        :param tp_volatility_multiplier: Take profit volatility multiplier.
+        """
+
+        self._dataframe = dataframe
+        self._lot_size_cash = lot_size_cash
+        self._sl_volatility_multiplier = sl_volatility_multiplier
+        self._tp_volatility_multiplier = tp_volatility_multiplier
+
+    def run(self) -> pd.Series:
+        """
+        Run the simulation.
+
+        :returns: Series with backtesting statistics.
+        """
+
+        equity, closed_trades, cash = _simulate_trades_kernel(
+            *[
+                self._dataframe[column].to_numpy(dtype=np.float64)
+                for column in ("Open", "High", "Low", "Close", "atr", "signal")
+            ],
+            float(self._sl_volatility_multiplier),
+            float(self._tp_volatility_multiplier),
+            float(self._lot_size_cash),
+        )
+
+        # Fill equity the same way as the library does
+        equity = pd.Series(equity).bfill().fillna(cash).to_numpy()
+
+        with np.errstate(invalid="ignore"):
+            return compute_stats(
+                trades=self._to_trades_dataframe(closed_trades),
+                equity=equity,
+                ohlc_data=self._dataframe,
+                strategy_instance=None,
+                risk_free_rate=0.0,
+            )
+
+    def _to_trades_dataframe(self, closed_trades: np.ndarray) -> pd.DataFrame:
+        """
+        Convert closed trades records into trades dataframe of the library.
+
+        :param closed_trades: Closed trades records.
+        :returns: Dataframe with closed trades.
+        """
+
+        index = self._dataframe.index
+
+        # NOTE: columns are built from lists, as the library does,
+        # to produce the same column types when there are no trades
+        sizes = [int(size) for size in closed_trades[:, CLOSED_SIZE]]
+        entry_bars = [int(bar) for bar in closed_trades[:, CLOSED_ENTRY_BAR]]
+        exit_bars = [int(bar) for bar in closed_trades[:, CLOSED_EXIT_BAR]]
+        entry_prices = closed_trades[:, CLOSED_ENTRY_PRICE].tolist()
+        exit_prices = closed_trades[:, CLOSED_EXIT_PRICE].tolist()
+
+        trades_dataframe = pd.DataFrame(
+            {
+                "Size": sizes,
+                "EntryBar": entry_bars,
+                "ExitBar": exit_bars,
+                "EntryPrice": entry_prices,
+                "ExitPrice": exit_prices,
+                "SL": closed_trades[:, CLOSED_SL].tolist(),
+                "TP": closed_trades[:, CLOSED_TP].tolist(),
+                "PnL": [
+                    size * (exit_price - entry_price)
+                    for size, entry_price, exit_price in zip(
+                        sizes,
+                        entry_prices,
+                        exit_prices,
+                        strict=True,
+                    )
+                ],
+                "Commission": [0.0] * len(sizes),
+                "ReturnPct": [
+                    np.copysign(1, size) * (exit_price / entry_price - 1)
+                    for size, entry_price, exit_price in zip(
+                        sizes,
+                        entry_prices,
+                        exit_prices,
+                        strict=True,
+                    )
+                ],
+                "EntryTime": [index[bar] for bar in entry_bars],
+                "ExitTime": [index[bar] for bar in exit_bars],
+            },
+        )
+        trades_dataframe["Duration"] = (
+            trades_dataframe["ExitTime"] - trades_dataframe["EntryTime"]
+        )
+        trades_dataframe["Tag"] = [None] * len(sizes)
+
+        return trades_dataframe
+
+
+class NativeBatchBacktestingEngine:
+    """
+    Native Batch Backtesting Engine class.
+
+    Simulates execution rules of Strategy Simulation Agent
+    for many pairs of stop loss and take profit multipliers
+    in a single pass over the same prices, ATR and signals.
+
+    Produces only statistics backtesting results are ranked by,
+    calculated the same way as backtesting library does.
+    """
+
+    def __init__(
+        self,
+        dataframe: pd.DataFrame,
+        lot_size_cash: float,
+        sl_volatility_multipliers: Sequence[float],
+        tp_volatility_multipliers: Sequence[float],
+    ) -> None:
+        """
+        Construct Native Batch Backtesting Engine.
+
+        :param dataframe: Dataframe with OHLC columns, ATR and signals.
+        :param lot_size_cash: Initial cash amount to backtest with.
+        :param sl_volatility_multipliers: Stop loss volatility multipliers.
+        :param tp_volatility_multipliers: Take profit volatility multipliers.
+
+        :raises ValueError: If multipliers do not form pairs.
+        """
+
+        if len(sl_volatility_multipliers) != len(tp_volatility_multipliers):
+            raise ValueError("Each stop loss multiplier must have take profit pair.")
+
+        self._dataframe = dataframe
+        self._lot_size_cash = lot_size_cash
+        self._sl_volatility_multipliers = np.asarray(
+            sl_volatility_multipliers,
+            dtype=np.float64,
+        )
+        self._tp_volatility_multipliers = np.asarray(
+            tp_volatility_multipliers,
+            dtype=np.float64,
+        )
+
+    def run(self) -> pd.DataFrame:
+        """
+        Run the simulation for all pairs of multipliers.
+
+        :returns: Dataframe with multipliers and statistics, row for each pair.
+        """
+
+        equity, trades_count, cash = _simulate_trades_batch_kernel(
+            *[
+                self._dataframe[column].to_numpy(dtype=np.float64)
+                for column in ("Open", "High", "Low", "Close", "atr", "signal")
+            ],
+            self._sl_volatility_multipliers,
+            self._tp_volatility_multipliers,
+            float(self._lot_size_cash),
+        )
+
+        # Fill equity the same way as the library does
+        equity_dataframe = (
+            pd.DataFrame(equity.T, index=self._dataframe.index)
+            .bfill()
+            .fillna(pd.Series(cash))
+        )
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sharpe_ratios = self._calculate_sharpe_ratios(equity_dataframe)
+
+            returns = (
+                (equity_dataframe.iloc[-1] - equity_dataframe.iloc[0])
+                / equity_dataframe.iloc[0]
+                * 100
+            )
+
+        return pd.DataFrame(
+            {
+                "sl_volatility_multiplier": self._sl_volatility_multipliers,
+                "tp_volatility_multiplier": self._tp_volatility_multipliers,
+                "Sharpe Ratio": sharpe_ratios,
+                "Return [%]": returns.to_numpy(),
+                "# Trades": trades_count,
+            },
+        )
+
+    def _calculate_sharpe_ratios(self, equity_dataframe: pd.DataFrame) -> np.ndarray:
+        """
+        Calculate Sharpe Ratio of each equity curve.
+
+        Mirrors calculation of backtesting library, please see its compute_stats.
+
+        :param equity_dataframe: Dataframe with equity curve in each column.
+        :returns: Array of Sharpe Ratios.
+        """
+
+        index = equity_dataframe.index
+
+        # Ratio is not defined without dates to annualize by
+        if not isinstance(index, pd.DatetimeIndex):
+            return np.full(equity_dataframe.shape[1], np.nan)
+
+        freq_days = cast("pd.Timedelta", _data_period(index)).days
+        have_weekends = index.dayofweek.to_series().between(5, 6).mean() > 2 / 7 * 0.6
+        annual_trading_days = {7: 52, 31: 12, 365: 1}.get(
+            freq_days,
+            365 if have_weekends else 252,
+        )
+        freq = {7: "W", 31: "ME", 365: "YE"}.get(freq_days, "D")
+
+        # Resample all equity curves at once,
+        # periods without bars are empty for all of them
+        period_equity = equity_dataframe.resample(freq).last().dropna()
+
+        sharpe_ratios = np.full(equity_dataframe.shape[1], np.nan)
+
+        for pair, column in enumerate(period_equity.columns):
+            day_returns = period_equity[column].pct_change().dropna()
+            gmean_day_return = geometric_mean(day_returns)
+
+            annualized_return = (1 + gmean_day_return) ** annual_trading_days - 1
+            volatility = np.sqrt(
+                (day_returns.var(ddof=1) + (1 + gmean_day_return) ** 2)
+                ** annual_trading_days
+                - (1 + gmean_day_return) ** (2 * annual_trading_days),
+            )
+
+            # Zero volatility leaves the ratio undefined
+            sharpe_ratios[pair] = (annualized_return * 100) / (
+                volatility * 100 or np.nan
+            )
+
+        return sharpe_ratios
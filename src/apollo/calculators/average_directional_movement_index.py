@@ -1,6 +1,10 @@
+import numpy as np
 import pandas as pd
 
-from apollo.calculators.base_calculator import BaseCalculator
+from apollo.calculators import kernels
+from apollo.calculators.average_true_range import AverageTrueRangeCalculator
+from apollo.calculators.base_calculator import BaseCalculator, BatchResult
+from apollo.calculators.calculation_cache import memoize_calculation
 
 
 class AverageDirectionalMovementIndexCalculator(BaseCalculator):
@@ -21,95 +25,119 @@ class AverageDirectionalMovementIndexCalculator(BaseCalculator):
 
         super().__init__(dataframe, window_size)
 
+    @memoize_calculation(
+        inputs=("adj high", "adj low", "atr"),
+        outputs=(
+            "pdi",
+            "mdi",
+            "dx",
+            "dx_adx_ampl",
+            "prev_pdi",
+            "prev_mdi",
+            "prev_dx",
+            "prev_dx_adx_ampl",
+        ),
+    )
     def calculate_average_directional_movement_index(self) -> None:
         """Calculate rolling ADX via DX and EMA."""
 
-        # Precalculate previous low
-        self._dataframe["prev_low"] = self._dataframe["adj low"].shift(1)
-
-        # Precalculate previous high
-        self._dataframe["prev_high"] = self._dataframe["adj high"].shift(1)
-
-        # Precalculate Minus Directional Movement (MDM)
-        self._dataframe["mdm"] = (
-            self._dataframe["adj low"] - self._dataframe["prev_low"]
-        )
-
-        # Precalculate Plus Directional Movement (PDM)
-        self._dataframe["pdm"] = (
-            self._dataframe["adj high"] - self._dataframe["prev_high"]
-        )
-
-        # Now, smooth PDM and MDM
-        # with Wilder's Exponential Moving Average
-        self._dataframe["pdm"] = (
-            self._dataframe["pdm"]
-            .ewm(
-                alpha=1 / self._window_size,
-                min_periods=self._window_size,
-                adjust=False,
-            )
-            .mean()
-        )
-
-        self._dataframe["mdm"] = (
-            self._dataframe["mdm"]
-            .ewm(
-                alpha=1 / self._window_size,
-                min_periods=self._window_size,
-                adjust=False,
-            )
-            .mean()
-        )
+        adj_high = self._get_array("adj high")
+        adj_low = self._get_array("adj low")
 
         # NOTE: since all our strategies are volatility-based,
         # this calculator implicitly has access to ATR
         # which is the smoothed True Range series
-
-        # Given that we have PDM, MDM, and ATR,
-        # we can calculate Directional Movement Indicators (DMI)
-        self._dataframe["pdi"] = self._dataframe["pdm"] / self._dataframe["atr"]
-        self._dataframe["mdi"] = self._dataframe["mdm"] / self._dataframe["atr"]
-
-        # Given PDI and MDI, we can
-        # calculate True Directional Movement (DX)
-        # expressed as normalized difference between
-        # PDI and MDI subtraction and PDI and MDI addition
-        # NOTE: we normalize the result by multiplying by 100
-        self._dataframe["dx"] = 100 * (
-            abs(self._dataframe["pdi"] - self._dataframe["mdi"])
-            / (self._dataframe["pdi"] + self._dataframe["mdi"])
+        pdi, mdi, dx, dx_adx_ampl = kernels.directional_movement_index(
+            adj_high - kernels.shift(adj_high),
+            adj_low - kernels.shift(adj_low),
+            self._get_array("atr"),
+            self._window_size,
         )
 
-        # Finally, we reach ADX by smoothing DX
-        # with Wilder's Exponential Moving Average
-        self._dataframe["adx"] = (
-            self._dataframe["dx"]
-            .ewm(
-                alpha=1 / self._window_size,
-                min_periods=self._window_size,
-                adjust=False,
+        # Write directional movement columns to the dataframe
+        for column, values in self._to_columns(pdi, mdi, dx, dx_adx_ampl).items():
+            self._dataframe[column] = values
+
+    @classmethod
+    def calculate_average_directional_movement_index_batch(
+        cls,
+        dataframe: pd.DataFrame,
+        window_sizes: list[int],
+        average_true_range: np.ndarray | None = None,
+    ) -> BatchResult:
+        """
+        Calculate rolling ADX for multiple window sizes at once.
+
+        Raw directional movements do not depend on window size,
+        hence they are calculated only once and shared between windows.
+
+        :param dataframe: Dataframe to calculate ADX for, it is not modified.
+        :param window_sizes: Window sizes for rolling ADX calculation.
+        :param average_true_range: ATR array of shape (bars, window sizes),
+            calculated from the dataframe if not provided.
+        :returns: Directional movement arrays of shape (bars, window sizes)
+            keyed by the same columns as single window calculation.
+        """
+
+        # Calculate ATR for all window sizes
+        # at once unless it was provided
+        if average_true_range is None:
+            average_true_range = (
+                AverageTrueRangeCalculator.calculate_average_true_range_batch(
+                    dataframe,
+                    window_sizes,
+                )["atr"]
             )
-            .mean()
-        )
 
-        # Calculate the amplitude between DX and ADXR
-        self._dataframe["dx_adx_ampl"] = abs(self._dataframe["dx"]) - abs(
-            self._dataframe["adx"],
+        adj_high = dataframe["adj high"].to_numpy(dtype=np.float64)
+        adj_low = dataframe["adj low"].to_numpy(dtype=np.float64)
+
+        # Precalculate Plus and Minus Directional Movement (PDM, MDM)
+        # once for all window sizes
+        pdm = adj_high - kernels.shift(adj_high)
+        mdm = adj_low - kernels.shift(adj_low)
+
+        return cls._stack_window_results(
+            [
+                cls._to_columns(
+                    *kernels.directional_movement_index(
+                        pdm,
+                        mdm,
+                        average_true_range[:, i],
+                        window_size,
+                    ),
+                )
+                for i, window_size in enumerate(window_sizes)
+            ],
         )
 
-        # Shift PDI and MDI by one observation each
-        self._dataframe["prev_pdi"] = self._dataframe["pdi"].shift(1)
-        self._dataframe["prev_mdi"] = self._dataframe["mdi"].shift(1)
-
-        # Shift DX by one observation
-        self._dataframe["prev_dx"] = self._dataframe["dx"].shift(1)
+    @staticmethod
+    def _to_columns(
+        pdi: np.ndarray,
+        mdi: np.ndarray,
+        dx: np.ndarray,
+        dx_adx_ampl: np.ndarray,
+    ) -> dict[str, np.ndarray]:
+        """
+        Map directional movement to dataframe columns.
 
-        # Shift the amplitude by one observation
-        self._dataframe["prev_dx_adx_ampl"] = self._dataframe["dx_adx_ampl"].shift(1)
+        :param pdi: Array of Plus Directional Indicator values.
+        :param mdi: Array of Minus Directional Indicator values.
+        :param dx: Array of True Directional Movement values.
+        :param dx_adx_ampl: Array of DX to ADX amplitude values.
+        :returns: Directional movement keyed by column name.
+        """
 
-        # Drop unnecessary columns
-        self._dataframe.drop(
-            columns=["prev_low", "prev_high", "mdm", "pdm", "adx"],
-            inplace=True,
-        )
+        return {
+            "pdi": pdi,
+            "mdi": mdi,
+            "dx": dx,
+            "dx_adx_ampl": dx_adx_ampl,
+            # Shift PDI and MDI by one observation each
+            "prev_pdi": kernels.shift(pdi),
+            "prev_mdi": kernels.shift(mdi),
+            # Shift DX by one observation
+            "prev_dx": kernels.shift(dx),
+            # Shift the amplitude by one observation
+            "prev_dx_adx_ampl": kernels.shift(dx_adx_ampl),
+        }
@@ -1,6 +1,9 @@
+import numpy as np
 import pandas as pd
 
-from apollo.calculators.base_calculator import BaseCalculator
+from apollo.calculators import kernels
+from apollo.calculators.base_calculator import BaseCalculator, BatchResult
+from apollo.calculators.calculation_cache import memoize_calculation
 
 
 class AverageTrueRangeCalculator(BaseCalculator):
@@ -21,45 +24,68 @@ class AverageTrueRangeCalculator(BaseCalculator):
 
         super().__init__(dataframe, window_size)
 
+    @memoize_calculation(
+        inputs=("adj high", "adj low", "prev_close"),
+        outputs=("tr", "atr"),
+    )
     def calculate_average_true_range(self) -> None:
         """Calculate rolling ATR via rolling TR and EMA."""
 
         # Calculate rolling True Range
-        self._dataframe["tr"] = (
-            self._dataframe["adj close"].rolling(self._window_size).apply(self._calc_tr)
+        true_range = kernels.mask_warm_up(
+            kernels.true_range(
+                self._get_array("adj high"),
+                self._get_array("adj low"),
+                self._get_array("prev_close"),
+            ),
+            self._window_size,
         )
 
+        self._dataframe["tr"] = true_range
+
         # Calculate Average True Range using J. Welles Wilder's WMA of TR
-        self._dataframe["atr"] = (
-            self._dataframe["tr"]
-            .ewm(
-                alpha=1 / self._window_size,
-                min_periods=self._window_size,
-                adjust=False,
-            )
-            .mean()
+        self._dataframe["atr"] = kernels.wilders_moving_average(
+            true_range,
+            self._window_size,
         )
 
-    def _calc_tr(self, series: pd.Series) -> float:
+    @classmethod
+    def calculate_average_true_range_batch(
+        cls,
+        dataframe: pd.DataFrame,
+        window_sizes: list[int],
+    ) -> BatchResult:
         """
-        Calculate rolling TR for a given window.
+        Calculate rolling TR and ATR for multiple window sizes at once.
+
+        True Range does not depend on window size,
+        hence it is calculated only once and shared between windows.
 
-        :param series: Series which is used for indexing out rolling window.
-        :returns: Latest calculated entry from processed window.
+        :param dataframe: Dataframe to calculate ATR for, it is not modified.
+        :param window_sizes: Window sizes for rolling ATR calculation.
+        :returns: "tr" and "atr" arrays of shape (bars, window sizes).
         """
 
-        # Slice out a chunk of dataframe to work with
-        rolling_df = self._dataframe.loc[series.index]
+        # Calculate True Range once for all window sizes
+        true_range = kernels.true_range(
+            dataframe["adj high"].to_numpy(dtype=np.float64),
+            dataframe["adj low"].to_numpy(dtype=np.float64),
+            dataframe["prev_close"].to_numpy(dtype=np.float64),
+        )
+
+        window_results = []
 
-        # Get high, low, and previous close
-        high = rolling_df.iloc[-1]["adj high"]
-        low = rolling_df.iloc[-1]["adj low"]
-        prev_close = rolling_df.iloc[-1]["prev_close"]
+        for window_size in window_sizes:
+            window_true_range = kernels.mask_warm_up(true_range, window_size)
 
-        # Calculate True Range for each row, where TR is:
-        # max(|Ht - Lt|, |Ht - Ct-1|, |Ct-1 - Lt|)
-        # Kaufman, Trading Systems and Methods, 2020, p.850
-        true_range = [high - low, high - prev_close, prev_close - low]
+            window_results.append(
+                {
+                    "tr": window_true_range,
+                    "atr": kernels.wilders_moving_average(
+                        window_true_range,
+                        window_size,
+                    ),
+                },
+            )
 
-        # Bring to maximum absolute value and return
-        return max([abs(tr) for tr in true_range])
+        return cls._stack_window_results(window_results)
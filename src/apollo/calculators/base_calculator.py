@@ -1,5 +1,14 @@
+from collections.abc import Mapping
+
+import numpy as np
+from numpy.typing import ArrayLike
 from pandas import DataFrame
 
+# Results of calculation over multiple window sizes at once,
+# keyed by column name, where each value is a 2-D array
+# of shape (number of bars, number of window sizes)
+BatchResult = dict[str, np.ndarray]
+
 
 class BaseCalculator:
     """
@@ -18,3 +27,39 @@ class BaseCalculator:
 
         self._dataframe = dataframe
         self._window_size = window_size
+
+    def _get_array(self, column: str) -> np.ndarray:
+        """
+        Get dataframe column as array of floats to pass to kernels.
+
+        :param column: Name of the column.
+        :returns: Column values as array of floats.
+        """
+
+        return self._dataframe[column].to_numpy(dtype=np.float64)
+
+    @staticmethod
+    def _stack_window_results(
+        window_results: list[Mapping[str, ArrayLike]],
+    ) -> BatchResult:
+        """
+        Stack per window size results into bars x window sizes arrays.
+
+        :param window_results: Results keyed by column name, one per window size.
+        :returns: Stacked results keyed by column name.
+
+        :raises ValueError: If there are no results to stack.
+        """
+
+        if not window_results:
+            raise ValueError("At least one window size is required.")
+
+        return {
+            column: np.column_stack(
+                [
+                    np.asarray(window_result[column], dtype=np.float64)
+                    for window_result in window_results
+                ],
+            )
+            for column in window_results[0]
+        }
@@ -0,0 +1,279 @@
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Sequence
+from functools import wraps
+from hashlib import blake2b
+from typing import TypedDict, TypeVar
+
+import numpy as np
+
+from apollo.calculators.base_calculator import BaseCalculator, BatchResult
+from apollo.settings import CALCULATION_CACHE_MAX_BYTES
+
+CalculatorType = TypeVar("CalculatorType", bound=BaseCalculator)
+
+
+class CalculationCacheStatistics(TypedDict):
+    """Calculation cache statistics type definition."""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    bytes: int
+
+
+class CalculationCache:
+    """
+    Calculation Cache class.
+
+    In-process, least recently used
+    memoization of calculator results.
+
+    Each entry holds read-only output columns of one calculation,
+    keyed by calculator, its parameters and fingerprint of input columns.
+
+    Cache is bounded by total size of cached columns, since
+    entries hold full-length columns and their size grows with
+    the price history and the number of columns calculated.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        """
+        Construct Calculation Cache.
+
+        :param max_bytes: Maximum total size of cached columns in bytes.
+        """
+
+        self._max_bytes = max_bytes
+
+        self._entries: OrderedDict[Hashable, dict[str, np.ndarray]] = OrderedDict()
+        self._bytes = 0
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def statistics(self) -> CalculationCacheStatistics:
+        """
+        Get hit, miss and eviction counters along with current size.
+
+        :returns: Calculation cache statistics, size both in entries and bytes.
+        """
+
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "size": len(self._entries),
+            "bytes": self._bytes,
+        }
+
+    def get(self, key: Hashable) -> dict[str, np.ndarray] | None:
+        """
+        Get cached output columns and mark them as recently used.
+
+        :param key: Calculation key.
+        :returns: Read-only output columns or None if not cached.
+        """
+
+        columns = self._entries.get(key)
+
+        if columns is None:
+            self._misses += 1
+
+            return None
+
+        self._hits += 1
+        self._entries.move_to_end(key)
+
+        return columns
+
+    def put(self, key: Hashable, columns: dict[str, np.ndarray]) -> None:
+        """
+        Cache output columns, evicting the least recently used entries.
+
+        :param key: Calculation key.
+        :param columns: Output columns to cache.
+        """
+
+        size = self._get_size(columns)
+
+        # Nothing to keep if caching is disabled
+        # or columns alone would not fit
+        if size > self._max_bytes:
+            return
+
+        # Make cached columns read-only
+        # so they cannot be modified through the dataframe
+        for values in columns.values():
+            values.setflags(write=False)
+
+        if key in self._entries:
+            self._bytes -= self._get_size(self._entries[key])
+
+        self._entries[key] = columns
+        self._entries.move_to_end(key)
+        self._bytes += size
+
+        while self._bytes > self._max_bytes:
+            _, evicted_columns = self._entries.popitem(last=False)
+            self._bytes -= self._get_size(evicted_columns)
+            self._evictions += 1
+
+    def clear(self) -> None:
+        """Remove all entries and reset counters."""
+
+        self._entries.clear()
+        self._bytes = 0
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    def _get_size(columns: dict[str, np.ndarray]) -> int:
+        """
+        Get total size of the columns.
+
+        :param columns: Output columns.
+        :returns: Size of the columns in bytes.
+        """
+
+        return sum(values.nbytes for values in columns.values())
+
+
+# Process-wide calculation cache,
+# each worker process holds its own
+CALCULATION_CACHE = CalculationCache(max_bytes=CALCULATION_CACHE_MAX_BYTES)
+
+
+def fingerprint_columns(calculator: BaseCalculator, columns: tuple[str, ...]) -> str:
+    """
+    Calculate content hash of dataframe columns.
+
+    :param calculator: Calculator to read columns from.
+    :param columns: Names of the columns to hash.
+    :returns: Hex digest of the columns content.
+    """
+
+    digest = blake2b(digest_size=16)
+
+    for column in columns:
+        digest.update(column.encode())
+        digest.update(
+            np.ascontiguousarray(calculator._get_array(column)).tobytes(),  # noqa: SLF001
+        )
+
+    return digest.hexdigest()
+
+
+def get_calculation_key(
+    calculator: BaseCalculator,
+    calculate: Callable,
+    inputs: tuple[str, ...],
+    parameters: tuple[str, ...],
+) -> Hashable:
+    """
+    Get key of the calculation in the calculation cache.
+
+    :param calculator: Calculator to run the calculation.
+    :param calculate: Calculation method.
+    :param inputs: Columns the calculation reads from the dataframe.
+    :param parameters: Calculator attributes the calculation depends on.
+    :returns: Calculation key.
+    """
+
+    return (
+        type(calculator).__qualname__,
+        calculate.__name__,
+        tuple(getattr(calculator, parameter) for parameter in parameters),
+        fingerprint_columns(calculator, inputs),
+    )
+
+
+def memoize_calculation(
+    inputs: tuple[str, ...],
+    outputs: tuple[str, ...],
+    parameters: tuple[str, ...] = ("_window_size",),
+) -> Callable[[Callable[[CalculatorType], None]], Callable[[CalculatorType], None]]:
+    """
+    Memoize calculation method of calculator in process-wide calculation cache.
+
+    Calculation is skipped if the same calculator was already
+    run with the same parameters over the same input columns,
+    in such case, cached output columns are written to the dataframe.
+
+    :param inputs: Columns the calculation reads from the dataframe.
+    :param outputs: Columns the calculation writes to the dataframe.
+    :param parameters: Calculator attributes the calculation depends on.
+    :returns: Decorator of calculation method.
+    """
+
+    def decorator(
+        calculate: Callable[[CalculatorType], None],
+    ) -> Callable[[CalculatorType], None]:
+        @wraps(calculate)
+        def wrapper(calculator: CalculatorType) -> None:
+            key = get_calculation_key(calculator, calculate, inputs, parameters)
+
+            dataframe = calculator._dataframe  # noqa: SLF001
+
+            cached_columns = CALCULATION_CACHE.get(key)
+
+            # Write copies of cached columns
+            # to keep the cache intact
+            if cached_columns is not None:
+                for column, values in cached_columns.items():
+                    dataframe[column] = values.copy()
+
+                return
+
+            calculate(calculator)
+
+            CALCULATION_CACHE.put(
+                key,
+                {column: dataframe[column].to_numpy(copy=True) for column in outputs},
+            )
+
+        # Expose the cache signature,
+        # so that results can be cached upfront
+        wrapper.inputs = inputs
+        wrapper.outputs = outputs
+        wrapper.parameters = parameters
+
+        return wrapper
+
+    return decorator
+
+
+def cache_batch_calculation(
+    calculate: Callable,
+    calculators: Sequence[BaseCalculator],
+    batch_result: BatchResult,
+) -> None:
+    """
+    Cache results of batch calculation as results of memoized calculations.
+
+    Each column of batch results is cached as if memoized calculation
+    was run by the corresponding calculator, so that running it later
+    writes cached output columns instead of calculating them again.
+
+    :param calculate: Memoized calculation method.
+    :param calculators: Calculators over input columns, one per window size.
+    :param batch_result: Results of batch calculation over the same window sizes.
+    """
+
+    for position, calculator in enumerate(calculators):
+        CALCULATION_CACHE.put(
+            get_calculation_key(
+                calculator,
+                calculate,
+                calculate.inputs,
+                calculate.parameters,
+            ),
+            {
+                column: batch_result[column][:, position].copy()
+                for column in calculate.outputs
+            },
+        )
@@ -1,7 +1,8 @@
-import numpy as np
 import pandas as pd
 
+from apollo.calculators import kernels
 from apollo.calculators.base_calculator import BaseCalculator
+from apollo.calculators.calculation_cache import memoize_calculation
 
 
 class ChaikinAccumulationDistributionCalculator(BaseCalculator):
@@ -39,52 +40,24 @@ class ChaikinAccumulationDistributionCalculator(BaseCalculator):
 
         super().__init__(dataframe, window_size)
 
-        self._accumulation_distribution_line: list[float] = []
-
+    @memoize_calculation(
+        inputs=("adj high", "adj low", "adj close", "adj volume"),
+        outputs=("adl", "prev_adl"),
+    )
     def calculate_chaikin_accumulation_distribution_line(self) -> None:
         """Calculate Chaikin Accumulation Distribution Line."""
 
-        # Fill AD line array with N NaN, where N = window size
-        self._accumulation_distribution_line = (
-            np.full((1, self._window_size - 1), np.nan).flatten().tolist()
-        )
-
         # Calculate rolling AD line
-        self._dataframe["adj close"].rolling(self._window_size).apply(self._calc_adl)
+        accumulation_distribution_line = kernels.accumulation_distribution_line(
+            self._get_array("adj high"),
+            self._get_array("adj low"),
+            self._get_array("adj close"),
+            self._get_array("adj volume"),
+            self._window_size,
+        )
 
         # Preserve AD line on the dataframe
-        self._dataframe["adl"] = self._accumulation_distribution_line
+        self._dataframe["adl"] = accumulation_distribution_line
 
         # Preserve previous AD line on the dataframe
-        self._dataframe["prev_adl"] = self._dataframe["adl"].shift(1)
-
-    def _calc_adl(self, series: pd.Series) -> float:
-        """
-        Calculate rolling Chaikin Accumulation Distribution.
-
-        :param series: Series which is used for indexing out rolling window.
-        :returns: Dummy float to satisfy Pandas' return value.
-        """
-
-        # Slice out a chunk of dataframe to work with
-        rolling_df = self._dataframe.loc[series.index]
-
-        # Calculate money flow multiplier
-        money_flow_multiplier = (
-            (rolling_df["adj close"] - rolling_df["adj low"])
-            - (rolling_df["adj high"] - rolling_df["adj close"])
-        ) / (rolling_df["adj high"] - rolling_df["adj low"])
-
-        # Calculate money flow volume
-        money_flow_volume = money_flow_multiplier * rolling_df["adj volume"]
-
-        # Calculate AD value
-        accumulation_distribution = money_flow_volume.cumsum()
-
-        # Append last value to the AD line array
-        self._accumulation_distribution_line.append(
-            accumulation_distribution.iloc[-1],
-        )
-
-        # Return dummy float
-        return 0.0
+        self._dataframe["prev_adl"] = kernels.shift(accumulation_distribution_line)
@@ -1,6 +1,9 @@
+import numpy as np
 import pandas as pd
 
-from apollo.calculators.base_calculator import BaseCalculator
+from apollo.calculators import kernels
+from apollo.calculators.base_calculator import BaseCalculator, BatchResult
+from apollo.calculators.calculation_cache import memoize_calculation
 
 
 class DistributionMomentsCalculator(BaseCalculator):
@@ -21,25 +24,71 @@ class DistributionMomentsCalculator(BaseCalculator):
 
         super().__init__(dataframe, window_size)
 
+    @memoize_calculation(
+        inputs=("adj close",),
+        outputs=("avg", "std", "skew", "kurt", "z_score"),
+    )
     def calculate_distribution_moments(self) -> None:
         """Calculate rolling distribution moments."""
 
-        # Get rolling window object to calculate distribution moments
-        rolling_window = self._dataframe["adj close"].rolling(window=self._window_size)
+        # Write moments to the dataframe
+        for column, moment in self._to_columns(
+            *kernels.distribution_moments(
+                self._get_array("adj close"),
+                self._window_size,
+            ),
+        ).items():
+            self._dataframe[column] = moment
 
-        # Calculate rolling average
-        self._dataframe["avg"] = rolling_window.mean()
+    @classmethod
+    def calculate_distribution_moments_batch(
+        cls,
+        dataframe: pd.DataFrame,
+        window_sizes: list[int],
+    ) -> BatchResult:
+        """
+        Calculate rolling distribution moments for multiple window sizes at once.
+
+        :param dataframe: Dataframe to calculate moments for, it is not modified.
+        :param window_sizes: Window sizes for rolling moments calculation.
+        :returns: "avg", "std", "skew", "kurt" and "z_score"
+            arrays of shape (bars, window sizes).
+        """
 
-        # Calculate rolling standard deviation
-        self._dataframe["std"] = rolling_window.std()
+        adj_close = dataframe["adj close"].to_numpy(dtype=np.float64)
 
-        # Calculate rolling skewness
-        self._dataframe["skew"] = rolling_window.skew()
+        return cls._stack_window_results(
+            [
+                cls._to_columns(
+                    *kernels.distribution_moments(adj_close, window_size),
+                )
+                for window_size in window_sizes
+            ],
+        )
 
-        # Calculate rolling kurtosis
-        self._dataframe["kurt"] = rolling_window.kurt()
+    @staticmethod
+    def _to_columns(
+        avg: np.ndarray,
+        std: np.ndarray,
+        skew: np.ndarray,
+        kurt: np.ndarray,
+        z_score: np.ndarray,
+    ) -> dict[str, np.ndarray]:
+        """
+        Map distribution moments to dataframe columns.
+
+        :param avg: Array of rolling averages.
+        :param std: Array of rolling standard deviations.
+        :param skew: Array of rolling skewness values.
+        :param kurt: Array of rolling kurtosis values.
+        :param z_score: Array of rolling z-scores.
+        :returns: Distribution moments keyed by column name.
+        """
 
-        # Calculate rolling z-score from mean and standard deviation
-        self._dataframe["z_score"] = (
-            self._dataframe["adj close"] - self._dataframe["avg"]
-        ) / self._dataframe["std"]
+        return {
+            "avg": avg,
+            "std": std,
+            "skew": skew,
+            "kurt": kurt,
+            "z_score": z_score,
+        }
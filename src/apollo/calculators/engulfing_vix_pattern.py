@@ -1,6 +1,8 @@
 import pandas as pd
 
+from apollo.calculators import kernels
 from apollo.calculators.base_calculator import BaseCalculator
+from apollo.calculators.calculation_cache import memoize_calculation
 from apollo.settings import MISSING_DATA_PLACEHOLDER
 
 
@@ -38,6 +40,11 @@ class EngulfingVIXPatternCalculator(BaseCalculator):
 
         super().__init__(dataframe, window_size)
 
+    @memoize_calculation(
+        inputs=("vix open", "vix close"),
+        outputs=("vix_ep",),
+        parameters=(),
+    )
     def calculate_engulfing_vix_pattern(self) -> None:
         """Calculate Engulfing VIX Pattern."""
 
@@ -48,57 +55,11 @@ class EngulfingVIXPatternCalculator(BaseCalculator):
         # otherwise, the strategy using the results will drop missing rows
 
         # Mark engulfing pattern to the dataframe
-        self._dataframe["vix_ep"] = self.NO_PATTERN
-
-        # Initialize necessary columns with 0
-        self._dataframe["vix_prev_open"] = 0.0
-        self._dataframe["vix_prev_close"] = 0.0
-
-        # Shift open and close prices only if the data is present
-        self._dataframe.loc[
-            self._dataframe["vix open"] != MISSING_DATA_PLACEHOLDER,
-            "vix_prev_open",
-        ] = self._dataframe["vix open"].shift(1)
-
-        self._dataframe.loc[
-            self._dataframe["vix close"] != MISSING_DATA_PLACEHOLDER,
-            "vix_prev_close",
-        ] = self._dataframe["vix close"].shift(1)
-
-        # Calculate bullish engulfing
-        self._dataframe.loc[
-            (
-                # Open at T is below the close at T-1
-                # Candle opened below the close of the previous candle
-                (self._dataframe["vix open"] < self._dataframe["vix_prev_open"])
-                # Close at T is above the open at T-1
-                # Candle closed above the open of the previous candle
-                & (self._dataframe["vix close"] > self._dataframe["vix_prev_close"])
-                # Close at T is above the open at T
-                # Candle closed in positive territory
-                & (self._dataframe["vix close"] > self._dataframe["vix open"])
-            ),
-            "vix_ep",
-        ] = self.BULLISH_ENGULFING
-
-        # Calculate bearish engulfing
-        self._dataframe.loc[
-            (
-                # Open at T is above the close at T-1
-                # Candle opened above the close of the previous candle
-                (self._dataframe["vix open"] > self._dataframe["vix_prev_open"])
-                # Close at T is below the open at T-1
-                # Candle closed below the open of the previous candle
-                & (self._dataframe["vix close"] < self._dataframe["vix_prev_close"])
-                # Close at T is below the open at T
-                # Candle closed in negative territory
-                & (self._dataframe["vix close"] < self._dataframe["vix open"])
-            ),
-            "vix_ep",
-        ] = self.BEARISH_ENGULFING
-
-        # Drop unnecessary columns
-        self._dataframe.drop(
-            columns=["vix_prev_open", "vix_prev_close"],
-            inplace=True,
+        self._dataframe["vix_ep"] = kernels.engulfing_pattern(
+            self._get_array("vix open"),
+            self._get_array("vix close"),
+            MISSING_DATA_PLACEHOLDER,
+            self.NO_PATTERN,
+            self.BULLISH_ENGULFING,
+            self.BEARISH_ENGULFING,
         )
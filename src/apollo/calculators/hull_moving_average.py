@@ -1,7 +1,9 @@
 import numpy as np
 import pandas as pd
 
-from apollo.calculators.base_calculator import BaseCalculator
+from apollo.calculators import kernels
+from apollo.calculators.base_calculator import BaseCalculator, BatchResult
+from apollo.calculators.calculation_cache import memoize_calculation
 
 
 class HullMovingAverageCalculator(BaseCalculator):
@@ -27,66 +29,50 @@ class HullMovingAverageCalculator(BaseCalculator):
 
         super().__init__(dataframe, window_size)
 
+    @memoize_calculation(
+        inputs=("adj close",),
+        outputs=("hma",),
+    )
     def calculate_hull_moving_average(self) -> None:
         """Calculate Hull Moving Average."""
 
-        # Calculate weighed moving average of
-        # the close using provided window size
-        standard_window_wma = self._calculate_weighted_moving_average(
-            self._dataframe["adj close"],
+        # Write to the dataframe
+        self._dataframe["hma"] = kernels.hull_moving_average(
+            self._get_array("adj close"),
             self._window_size,
         )
 
-        # Define a half window size
-        # rounded down to the nearest integer
-        half_window = self._window_size // 2
-
-        # Calculate shorter weighed moving average
-        # using half window size
-        half_window_wma = self._calculate_weighted_moving_average(
-            self._dataframe["adj close"],
-            half_window,
-        )
-
-        # Calculate the difference between standard weighted moving average
-        # and the shorter weighted moving average multiplied by 2
-        # to emphasize shorter-term price movements
-        wma_difference = 2 * half_window_wma - standard_window_wma
-
-        # Take a square root of the window size
-        # to make the Hull Moving Average even more responsive
-        sqrt_window = int(np.sqrt(self._window_size))
-
-        # Finally, calculate Hull Moving Average
-        # over the difference using square root of the window size
-        hull_moving_average = self._calculate_weighted_moving_average(
-            wma_difference,
-            sqrt_window,
-        )
-
-        # Write to the dataframe
-        self._dataframe["hma"] = hull_moving_average
-
-    def _calculate_weighted_moving_average(
-        self,
-        series: pd.Series,
-        window_size: int,
-    ) -> pd.Series:
+    @classmethod
+    def calculate_hull_moving_average_batch(
+        cls,
+        dataframe: pd.DataFrame,
+        window_sizes: list[int],
+    ) -> BatchResult:
         """
-        Calculate Weighted Moving Average.
+        Calculate Hull Moving Average for multiple window sizes at once.
 
-        :param series: Series to calculate WMA for.
-        :param window_size: Window size for WMA calculation.
-        :returns: Weighted moving average series.
-        """
+        Weighted moving averages of the close are shared between windows,
+        e.g. half window WMA of window size 10 is standard WMA of window size 5.
 
-        # First, calculate range of equal weights (1, 2, ..., N)
-        weights = np.arange(1, window_size + 1)
+        :param dataframe: Dataframe to calculate HMA for, it is not modified.
+        :param window_sizes: Window sizes for HMA calculation.
+        :returns: "hma" array of shape (bars, window sizes).
+        """
 
-        # Then, calculate and return weighted moving average
-        # by summing up the product of weights and series
-        # and dividing it by sum of weights
-        return series.rolling(window=window_size).apply(
-            lambda x: np.sum(x * weights) / np.sum(weights),
-            raw=True,
+        adj_close = dataframe["adj close"].to_numpy(dtype=np.float64)
+
+        # Weighted moving averages of the close keyed by their window size
+        close_wma_cache: dict[int, np.ndarray] = {}
+
+        return cls._stack_window_results(
+            [
+                {
+                    "hma": kernels.hull_moving_average(
+                        adj_close,
+                        window_size,
+                        close_wma_cache,
+                    ),
+                }
+                for window_size in window_sizes
+            ],
         )
@@ -1,6 +1,9 @@
+import numpy as np
 import pandas as pd
 
-from apollo.calculators.base_calculator import BaseCalculator
+from apollo.calculators import kernels
+from apollo.calculators.base_calculator import BaseCalculator, BatchResult
+from apollo.calculators.calculation_cache import memoize_calculation
 
 
 class KaufmanEfficiencyRatioCalculator(BaseCalculator):
@@ -20,26 +23,53 @@ class KaufmanEfficiencyRatioCalculator(BaseCalculator):
 
         super().__init__(dataframe, window_size)
 
+    @memoize_calculation(
+        inputs=("adj close",),
+        outputs=("ker",),
+    )
     def calculate_kaufman_efficiency_ratio(self) -> None:
         """Calculate rolling Kaufman Efficiency Ratio."""
 
-        # Shift adjusted close observations by one window size
-        close_one_window_back = self._dataframe["adj close"].shift(
+        adj_close = self._get_array("adj close")
+
+        # Calculate Kaufman Efficiency Ratio
+        self._dataframe["ker"] = kernels.kaufman_efficiency_ratio(
+            adj_close,
+            np.abs(adj_close - kernels.shift(adj_close)),
             self._window_size,
         )
 
-        # Calculate absolute price difference
-        # between current and previous window observations
-        abs_price_differ = (self._dataframe["adj close"] - close_one_window_back).abs()
+    @classmethod
+    def calculate_kaufman_efficiency_ratio_batch(
+        cls,
+        dataframe: pd.DataFrame,
+        window_sizes: list[int],
+    ) -> BatchResult:
+        """
+        Calculate rolling Kaufman Efficiency Ratio for multiple window sizes at once.
+
+        Absolute price change does not depend on window size,
+        hence it is calculated only once and shared between windows.
 
-        # Calculate absolute price change
-        abs_price_change = self._dataframe["adj close"].diff().abs()
+        :param dataframe: Dataframe to calculate KER for, it is not modified.
+        :param window_sizes: Window sizes for rolling KER calculation.
+        :returns: "ker" array of shape (bars, window sizes).
+        """
 
-        # Sum absolute price changes over the window
-        abs_price_change_sum = abs_price_change.rolling(
-            window=self._window_size,
-            min_periods=self._window_size,
-        ).sum()
+        adj_close = dataframe["adj close"].to_numpy(dtype=np.float64)
 
-        # Calculate Kaufman Efficiency Ratio
-        self._dataframe["ker"] = abs_price_differ / abs_price_change_sum
+        # Calculate absolute price change once for all window sizes
+        abs_price_change = np.abs(adj_close - kernels.shift(adj_close))
+
+        return cls._stack_window_results(
+            [
+                {
+                    "ker": kernels.kaufman_efficiency_ratio(
+                        adj_close,
+                        abs_price_change,
+                        window_size,
+                    ),
+                }
+                for window_size in window_sizes
+            ],
+        )
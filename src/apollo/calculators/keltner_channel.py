@@ -1,7 +1,8 @@
-import numpy as np
 import pandas as pd
 
+from apollo.calculators import kernels
 from apollo.calculators.base_calculator import BaseCalculator
+from apollo.calculators.calculation_cache import memoize_calculation
 
 
 class KeltnerChannelCalculator(BaseCalculator):
@@ -40,41 +41,22 @@ class KeltnerChannelCalculator(BaseCalculator):
 
         self._volatility_multiplier = volatility_multiplier
 
-        self._lkc_bound: list[float] = []
-        self._ukc_bound: list[float] = []
-
+    @memoize_calculation(
+        inputs=("hma", "atr"),
+        outputs=("lkc_bound", "ukc_bound"),
+        parameters=("_window_size", "_volatility_multiplier"),
+    )
     def calculate_keltner_channel(self) -> None:
         """Calculate Keltner Channel."""
 
-        # Fill bounds arrays with N NaN, where N = window size
-        self._lkc_bound = np.full((1, self._window_size - 1), np.nan).flatten().tolist()
-        self._ukc_bound = np.full((1, self._window_size - 1), np.nan).flatten().tolist()
-
-        # Calculate bounds by using SMA and ATR
-        self._dataframe["adj close"].rolling(self._window_size).apply(self._calc_chan)
+        # Calculate bounds by using HMA and ATR
+        lkc_bound, ukc_bound = kernels.keltner_channel(
+            self._get_array("hma"),
+            self._get_array("atr"),
+            self._window_size,
+            self._volatility_multiplier,
+        )
 
         # Preserve bounds on the dataframe
-        self._dataframe["lkc_bound"] = self._lkc_bound
-        self._dataframe["ukc_bound"] = self._ukc_bound
-
-    def _calc_chan(self, series: pd.Series) -> float:
-        """
-        Calculate rolling Keltner Channel.
-
-        :param series: Series which is used for indexing out rolling window.
-        :returns: Dummy float to satisfy Pandas' return value.
-        """
-
-        # Slice out a chunk of dataframe to work with
-        rolling_df = self._dataframe.loc[series.index]
-
-        # Calculate lower and upper channel bounds
-        # expressed as +/- ATR * multiplier from the moving average
-        lkc_bound = rolling_df["hma"] - rolling_df["atr"] * self._volatility_multiplier
-        ukc_bound = rolling_df["hma"] + rolling_df["atr"] * self._volatility_multiplier
-
-        self._lkc_bound.append(lkc_bound.iloc[-1])
-        self._ukc_bound.append(ukc_bound.iloc[-1])
-
-        # Return dummy float
-        return 0.0
+        self._dataframe["lkc_bound"] = lkc_bound
+        self._dataframe["ukc_bound"] = ukc_bound
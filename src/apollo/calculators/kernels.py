@@ -0,0 +1,1300 @@
+import numpy as np
+import pandas as pd
+
+# NOTE: kernels are side-effect-free functions,
+# they take NumPy arrays and return new arrays,
+# calculators are thin adapters that read kernel inputs
+# from the dataframe and write kernel outputs back to it
+
+# NOTE: Numba is an optional dependency,
+# if available, sequential kernels are compiled,
+# otherwise, they run as pure Python loops
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover
+    njit = None
+
+
+def shift(values: np.ndarray, periods: int = 1) -> np.ndarray:
+    """
+    Shift values forward by number of periods.
+
+    :param values: Array of values to shift.
+    :param periods: Number of periods to shift by.
+    :returns: Shifted array with leading values missing.
+    """
+
+    shifted = np.full(values.shape[0], np.nan)
+
+    if periods < values.shape[0]:
+        shifted[periods:] = values[: values.shape[0] - periods]
+
+    return shifted
+
+
+def mask_warm_up(values: np.ndarray, window_size: int) -> np.ndarray:
+    """
+    Apply rolling window warm-up to values.
+
+    :param values: Array of values.
+    :param window_size: Window size for rolling calculation.
+    :returns: Copy of values with first N - 1 values missing, where N = window size.
+    """
+
+    # Rolling window produces no values
+    # until N observations are available
+    masked = values.astype(np.float64)
+    masked[: window_size - 1] = np.nan
+
+    return masked
+
+
+def where_present(
+    source: np.ndarray,
+    values: np.ndarray,
+    missing_data_placeholder: float,
+) -> np.ndarray:
+    """
+    Keep values only where the source data is present.
+
+    Since some strategies work with multiple data sources,
+    there is no guarantee that the data is present for all the rows.
+
+    :param source: Array of source data with missing data placeholders.
+    :param values: Array of values calculated from the source data.
+    :param missing_data_placeholder: Placeholder of missing source data.
+    :returns: Values where source data is present, zeros otherwise.
+    """
+
+    return np.where(source != missing_data_placeholder, values, 0.0)
+
+
+def percentage_change(values: np.ndarray) -> np.ndarray:
+    """
+    Calculate percentage change between consecutive values.
+
+    NOTE: missing values are forward filled before calculation.
+
+    :param values: Array of values.
+    :returns: Array of percentage changes with the first value missing.
+    """
+
+    # Forward fill missing values
+    present_index = np.where(np.isnan(values), 0, np.arange(values.shape[0]))
+    filled = values[np.maximum.accumulate(present_index)] if values.size else values
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return filled / shift(filled) - 1
+
+
+def wilders_moving_average(values: np.ndarray, window_size: int) -> np.ndarray:
+    """
+    Calculate J. Welles Wilder's moving average.
+
+    :param values: Array of values to smooth.
+    :param window_size: Window size for the moving average.
+    :returns: Array of smoothed values.
+    """
+
+    return (
+        pd.Series(values)
+        .ewm(
+            alpha=1 / window_size,
+            min_periods=window_size,
+            adjust=False,
+        )
+        .mean()
+        .to_numpy()
+    )
+
+
+def true_range(
+    high: np.ndarray,
+    low: np.ndarray,
+    prev_close: np.ndarray,
+) -> np.ndarray:
+    """
+    Calculate True Range over the whole series at once.
+
+    :param high: Array of adjusted highs.
+    :param low: Array of adjusted lows.
+    :param prev_close: Array of previous adjusted closes.
+    :returns: Array of True Range values without rolling window warm-up.
+    """
+
+    # Calculate True Range for each row, where TR is:
+    # max(|Ht - Lt|, |Ht - Ct-1|, |Ct-1 - Lt|)
+    # Kaufman, Trading Systems and Methods, 2020, p.850
+    #
+    # NOTE: we use fmax to skip missing previous
+    # close, which mirrors Python's max() over NaN
+    return np.fmax(
+        np.fmax(np.abs(high - low), np.abs(high - prev_close)),
+        np.abs(prev_close - low),
+    )
+
+
+def directional_movement_index(
+    pdm: np.ndarray,
+    mdm: np.ndarray,
+    atr: np.ndarray,
+    window_size: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Calculate Directional Movement Indicators and DX to ADX amplitude.
+
+    :param pdm: Array of raw Plus Directional Movement (Ht - Ht-1).
+    :param mdm: Array of raw Minus Directional Movement (Lt - Lt-1).
+    :param atr: Array of ATR values calculated with the same window size.
+    :param window_size: Window size for rolling ADX calculation.
+    :returns: Arrays of PDI, MDI, DX and DX to ADX amplitude.
+    """
+
+    # Smooth PDM and MDM
+    # with Wilder's Exponential Moving Average
+    smoothed_pdm = wilders_moving_average(pdm, window_size)
+    smoothed_mdm = wilders_moving_average(mdm, window_size)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Given that we have PDM, MDM, and ATR,
+        # we can calculate Directional Movement Indicators (DMI)
+        pdi = smoothed_pdm / atr
+        mdi = smoothed_mdm / atr
+
+        # Given PDI and MDI, we can
+        # calculate True Directional Movement (DX)
+        # expressed as normalized difference between
+        # PDI and MDI subtraction and PDI and MDI addition
+        # NOTE: we normalize the result by multiplying by 100
+        dx = 100 * (np.abs(pdi - mdi) / (pdi + mdi))
+
+    # Finally, we reach ADX by smoothing DX
+    # with Wilder's Exponential Moving Average
+    adx = wilders_moving_average(dx, window_size)
+
+    # Calculate the amplitude between DX and ADX
+    dx_adx_ampl = np.abs(dx) - np.abs(adx)
+
+    return pdi, mdi, dx, dx_adx_ampl
+
+
+def kaufman_efficiency_ratio(
+    close: np.ndarray,
+    abs_price_change: np.ndarray,
+    window_size: int,
+) -> np.ndarray:
+    """
+    Calculate rolling Kaufman Efficiency Ratio.
+
+    :param close: Array of adjusted closes.
+    :param abs_price_change: Array of absolute close to close changes.
+    :param window_size: Window size for rolling KER calculation.
+    :returns: Array of KER values.
+    """
+
+    # Calculate absolute price difference
+    # between current and previous window observations
+    abs_price_differ = np.abs(close - shift(close, window_size))
+
+    # Sum absolute price changes over the window
+    abs_price_change_sum = (
+        pd.Series(abs_price_change)
+        .rolling(
+            window=window_size,
+            min_periods=window_size,
+        )
+        .sum()
+        .to_numpy()
+    )
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return abs_price_differ / abs_price_change_sum
+
+
+def distribution_moments(
+    close: np.ndarray,
+    window_size: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Calculate rolling distribution moments.
+
+    :param close: Array of adjusted closes.
+    :param window_size: Window size for rolling moments calculation.
+    :returns: Arrays of mean, standard deviation, skewness, kurtosis and z-score.
+    """
+
+    # Get rolling window object to calculate distribution moments
+    rolling_window = pd.Series(close).rolling(window=window_size)
+
+    # Calculate rolling average and standard deviation
+    avg = rolling_window.mean().to_numpy()
+    std = rolling_window.std().to_numpy()
+
+    # Calculate rolling z-score from mean and standard deviation
+    with np.errstate(divide="ignore", invalid="ignore"):
+        z_score = (close - avg) / std
+
+    return (
+        avg,
+        std,
+        rolling_window.skew().to_numpy(),
+        rolling_window.kurt().to_numpy(),
+        z_score,
+    )
+
+
+def weighted_moving_average(values: np.ndarray, window_size: int) -> np.ndarray:
+    """
+    Calculate Weighted Moving Average.
+
+    :param values: Array of values to calculate WMA for.
+    :param window_size: Window size for WMA calculation.
+    :returns: Array of weighted moving average values.
+    """
+
+    # First, calculate range of equal weights (1, 2, ..., N)
+    weights = np.arange(1, window_size + 1)
+
+    weighted_moving_average = np.full(values.shape[0], np.nan)
+
+    # Nothing to average
+    # if window is never filled
+    if window_size < 1 or values.shape[0] < window_size:
+        return weighted_moving_average
+
+    # Then, calculate weighted moving average
+    # by summing up the product of weights and each window
+    # and dividing it by sum of weights
+    rolling_values = np.lib.stride_tricks.sliding_window_view(values, window_size)
+
+    weighted_moving_average[window_size - 1 :] = np.sum(
+        rolling_values * weights,
+        axis=1,
+    ) / np.sum(weights)
+
+    return weighted_moving_average
+
+
+def hull_moving_average(
+    close: np.ndarray,
+    window_size: int,
+    close_wma_cache: dict[int, np.ndarray] | None = None,
+) -> np.ndarray:
+    """
+    Calculate Hull Moving Average.
+
+    :param close: Array of adjusted closes.
+    :param window_size: Window size for HMA calculation.
+    :param close_wma_cache: Weighted moving averages of the close
+        keyed by their window size, populated on the fly.
+    :returns: Array of Hull Moving Average values.
+    """
+
+    if close_wma_cache is None:
+        close_wma_cache = {}
+
+    # Define a half window size
+    # rounded down to the nearest integer
+    half_window = window_size // 2
+
+    # Calculate weighed moving average of the close
+    # using provided window size and half window size
+    # unless they were already calculated
+    for wma_window in (window_size, half_window):
+        if wma_window not in close_wma_cache:
+            close_wma_cache[wma_window] = weighted_moving_average(close, wma_window)
+
+    # Calculate the difference between standard weighted moving average
+    # and the shorter weighted moving average multiplied by 2
+    # to emphasize shorter-term price movements
+    wma_difference = 2 * close_wma_cache[half_window] - close_wma_cache[window_size]
+
+    # Take a square root of the window size
+    # to make the Hull Moving Average even more responsive
+    sqrt_window = int(np.sqrt(window_size))
+
+    # Finally, calculate Hull Moving Average
+    # over the difference using square root of the window size
+    return weighted_moving_average(wma_difference, sqrt_window)
+
+
+def keltner_channel(
+    hma: np.ndarray,
+    atr: np.ndarray,
+    window_size: int,
+    volatility_multiplier: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate Keltner Channel bounds.
+
+    :param hma: Array of Hull Moving Average values.
+    :param atr: Array of ATR values.
+    :param window_size: Window size for rolling Keltner Channel calculation.
+    :param volatility_multiplier: ATR multiplier for channel bounds.
+    :returns: Arrays of lower and upper channel bounds.
+    """
+
+    # Calculate lower and upper channel bounds
+    # expressed as +/- ATR * multiplier from the moving average
+    lkc_bound = hma - atr * volatility_multiplier
+    ukc_bound = hma + atr * volatility_multiplier
+
+    return mask_warm_up(lkc_bound, window_size), mask_warm_up(ukc_bound, window_size)
+
+
+def linear_regression(
+    close: np.ndarray,
+    window_size: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate rolling ordinary least squares regression over the whole series.
+
+    Slope and line of best fit are derived from rolling sums:
+
+    slope = Sxy / Sxx
+    lbf = Sy / N + slope * (x_t - x_mean)
+
+    Where x is the position of observation within the window.
+
+    NOTE: we center x around its mean within the window, in such,
+    Sx = 0 and Sxx = N * (N^2 - 1) / 12 are constants, and Sxy is
+    invariant to the level of prices, which avoids catastrophic
+    cancellation of the textbook Sxy - Sx * Sy / N form on long histories.
+
+    :param close: Array of adjusted closes.
+    :param window_size: Window size for rolling regression.
+    :returns: Arrays of slopes and the last points of line of best fit.
+    """
+
+    # Center window positions around their mean
+    x_centered = np.arange(window_size) - (window_size - 1) / 2
+
+    # Precalculate sum of squared x
+    sum_xx = window_size * (window_size**2 - 1) / 12
+
+    # Calculate rolling sum of y
+    sum_y = (
+        pd.Series(close)
+        .rolling(
+            window=window_size,
+            min_periods=window_size,
+        )
+        .sum()
+        .to_numpy()
+    )
+
+    # Calculate rolling sum of x * y
+    # as a single pass of x weights over y
+    sum_xy = np.full(close.shape[0], np.nan)
+
+    if close.shape[0] >= window_size:
+        sum_xy[window_size - 1 :] = np.convolve(
+            close,
+            x_centered[::-1],
+            mode="valid",
+        )
+
+    # Calculate slope
+    slope = sum_xy / sum_xx
+
+    # Calculate the last point of line of best fit,
+    # where the last observation is half window away from the mean
+    lbf = sum_y / window_size + slope * x_centered[-1]
+
+    return slope, lbf
+
+
+def linear_regression_channel(
+    close: np.ndarray,
+    window_size: int,
+    channel_sd_spread: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Calculate rolling linear regression channel.
+
+    :param close: Array of adjusted closes.
+    :param window_size: Window size for rolling channel calculation.
+    :param channel_sd_spread: Standard deviation spread for channel bounds.
+    :returns: Arrays of slopes, lower and upper channel bounds.
+    """
+
+    # Calculate slopes and the last points of line of best fit
+    slope, lbf = linear_regression(close, window_size)
+
+    # Calculate rolling (population) standard deviation
+    std = (
+        pd.Series(close)
+        .rolling(
+            window=window_size,
+            min_periods=window_size,
+        )
+        .std(ddof=0)
+        .to_numpy()
+    )
+
+    # Calculate lower and upper bounds
+    # as N standard deviations above/below LBF
+    return (
+        slope,
+        lbf - std * channel_sd_spread,
+        lbf + std * channel_sd_spread,
+    )
+
+
+def accumulation_distribution_line(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    volume: np.ndarray,
+    window_size: int,
+) -> np.ndarray:
+    """
+    Calculate rolling Chaikin Accumulation Distribution over the whole series.
+
+    AD value of each window is the rolling sum of Money Flow Volume.
+
+    NOTE: Money Flow Multiplier of zero-range bars (high == low) is NaN
+    or infinite. Missing Money Flow Volume values are skipped
+    during summation, unless it is the last value of the window,
+    in which case AD value is missing as well.
+
+    :param high: Array of adjusted highs.
+    :param low: Array of adjusted lows.
+    :param close: Array of adjusted closes.
+    :param volume: Array of adjusted volumes.
+    :param window_size: Window size for rolling AD line calculation.
+    :returns: Array of AD values with rolling window warm-up.
+    """
+
+    accumulation_distribution_line = np.full(close.shape[0], np.nan)
+
+    # Nothing to accumulate
+    # if window is never filled
+    if close.shape[0] < window_size:
+        return accumulation_distribution_line
+
+    # Calculate money flow multiplier
+    with np.errstate(divide="ignore", invalid="ignore"):
+        money_flow_multiplier = ((close - low) - (high - close)) / (high - low)
+
+    # Calculate money flow volume
+    money_flow_volume = money_flow_multiplier * volume
+
+    # Get rolling windows of money flow volume
+    # with missing values filled with zeros
+    rolling_money_flow_volume = np.lib.stride_tricks.sliding_window_view(
+        np.where(np.isnan(money_flow_volume), 0.0, money_flow_volume),
+        window_size,
+    )
+
+    # Calculate AD value by summing money flow volume
+    # within each window in order of observations
+    # NOTE: summing in order keeps the results identical to cumulative sum
+    accumulation_distribution = rolling_money_flow_volume[:, 0].copy()
+
+    with np.errstate(invalid="ignore"):
+        for i in range(1, window_size):
+            accumulation_distribution += rolling_money_flow_volume[:, i]
+
+    # Resolve to missing value
+    # if the last value of the window is missing
+    accumulation_distribution[np.isnan(money_flow_volume[window_size - 1 :])] = np.nan
+
+    accumulation_distribution_line[window_size - 1 :] = accumulation_distribution
+
+    return accumulation_distribution_line
+
+
+def weighted_true_range(
+    diff_index: np.ndarray,
+    curr_high: np.ndarray,
+    curr_low: np.ndarray,
+    prev_close: np.ndarray,
+    prev_open: np.ndarray,
+    weighted_tr_multiplier_curr: float,
+    weighted_tr_multiplier_prev: float,
+) -> np.ndarray:
+    """
+    Calculate weighted True Range.
+
+    Wilder's Swing Index uses weighted version of True Range.
+    Thus, we define several methods to calculate it based on
+    the index of the highest absolute difference.
+
+    :param diff_index: Index of the highest absolute difference.
+    :param curr_high: Current high price.
+    :param curr_low: Current low price.
+    :param prev_close: Previous close price.
+    :param prev_open: Previous open price.
+    :param weighted_tr_multiplier_curr: Weight of current closing price change.
+    :param weighted_tr_multiplier_prev: Weight of previous closing price change.
+    :returns: Calculated weighted True Range.
+
+    :raises ValueError: If provided diff_index is invalid.
+    """
+
+    diff_index = np.asarray(diff_index)
+
+    if not np.isin(diff_index, [0, 1, 2]).all():
+        raise ValueError(
+            "Provided diff_index is invalid. Base calculation is faulty.",
+        )
+
+    return np.select(
+        [diff_index == 0, diff_index == 1],
+        [
+            np.abs(curr_high - prev_close)
+            - weighted_tr_multiplier_curr * np.abs(curr_low - prev_close)
+            + weighted_tr_multiplier_prev * np.abs(prev_close - prev_open),
+            np.abs(curr_low - prev_close)
+            - weighted_tr_multiplier_curr * np.abs(curr_high - prev_close)
+            + weighted_tr_multiplier_prev * np.abs(prev_close - prev_open),
+        ],
+        default=np.abs(curr_high - curr_low)
+        + weighted_tr_multiplier_prev * np.abs(prev_close - prev_open),
+    )
+
+
+def swing_index(
+    curr_open: np.ndarray,
+    curr_high: np.ndarray,
+    curr_low: np.ndarray,
+    curr_close: np.ndarray,
+    prev_close: np.ndarray,
+    window_size: int,
+    weighted_tr_multiplier_curr: float,
+    weighted_tr_multiplier_prev: float,
+) -> np.ndarray:
+    """
+    Calculate rolling (modified) Wilder's Swing Index over the whole series at once.
+
+    :param curr_open: Array of adjusted opens.
+    :param curr_high: Array of adjusted highs.
+    :param curr_low: Array of adjusted lows.
+    :param curr_close: Array of adjusted closes.
+    :param prev_close: Array of previous adjusted closes.
+    :param window_size: Window size for rolling Swing Index calculation.
+    :param weighted_tr_multiplier_curr: Weight of current closing price change.
+    :param weighted_tr_multiplier_prev: Weight of previous closing price change.
+    :returns: Array of swing index values with rolling window warm-up.
+    """
+
+    # Shift to get previous open
+    prev_open = shift(curr_open)
+
+    # Calculate absolute differences
+    # as the basis of weighted True Range:
+    # max(|Ht - Ct-1|, |Lt - Ct-1|, |Ht - Lt|)
+    # Kaufman, Trading Systems and Methods, 2020, p.174
+    absolute_differences = np.abs(
+        np.stack(
+            [
+                curr_high - prev_close,
+                curr_low - prev_close,
+                curr_high - curr_low,
+            ],
+        ),
+    )
+
+    # Determine the index of the highest value
+    # To decide which weighted True Range calculation to use
+    # NOTE: argmax resolves ties to the first occurrence
+    highest_value_index = np.argmax(absolute_differences, axis=0)
+
+    # Get K = highest value out of the three
+    highest_value = np.take_along_axis(
+        absolute_differences,
+        highest_value_index[np.newaxis, :],
+        axis=0,
+    )[0]
+
+    # Calculate weighted TR using one of
+    # the methods based on highest value index
+    wtr = weighted_true_range(
+        highest_value_index,
+        curr_high,
+        curr_low,
+        prev_close,
+        prev_open,
+        weighted_tr_multiplier_curr,
+        weighted_tr_multiplier_prev,
+    )
+
+    # Finally, calculate (modified) Wilders Swing Index:
+    # (Ct - Ct-1) + TRWMC * (Ct - Ot) + TRWMP * (Ct-1 - Ot-1) / WTR * K  # noqa: ERA001
+    # Giving more weight to either current or previous closing price change
+    with np.errstate(divide="ignore", invalid="ignore"):
+        si = (
+            (
+                (curr_close - prev_close)
+                + (weighted_tr_multiplier_curr * (curr_close - curr_open))
+                + (weighted_tr_multiplier_prev * (prev_close - prev_open))
+            )
+            / wtr
+        ) * highest_value
+
+    return mask_warm_up(si, window_size)
+
+
+def accumulated_swing_index(si: np.ndarray, window_size: int) -> np.ndarray:
+    """
+    Calculate rolling accumulated swing index over the whole series at once.
+
+    :param si: Array of swing index values.
+    :param window_size: Window size for rolling ASI calculation.
+    :returns: Array of accumulated swing index values with rolling window warm-up.
+    """
+
+    asi = np.full_like(si, np.nan)
+
+    # Nothing to accumulate
+    # if window is never filled
+    if si.shape[0] < window_size:
+        return asi
+
+    # Calculate ASI by summing SI within each window
+    # NOTE: missing SI values are skipped during summation
+    asi[window_size - 1 :] = np.nansum(
+        np.lib.stride_tricks.sliding_window_view(si, window_size),
+        axis=1,
+    )
+
+    return asi
+
+
+def swing_points(
+    asi: np.ndarray,
+    window_size: int,
+    high_swing_point: float,
+    low_swing_point: float,
+) -> np.ndarray:
+    """
+    Calculate rolling high/low swing points over the whole series at once.
+
+    High/Low Swing Point:
+    Any day on which the ASI is higher/lower
+    than both the previous and the following day
+    Kaufman, Trading Systems and Methods, 2020, p.175
+
+    :param asi: Array of accumulated swing index values.
+    :param window_size: Window size for rolling swing points calculation.
+    :param high_swing_point: Value to represent high swing point.
+    :param low_swing_point: Value to represent low swing point.
+    :returns: Array of swing points with rolling window warm-up.
+    """
+
+    sp = np.full_like(asi, np.nan)
+
+    # Swing points need three
+    # consecutive ASI values to compare
+    if asi.shape[0] < max(window_size, 3):
+        return sp
+
+    # Get the ASI triplets
+    # where left: t-2, middle: t-1, right: t
+    left = asi[:-2]
+    middle = asi[1:-1]
+    right = asi[2:]
+
+    # Mark HSP where middle ASI is higher than it's neighbors,
+    # LSP where middle ASI is lower than it's neighbors,
+    # and falsy float otherwise
+    sp[2:] = np.select(
+        [
+            (middle > left) & (middle > right),
+            (middle < left) & (middle < right),
+        ],
+        [
+            high_swing_point,
+            low_swing_point,
+        ],
+        default=0.0,
+    )
+
+    return mask_warm_up(sp, window_size)
+
+
+def _swing_events(
+    adj_high: np.ndarray,
+    adj_low: np.ndarray,
+    adj_close: np.ndarray,
+    window_size: int,
+    swing_filter: float,
+    up_swing: float,
+    down_swing: float,
+) -> np.ndarray:
+    """
+    Calculate rolling swings over the whole series.
+
+    Swing high, swing low and direction are carried from bar to bar,
+    therefore, calculation is done in a single sequential pass.
+
+    :param adj_high: Array of adjusted highs.
+    :param adj_low: Array of adjusted lows.
+    :param adj_close: Array of adjusted closes.
+    :param window_size: Window size for rolling swing events calculation.
+    :param swing_filter: Swing filter for determining swing highs and lows.
+    :param up_swing: Value to represent upswing.
+    :param down_swing: Value to represent downswing.
+    :returns: Array of swing events with rolling window warm-up.
+    """
+
+    # Fill swing events array with NaN,
+    # first N - 1 values remain NaN, where N = window size
+    swing_events = np.full(adj_close.shape[0], np.nan)
+
+    # Nothing to calculate
+    # if window is never filled
+    if adj_close.shape[0] < window_size:
+        return swing_events
+
+    # Record the low of the first bar (before rolling window) as swing low
+    swing_l = adj_low[window_size - 2]
+
+    # Record the high of the first bar (before rolling window) as swing high
+    swing_h = adj_high[window_size - 2]
+
+    # Following the swing high, assume we are in downswing
+    # Kaufman, TSM, p. 168
+    in_downswing = True
+
+    for i in range(window_size - 1, adj_close.shape[0]):
+        # Grab current low and high
+        current_low = adj_low[i]
+        current_high = adj_high[i]
+
+        # Calculate current swing filter
+        current_swing_filter = adj_close[i] * swing_filter
+
+        # Assume continuation
+        swing_events[i] = 0.0
+
+        # If we are in downswing
+        if in_downswing:
+            # Treat current low as new low
+            # or keep the previous swing low
+            swing_l = min(swing_l, current_low)
+
+            # Test if downswing reverses
+            if current_high - swing_l > current_swing_filter:
+                # If so, we have an upswing
+                in_downswing = False
+
+                # Treat current low and high as new swing low and high
+                swing_l = current_low
+                swing_h = current_high
+
+                swing_events[i] = up_swing
+
+            continue
+
+        # Otherwise, we are in upswing
+
+        # Treat current high as new high
+        # or keep the previous swing high
+        swing_h = max(swing_h, current_high)
+
+        # Test if upswing reverses
+        if swing_h - current_low > current_swing_filter:
+            # If so, we have downswing
+            in_downswing = True
+
+            swing_events[i] = down_swing
+
+    return swing_events
+
+
+# Compile the kernel if Numba is available
+_swing_events_kernel = (
+    njit(cache=True)(_swing_events) if njit is not None else _swing_events
+)
+
+
+def swing_events(
+    adj_high: np.ndarray,
+    adj_low: np.ndarray,
+    adj_close: np.ndarray,
+    window_size: int,
+    swing_filter: float,
+    up_swing: float,
+    down_swing: float,
+) -> np.ndarray:
+    """
+    Calculate rolling swings over the whole series.
+
+    Please see _swing_events for detailed explanation of calculation.
+
+    :param adj_high: Array of adjusted highs.
+    :param adj_low: Array of adjusted lows.
+    :param adj_close: Array of adjusted closes.
+    :param window_size: Window size for rolling swing events calculation.
+    :param swing_filter: Swing filter for determining swing highs and lows.
+    :param up_swing: Value to represent upswing.
+    :param down_swing: Value to represent downswing.
+    :returns: Array of swing events with rolling window warm-up.
+    """
+
+    # NOTE: arrays must be contiguous for compiled kernel
+    return _swing_events_kernel(
+        np.ascontiguousarray(adj_high, dtype=np.float64),
+        np.ascontiguousarray(adj_low, dtype=np.float64),
+        np.ascontiguousarray(adj_close, dtype=np.float64),
+        window_size,
+        swing_filter,
+        up_swing,
+        down_swing,
+    )
+
+
+def elliot_waves_oscillator(
+    high: np.ndarray,
+    low: np.ndarray,
+    fast_oscillator_period: int,
+    slow_oscillator_period: int,
+) -> np.ndarray:
+    """
+    Calculate Elliot Waves Oscillator.
+
+    :param high: Array of adjusted highs.
+    :param low: Array of adjusted lows.
+    :param fast_oscillator_period: Fast period for Elliot Waves Oscillator.
+    :param slow_oscillator_period: Slow period for Elliot Waves Oscillator.
+    :returns: Array of Elliot Waves Oscillator values.
+    """
+
+    # Precalculate the average
+    # between high and low prices
+    high_low_avg = pd.Series((high + low) / 2)
+
+    # Calculate fast moving average
+    # of the average between high and low
+    fast_hla_sma = high_low_avg.rolling(
+        window=fast_oscillator_period,
+        min_periods=fast_oscillator_period,
+    ).mean()
+
+    # Calculate slow moving average
+    # of the average between high and low
+    slow_hla_sma = high_low_avg.rolling(
+        window=slow_oscillator_period,
+        min_periods=slow_oscillator_period,
+    ).mean()
+
+    return (fast_hla_sma - slow_hla_sma).to_numpy()
+
+
+def _elliot_waves(
+    ewo: np.ndarray,
+    ewo_sma: np.ndarray,
+    ewo_h: np.ndarray,
+    ewo_l: np.ndarray,
+    window_size: int,
+    golden_ratio: float,
+    no_value: float,
+    up_trend: float,
+    down_trend: float,
+    upward_wave: float,
+    downward_wave: float,
+) -> np.ndarray:
+    """
+    Calculate rolling Elliot Waves over the whole series.
+
+    Trend is carried from bar to bar, therefore,
+    calculation is done in a single sequential pass.
+
+    :param ewo: Array of Elliot Waves Oscillator values.
+    :param ewo_sma: Array of EWO SMA values.
+    :param ewo_h: Array of the highest EWO values within the window.
+    :param ewo_l: Array of the lowest EWO values within the window.
+    :param window_size: Window size for Elliot Waves calculation.
+    :param golden_ratio: Golden Ratio.
+    :param no_value: Value to represent no wave or no trend.
+    :param up_trend: Value to represent uptrend.
+    :param down_trend: Value to represent downtrend.
+    :param upward_wave: Value to represent upward wave.
+    :param downward_wave: Value to represent downward wave.
+    :returns: Array of Elliot Waves with rolling window warm-up.
+    """
+
+    # Fill wave line array with NaN,
+    # first N - 1 values remain NaN, where N = window size
+    elliot_waves = np.full(ewo.shape[0], np.nan)
+
+    # Previous trend is unknown before the first window
+    # NOTE: we use NaN to facilitate for the first iteration
+    prev_trend = np.nan
+
+    for i in range(window_size - 1, ewo.shape[0]):
+        # Declare variables for current wave and trend
+        curr_wave = no_value
+        curr_trend = no_value
+
+        # Grab current EWO, EWO SMA and window extremes
+        curr_ewo = ewo[i]
+        curr_ewo_sma = ewo_sma[i]
+        curr_ewo_h = ewo_h[i]
+        curr_ewo_l = ewo_l[i]
+
+        # Determine if previous trend is not set
+        no_prev_trend = prev_trend == no_value or np.isnan(prev_trend)
+
+        # If the previous trend is not set
+        # and the current EWO is the highest EWO
+        if no_prev_trend and curr_ewo == curr_ewo_h:
+            # Mark the trend as uptrend
+            curr_trend = up_trend
+
+        # If the current EWO is below 0,
+        # the previous trend is downtrend
+        # and current EWO retraces back up
+        # to one golden ratio from lowest
+        if (
+            curr_ewo < curr_ewo_sma
+            and prev_trend == down_trend
+            and curr_ewo > golden_ratio * curr_ewo_l
+        ):
+            # Mark the trend as uptrend
+            curr_trend = up_trend
+
+        # If the previous trend is not set
+        # and the current EWO is the lowest EWO
+        if no_prev_trend and curr_ewo == curr_ewo_l:
+            # Mark the trend as downtrend
+            curr_trend = down_trend
+
+        # If the current EWO is above 0,
+        # the previous trend is uptrend
+        # and current EWO retraces back down
+        # to one golden ratio from the highest
+        if (
+            curr_ewo > curr_ewo_sma
+            and prev_trend == up_trend
+            and curr_ewo < golden_ratio * curr_ewo_h
+        ):
+            # Mark the trend as downtrend
+            curr_trend = down_trend
+
+        # Now that we have a trend
+        # we can determine the wave
+
+        # Identify beginning of one of the upward
+        # waves within the uptrend (waves 1, 3, or 5)
+        if curr_trend == up_trend and curr_ewo == curr_ewo_h:
+            curr_wave = upward_wave
+
+        # Identify beginning of one of the
+        # downward waves within the uptrend (waves 2 or 4)
+        if curr_trend == up_trend and curr_ewo == curr_ewo_l:
+            curr_wave = downward_wave
+
+        # Identify beginning of one of the upward
+        # waves within the downtrend (wave 2)
+        if curr_trend == down_trend and curr_ewo == curr_ewo_l:
+            curr_wave = upward_wave
+
+        # Identify beginning of one of the downward
+        # waves within the downtrend (waves 1 and 3)
+        if curr_trend == down_trend and curr_ewo == curr_ewo_h:
+            curr_wave = downward_wave
+
+        # Preserve the wave and carry the trend
+        elliot_waves[i] = curr_wave
+        prev_trend = curr_trend
+
+    return elliot_waves
+
+
+# Compile the kernel if Numba is available
+_elliot_waves_kernel = (
+    njit(cache=True)(_elliot_waves) if njit is not None else _elliot_waves
+)
+
+
+def elliot_waves(
+    ewo: np.ndarray,
+    window_size: int,
+    golden_ratio: float,
+    no_value: float,
+    up_trend: float,
+    down_trend: float,
+    upward_wave: float,
+    downward_wave: float,
+) -> np.ndarray:
+    """
+    Calculate rolling Elliot Waves over the whole series.
+
+    Please see _elliot_waves for detailed explanation of calculation.
+
+    :param ewo: Array of Elliot Waves Oscillator values.
+    :param window_size: Window size for Elliot Waves calculation.
+    :param golden_ratio: Golden Ratio.
+    :param no_value: Value to represent no wave or no trend.
+    :param up_trend: Value to represent uptrend.
+    :param down_trend: Value to represent downtrend.
+    :param upward_wave: Value to represent upward wave.
+    :param downward_wave: Value to represent downward wave.
+    :returns: Array of Elliot Waves with rolling window warm-up.
+    """
+
+    ewo_series = pd.Series(ewo)
+
+    # Calculate EWO SMA
+    ewo_sma = ewo_series.rolling(window=window_size, min_periods=window_size).mean()
+
+    # Determine the highest and the
+    # lowest EWO values within the window
+    # NOTE: missing EWO values are skipped
+    ewo_h = ewo_series.rolling(window=window_size, min_periods=1).max()
+    ewo_l = ewo_series.rolling(window=window_size, min_periods=1).min()
+
+    # Calculate Elliot Waves in one sequential
+    # pass over the precalculated arrays
+    # NOTE: arrays must be contiguous for compiled kernel
+    return _elliot_waves_kernel(
+        np.ascontiguousarray(ewo, dtype=np.float64),
+        np.ascontiguousarray(ewo_sma, dtype=np.float64),
+        np.ascontiguousarray(ewo_h, dtype=np.float64),
+        np.ascontiguousarray(ewo_l, dtype=np.float64),
+        window_size,
+        golden_ratio,
+        no_value,
+        up_trend,
+        down_trend,
+        upward_wave,
+        downward_wave,
+    )
+
+
+def engulfing_pattern(
+    open_: np.ndarray,
+    close: np.ndarray,
+    missing_data_placeholder: float,
+    no_pattern: float,
+    bullish_pattern: float,
+    bearish_pattern: float,
+) -> np.ndarray:
+    """
+    Calculate bullish and bearish engulfing pattern.
+
+    :param open_: Array of opens with missing data placeholders.
+    :param close: Array of closes with missing data placeholders.
+    :param missing_data_placeholder: Placeholder of missing data.
+    :param no_pattern: Value to represent no pattern.
+    :param bullish_pattern: Value to represent bullish engulfing.
+    :param bearish_pattern: Value to represent bearish engulfing.
+    :returns: Array of engulfing patterns.
+    """
+
+    # Shift open and close prices only if the data is present
+    prev_open = where_present(open_, shift(open_), missing_data_placeholder)
+    prev_close = where_present(close, shift(close), missing_data_placeholder)
+
+    # Calculate bullish engulfing
+    bullish_engulfing = (
+        # Open at T is below the close at T-1
+        # Candle opened below the close of the previous candle
+        (open_ < prev_open)
+        # Close at T is above the open at T-1
+        # Candle closed above the open of the previous candle
+        & (close > prev_close)
+        # Close at T is above the open at T
+        # Candle closed in positive territory
+        & (close > open_)
+    )
+
+    # Calculate bearish engulfing
+    bearish_engulfing = (
+        # Open at T is above the close at T-1
+        # Candle opened above the close of the previous candle
+        (open_ > prev_open)
+        # Close at T is below the open at T-1
+        # Candle closed below the open of the previous candle
+        & (close < prev_close)
+        # Close at T is below the open at T
+        # Candle closed in negative territory
+        & (close < open_)
+    )
+
+    # Mark engulfing patterns
+    pattern = np.full(close.shape[0], no_pattern)
+
+    pattern[bullish_engulfing] = bullish_pattern
+    pattern[bearish_engulfing] = bearish_pattern
+
+    return pattern
+
+
+def star_pattern(
+    open_: np.ndarray,
+    close: np.ndarray,
+    doji_threshold: float,
+    missing_data_placeholder: float,
+    no_pattern: float,
+    bullish_pattern: float,
+    bearish_pattern: float,
+) -> np.ndarray:
+    """
+    Calculate bullish morning star and bearish evening star pattern.
+
+    :param open_: Array of opens with missing data placeholders.
+    :param close: Array of closes with missing data placeholders.
+    :param doji_threshold: Threshold for identifying candlestick formation as Doji.
+    :param missing_data_placeholder: Placeholder of missing data.
+    :param no_pattern: Value to represent no pattern.
+    :param bullish_pattern: Value to represent morning star.
+    :param bearish_pattern: Value to represent evening star.
+    :returns: Array of star patterns.
+    """
+
+    # Shift open and close to T-1 and T-2
+    # only if the data is present
+    open_tm1 = where_present(open_, shift(open_, 1), missing_data_placeholder)
+    open_tm2 = where_present(open_, shift(open_, 2), missing_data_placeholder)
+
+    close_tm1 = where_present(close, shift(close, 1), missing_data_placeholder)
+    close_tm2 = where_present(close, shift(close, 2), missing_data_placeholder)
+
+    # Precalculate candle midpoint necessary for stars
+    open_on_close_midpoint_tm2 = (open_tm2 + close_tm2) / 2
+
+    # Determine if the previous candle closed in neutral territory
+    # where difference between close at T-1 and
+    # open at T-1 is less than Doji threshold
+    with np.errstate(divide="ignore", invalid="ignore"):
+        doji_tm1 = np.abs(close_tm1 - open_tm1) / open_tm1 < doji_threshold
+
+    # Calculate bullish morning star
+    bullish_morning_star = (
+        # Close at T-2 is below the open at T-2
+        # Candle at T-2 closed in negative territory
+        (close_tm2 < open_tm2)
+        # Previous candle closed in neutral territory
+        & doji_tm1
+        # Close at T is above the open at T
+        # Candle closed in positive territory
+        & (close > open_)
+        # Close at T is above the midpoint of T-2 candle
+        & (close > open_on_close_midpoint_tm2)
+    )
+
+    # Calculate bearish evening star
+    bearish_evening_star = (
+        # Close at T-2 is above the open at T-2
+        # Candle at T-2 closed in positive territory
+        (close_tm2 > open_tm2)
+        # Previous candle closed in neutral territory
+        & doji_tm1
+        # Close at T is below the open at T
+        # Candle closed in negative territory
+        & (close < open_)
+        # Close at T is below the midpoint of T-2 candle
+        & (close < open_on_close_midpoint_tm2)
+    )
+
+    # Mark star patterns
+    pattern = np.full(close.shape[0], no_pattern)
+
+    pattern[bullish_morning_star] = bullish_pattern
+    pattern[bearish_evening_star] = bearish_pattern
+
+    return pattern
+
+
+def three_pattern(
+    open_: np.ndarray,
+    close: np.ndarray,
+    missing_data_placeholder: float,
+    no_pattern: float,
+    bullish_pattern: float,
+    bearish_pattern: float,
+) -> np.ndarray:
+    """
+    Calculate three white soldiers and three black crows pattern.
+
+    :param open_: Array of opens with missing data placeholders.
+    :param close: Array of closes with missing data placeholders.
+    :param missing_data_placeholder: Placeholder of missing data.
+    :param no_pattern: Value to represent no pattern.
+    :param bullish_pattern: Value to represent three white soldiers.
+    :param bearish_pattern: Value to represent three black crows.
+    :returns: Array of three patterns.
+    """
+
+    # Shift open and close to T-1 and T-2
+    # only if the data is present
+    open_tm1 = where_present(open_, shift(open_, 1), missing_data_placeholder)
+    open_tm2 = where_present(open_, shift(open_, 2), missing_data_placeholder)
+
+    close_tm1 = where_present(close, shift(close, 1), missing_data_placeholder)
+    close_tm2 = where_present(close, shift(close, 2), missing_data_placeholder)
+
+    # Calculate three white soldiers
+    three_white_soldiers = (
+        # Three consecutive positive closes
+        (close > open_)
+        & (close_tm1 > open_tm1)
+        & (close_tm2 > open_tm2)
+        # Each candle closes higher than the previous candle's close
+        & (close > close_tm1)
+        & (close_tm1 > close_tm2)
+        # Each candle opens within or near the previous candle's body
+        # NOTE: this is a reversed version of the original definition
+        # Open must be within the previous candle's body to avoid gaps
+        & (open_ <= close_tm1)
+        & (open_tm1 <= close_tm2)
+    )
+
+    # Calculate three black crows
+    three_black_crows = (
+        # Three consecutive negative closes
+        (close < open_)
+        & (close_tm1 < open_tm1)
+        & (close_tm2 < open_tm2)
+        # Each candle closes lower than the previous candle's close
+        & (close < close_tm1)
+        & (close_tm1 < close_tm2)
+        # Each candle opens within or near the previous candle's body
+        # NOTE: this is a reversed version of the original definition
+        # Open must be within the previous candle's body to avoid gaps
+        & (open_ >= close_tm1)
+        & (open_tm1 >= close_tm2)
+    )
+
+    # Mark three patterns
+    pattern = np.full(close.shape[0], no_pattern)
+
+    pattern[three_white_soldiers] = bullish_pattern
+    pattern[three_black_crows] = bearish_pattern
+
+    return pattern
+
+
+def convergence_divergence(
+    first_close: np.ndarray,
+    second_close: np.ndarray,
+    missing_data_placeholder: float,
+) -> np.ndarray:
+    """
+    Calculate percentage change difference between two instruments.
+
+    :param first_close: Array of the first instrument closes.
+    :param second_close: Array of the second instrument closes.
+    :param missing_data_placeholder: Placeholder of missing data.
+    :returns: Array of percentage change differences.
+    """
+
+    # Calculate percentage change for both
+    # instruments only if the data is present
+    first_pct_change = where_present(
+        first_close,
+        percentage_change(first_close),
+        missing_data_placeholder,
+    )
+
+    second_pct_change = where_present(
+        second_close,
+        percentage_change(second_close),
+        missing_data_placeholder,
+    )
+
+    return first_pct_change - second_pct_change
@@ -1,8 +1,9 @@
 import numpy as np
 import pandas as pd
-from scipy.stats import linregress
 
-from apollo.calculators.base_calculator import BaseCalculator
+from apollo.calculators import kernels
+from apollo.calculators.base_calculator import BaseCalculator, BatchResult
+from apollo.calculators.calculation_cache import memoize_calculation
 
 
 class LinearRegressionChannelCalculator(BaseCalculator):
@@ -29,74 +30,77 @@ class LinearRegressionChannelCalculator(BaseCalculator):
 
         super().__init__(dataframe, window_size)
 
-        self._t_slope: list[float] = []
-        self._l_bound: list[float] = []
-        self._u_bound: list[float] = []
-
         self._channel_sd_spread = channel_sd_spread
 
+    @memoize_calculation(
+        inputs=("adj close",),
+        outputs=("slope", "prev_slope", "l_bound", "u_bound"),
+        parameters=("_window_size", "_channel_sd_spread"),
+    )
     def calculate_linear_regression_channel(self) -> None:
         """Calculate rolling linear regression channel."""
 
-        # Reset indices to integer to use as x axis of linear regression
-        self._dataframe.reset_index(inplace=True)
+        # Write slopes and channel bounds to the dataframe
+        for column, values in self._to_columns(
+            *kernels.linear_regression_channel(
+                self._get_array("adj close"),
+                self._window_size,
+                self._channel_sd_spread,
+            ),
+        ).items():
+            self._dataframe[column] = values
+
+    @classmethod
+    def calculate_linear_regression_channel_batch(
+        cls,
+        dataframe: pd.DataFrame,
+        window_sizes: list[int],
+        channel_sd_spread: float,
+    ) -> BatchResult:
+        """
+        Calculate rolling linear regression channel for multiple window sizes at once.
 
-        # Fill slopes and bounds arrays with N NaN, where N = window size
-        self._t_slope = np.full((1, self._window_size - 1), np.nan).flatten().tolist()
-        self._l_bound = np.full((1, self._window_size - 1), np.nan).flatten().tolist()
-        self._u_bound = np.full((1, self._window_size - 1), np.nan).flatten().tolist()
+        :param dataframe: Dataframe to calculate channel for, it is not modified.
+        :param window_sizes: Window sizes for rolling channel calculation.
+        :param channel_sd_spread: Standard deviation spread for channel bounds.
+        :returns: "slope", "prev_slope", "l_bound" and "u_bound"
+            arrays of shape (bars, window sizes).
+        """
 
-        # Calculate bounds and slope by using ordinary least squares regression
-        self._dataframe["adj close"].rolling(self._window_size).apply(
-            self._calc_lin_reg,
+        adj_close = dataframe["adj close"].to_numpy(dtype=np.float64)
+
+        return cls._stack_window_results(
+            [
+                cls._to_columns(
+                    *kernels.linear_regression_channel(
+                        adj_close,
+                        window_size,
+                        channel_sd_spread,
+                    ),
+                )
+                for window_size in window_sizes
+            ],
         )
 
-        # Write slopes to dataframe
-        self._dataframe["slope"] = self._t_slope
-
-        # Shift slopes to further compare direction
-        self._dataframe["prev_slope"] = self._dataframe["slope"].shift(1)
-
-        # Write bounds to the dataframe
-        self._dataframe["l_bound"] = self._l_bound
-        self._dataframe["u_bound"] = self._u_bound
-
-        # Reset indices back to date
-        self._dataframe.set_index("date", inplace=True)
-
-    def _calc_lin_reg(self, series: pd.Series) -> float:
+    @staticmethod
+    def _to_columns(
+        slope: np.ndarray,
+        l_bound: np.ndarray,
+        u_bound: np.ndarray,
+    ) -> dict[str, np.ndarray]:
         """
-        Calculate rolling ordinary least squares regression for a given window.
+        Map linear regression channel to dataframe columns.
 
-        :param series: Series to calculate rolling linear regression over.
-        :returns: Dummy float to satisfy Pandas' return value.
+        :param slope: Array of slopes.
+        :param l_bound: Array of lower channel bounds.
+        :param u_bound: Array of upper channel bounds.
+        :returns: Slopes and channel bounds keyed by column name.
         """
 
-        # Use indices for x axis
-        x = series.index
-
-        # Use closing prices for y axis
-        y = series.to_numpy()
-
-        # Calculate slope and intercept, ignore rest
-        slope, intercept, _, _, _ = linregress(x, y)
-
-        # Preserve slope
-        self._t_slope.append(slope)  # type: ignore  # noqa: PGH003
-
-        # Calculate line of best fit
-        lbf = slope * x + intercept
-
-        # Calculate standard deviation
-        std = y.std()
-
-        # Calculate lower and upper bounds
-        # as N standard deviations above/below LBF
-        lower_bound = lbf - std * self._channel_sd_spread
-        upper_bound = lbf + std * self._channel_sd_spread
-
-        self._l_bound.append(lower_bound[-1])
-        self._u_bound.append(upper_bound[-1])
-
-        # Return dummy float
-        return 0.0
+        return {
+            "slope": slope,
+            # Shift slopes to further compare direction
+            "prev_slope": kernels.shift(slope),
+            "l_bound": l_bound,
+            "u_bound": u_bound,
+        }
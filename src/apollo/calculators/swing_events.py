@@ -1,7 +1,8 @@
-import numpy as np
 import pandas as pd
 
+from apollo.calculators import kernels
 from apollo.calculators.base_calculator import BaseCalculator
+from apollo.calculators.calculation_cache import memoize_calculation
 
 
 class SwingEventsCalculator(BaseCalculator):
@@ -33,106 +34,23 @@ class SwingEventsCalculator(BaseCalculator):
 
         super().__init__(dataframe, window_size)
 
-        self._swing_l = 0.0
-        self._swing_h = 0.0
-
-        self._in_downswing = False
         self._swing_filter = swing_filter
 
-        self._swing_events: list[float] = []
-
+    @memoize_calculation(
+        inputs=("adj high", "adj low", "adj close"),
+        outputs=("se",),
+        parameters=("_window_size", "_swing_filter"),
+    )
     def calculate_swing_events(self) -> None:
         """Calculate rolling swing events."""
 
-        # Record the low of the first bar (before rolling window) as swing low
-        self._swing_l = self._dataframe.iloc[self._window_size - 2]["adj low"]
-
-        # Record the high of the first bar (before rolling window) as swing high
-        self._swing_h = self._dataframe.iloc[self._window_size - 2]["adj high"]
-
-        # Following the swing high, assume we are in downswing
-        # Kaufman, TSM, p. 168
-        self._in_downswing = True
-
-        # Fill swing events array with N NaN, where N = window size
-        self._swing_events = (
-            np.full((1, self._window_size - 1), np.nan).flatten().tolist()
-        )
-
-        # Calculate swings
-        self._dataframe["adj close"].rolling(self._window_size).apply(self._calc_se)
-
         # Write swings to the dataframe
-        self._dataframe["se"] = self._swing_events
-
-    def _calc_se(self, series: pd.Series) -> float:
-        """
-        Calculate rolling swings for a given window.
-
-        :param series: Series which is used for indexing out rolling window.
-        :returns: Dummy float to satisfy Pandas' return value.
-        """
-
-        # Slice out a chunk of dataframe to work with
-        rolling_df = self._dataframe.loc[series.index]
-
-        # Grab current low
-        current_low = rolling_df.iloc[-1]["adj low"]
-
-        # Grab current high
-        current_high = rolling_df.iloc[-1]["adj high"]
-
-        # Calculate current swing filter
-        current_swing_filter = rolling_df.iloc[-1]["adj close"] * self._swing_filter
-
-        # If we are in downswing
-        if self._in_downswing:
-            # Treat current low as new low
-            # or keep the previous swing low
-            self._swing_l = min(self._swing_l, current_low)
-
-            # Test if downswing reverses
-            if current_high - self._swing_l > current_swing_filter:
-                # If so, we have an upswing
-                self._in_downswing = False
-
-                # Treat current low as new swing low
-                self._swing_l = current_low
-
-                # Treat current high as new swing high
-                self._swing_h = current_high
-
-                # Append positive float to the list
-                self._swing_events.append(self.UP_SWING)
-
-                # Return dummy float
-                return 0.0
-
-            # Append falsy float as it is a continuation
-            self._swing_events.append(0.0)
-
-            # Return dummy float
-            return 0.0
-
-        # Otherwise, we are in upswing
-
-        # Treat current high as new high
-        # or keep the previous swing high
-        self._swing_h = max(self._swing_h, current_high)
-
-        # Test if upswing reverses
-        if self._swing_h - current_low > current_swing_filter:
-            # If so, we have downswing
-            self._in_downswing = True
-
-            # Append negative float to the list
-            self._swing_events.append(self.DOWN_SWING)
-
-            # Return dummy float
-            return 0.0
-
-        # Append falsy float as it is a continuation
-        self._swing_events.append(0.0)
-
-        # Return dummy float
-        return 0.0
+        self._dataframe["se"] = kernels.swing_events(
+            self._get_array("adj high"),
+            self._get_array("adj low"),
+            self._get_array("adj close"),
+            self._window_size,
+            self._swing_filter,
+            self.UP_SWING,
+            self.DOWN_SWING,
+        )
@@ -1,6 +1,8 @@
 import pandas as pd
 
+from apollo.calculators import kernels
 from apollo.calculators.base_calculator import BaseCalculator
+from apollo.calculators.calculation_cache import memoize_calculation
 from apollo.settings import MISSING_DATA_PLACEHOLDER
 
 
@@ -24,6 +26,11 @@ class VIXFuturesConvergenceDivergenceCalculator(BaseCalculator):
         """
         super().__init__(dataframe, window_size)
 
+    @memoize_calculation(
+        inputs=("vix close", "spf close"),
+        outputs=("vix_spf_pct_diff", "prev_vix_spf_pct_diff"),
+        parameters=(),
+    )
     def calculate_vix_futures_convergence_divergence(self) -> None:
         """Calculate VIX Futures Convergence Divergence."""
 
@@ -33,35 +40,14 @@ class VIXFuturesConvergenceDivergenceCalculator(BaseCalculator):
         # We, therefore, can calculate only over present data points,
         # otherwise, the strategy using the results will drop missing rows
 
-        # Initialize necessary columns with 0
-        self._dataframe["vix_pct_change"] = 0.0
-        self._dataframe["spf_pct_change"] = 0.0
-        self._dataframe["vix_spf_pct_diff"] = 0.0
-
-        # Calculate percentage change for VIX and
-        # S&P 500 Futures only if the data is present
-        self._dataframe.loc[
-            self._dataframe["vix close"] != MISSING_DATA_PLACEHOLDER,
-            "vix_pct_change",
-        ] = self._dataframe["vix close"].pct_change()
-
-        self._dataframe.loc[
-            self._dataframe["spf close"] != MISSING_DATA_PLACEHOLDER,
-            "spf_pct_change",
-        ] = self._dataframe["spf close"].pct_change()
-
         # Calculate percentage change difference between VIX and S&P 500 Futures
-        self._dataframe["vix_spf_pct_diff"] = (
-            self._dataframe["vix_pct_change"] - self._dataframe["spf_pct_change"]
+        vix_spf_pct_diff = kernels.convergence_divergence(
+            self._get_array("vix close"),
+            self._get_array("spf close"),
+            MISSING_DATA_PLACEHOLDER,
         )
 
-        # Shift to get previous percentage change difference
-        self._dataframe["prev_vix_spf_pct_diff"] = self._dataframe[
-            "vix_spf_pct_diff"
-        ].shift(1)
+        self._dataframe["vix_spf_pct_diff"] = vix_spf_pct_diff
 
-        # Drop unnecessary columns
-        self._dataframe.drop(
-            columns=["vix_pct_change", "spf_pct_change"],
-            inplace=True,
-        )
+        # Shift to get previous percentage change difference
+        self._dataframe["prev_vix_spf_pct_diff"] = kernels.shift(vix_spf_pct_diff)
@@ -1,5 +1,7 @@
+from atexit import register
 from datetime import date
 from logging import getLogger
+from os import getpid
 
 import pandas as pd
 from influxdb_client import InfluxDBClient
@@ -16,12 +18,61 @@ from apollo.settings import (
 
 logger = getLogger(__name__)
 
+# InfluxDB clients by process and initialization parameters,
+# so that processes forked after a client was created
+# open their own connections instead of sharing parent's sockets
+_clients: dict[tuple[int, str, str | None, str | None], InfluxDBClient] = {}
+
+
+def get_influxdb_client(url: str, org: str | None, token: str | None) -> InfluxDBClient:
+    """
+    Get InfluxDB client of the current process, creating it on first use.
+
+    Client keeps a pool of HTTP connections that is reused by
+    every request of the process, instead of connecting per request.
+
+    :param url: InfluxDB server API url.
+    :param org: InfluxDB organization.
+    :param token: InfluxDB token.
+    :returns: InfluxDB client.
+    """
+
+    key = (getpid(), url, org, token)
+
+    if key not in _clients:
+        _clients[key] = InfluxDBClient(url=url, org=org, token=token)
+
+    return _clients[key]
+
+
+@register
+def close_influxdb_clients() -> None:
+    """
+    Close InfluxDB clients of the current process, releasing their connections.
+
+    Called at interpreter exit of the main process,
+    pool workers exit without running exit handlers,
+    hence they call it once their task is done
+    (i.e. after screening a batch of tickers).
+    Clients are created anew by the next request.
+    """
+
+    process_id = getpid()
+
+    # NOTE: clients inherited from the parent process
+    # are left alone, their sockets belong to the parent
+    for key in [key for key in _clients if key[0] == process_id]:
+        _clients.pop(key).close()
+
 
 class InfluxDbConnector:
     """
     Influx Database Connector class.
 
     Acts as a wrapper around the InfluxDB Python client.
+
+    Client of the current process is shared by every connector,
+    so that consecutive requests reuse pooled connections.
     """
 
     def __init__(self) -> None:
@@ -50,20 +101,21 @@ class InfluxDbConnector:
         """
 
         try:
-            with InfluxDBClient(**self._client_parameters) as client:
-                # Copy and add frequency to the
-                # dataframe to use as a tag value
-                dataframe_to_write = dataframe.copy()
-                dataframe_to_write["frequency"] = frequency
-
-                # Create write API and write incoming dataframe
-                with client.write_api(write_options=SYNCHRONOUS) as write_api:
-                    write_api.write(
-                        bucket=str(INFLUXDB_BUCKET),
-                        record=dataframe_to_write,
-                        data_frame_measurement_name=INFLUXDB_MEASUREMENT,
-                        data_frame_tag_columns=["ticker", "frequency"],
-                    )
+            client = get_influxdb_client(**self._client_parameters)
+
+            # Copy and add frequency to the
+            # dataframe to use as a tag value
+            dataframe_to_write = dataframe.copy()
+            dataframe_to_write["frequency"] = frequency
+
+            # Create write API and write incoming dataframe
+            with client.write_api(write_options=SYNCHRONOUS) as write_api:
+                write_api.write(
+                    bucket=str(INFLUXDB_BUCKET),
+                    record=dataframe_to_write,
+                    data_frame_measurement_name=INFLUXDB_MEASUREMENT,
+                    data_frame_tag_columns=["ticker", "frequency"],
+                )
 
         except ReadTimeoutError:
             # NOTE: on first-time write InfluxDB may raise a ReadTimeoutError
@@ -95,67 +147,68 @@ class InfluxDbConnector:
         :returns: Dataframe with price data.
         """
 
-        with InfluxDBClient(**self._client_parameters) as client:
-            # Create query API
-            query_api = client.query_api()
-
-            # Define query range
-            # depending on the max period flag
-            query_range = (
-                "start:0" if max_period else f"start: {start_date}, stop: {end_date}"
-            )
-
-            # Query the price data from the database
-            query_statement = f"""
-                from(bucket:"{INFLUXDB_BUCKET}")
-                |> range({query_range})
-                |> filter(fn: (r) =>
-                        r.ticker == "{ticker}" and
-                        r.frequency == "{frequency}" and
-                        r._measurement == "{INFLUXDB_MEASUREMENT}"
-                    )
-                |> pivot(
-                        rowKey: ["_time"],
-                        columnKey: ["_field"],
-                        valueColumn: "_value"
-                    )
-                |> keep(
-                        columns: [
-                            "ticker",
-                            "open",
-                            "adj open",
-                            "high",
-                            "adj high",
-                            "low",
-                            "adj low",
-                            "close",
-                            "adj close",
-                            "volume",
-                            "adj volume",
-                            "_time",
-                        ]
-                    )
-                |> rename(columns: {'{_time: "date"}'})
-                """
-
-            # Execute the query
-            dataframe: pd.DataFrame = query_api.query_data_frame(
-                query=query_statement,
-                org=INFLUXDB_ORG,
-            )
-
-            # Drop unnecessary influx columns
-            dataframe.drop(columns=["result", "table"], inplace=True)
-
-            # Remove time and timezone information from date
-            # as we do not yet work with multiple frequencies and exchanges
-            dataframe["date"] = dataframe["date"].dt.tz_localize(None)
-
-            # Set the date column as index
-            dataframe.set_index("date", inplace=True)
-
-            # Execute the query and return
-            return dataframe
+        client = get_influxdb_client(**self._client_parameters)
+
+        # Create query API
+        query_api = client.query_api()
+
+        # Define query range
+        # depending on the max period flag
+        query_range = (
+            "start:0" if max_period else f"start: {start_date}, stop: {end_date}"
+        )
+
+        # Query the price data from the database
+        query_statement = f"""
+            from(bucket:"{INFLUXDB_BUCKET}")
+            |> range({query_range})
+            |> filter(fn: (r) =>
+                    r.ticker == "{ticker}" and
+                    r.frequency == "{frequency}" and
+                    r._measurement == "{INFLUXDB_MEASUREMENT}"
+                )
+            |> pivot(
+                    rowKey: ["_time"],
+                    columnKey: ["_field"],
+                    valueColumn: "_value"
+                )
+            |> keep(
+                    columns: [
+                        "ticker",
+                        "open",
+                        "adj open",
+                        "high",
+                        "adj high",
+                        "low",
+                        "adj low",
+                        "close",
+                        "adj close",
+                        "volume",
+                        "adj volume",
+                        "_time",
+                    ]
+                )
+            |> rename(columns: {'{_time: "date"}'})
+            """
+
+        # Execute the query
+        dataframe: pd.DataFrame = query_api.query_data_frame(
+            query=query_statement,
+            org=INFLUXDB_ORG,
+        )
+
+        # Drop unnecessary influx columns
+        dataframe.drop(columns=["result", "table"], inplace=True)
+
+        # Remove time and timezone information from date
+        # as we do not yet work with multiple frequencies and exchanges
+        dataframe["date"] = dataframe["date"].dt.tz_localize(None)
+
+        # Set the date column as index
+        dataframe.set_index("date", inplace=True)
+
+        # Execute the query and return
+        return dataframe
 
     def get_last_record_date(self, ticker: str, frequency: str) -> date | None:
         """
@@ -166,28 +219,29 @@ class InfluxDbConnector:
         :returns: Last record date or None if no records are found.
         """
 
-        with InfluxDBClient(**self._client_parameters) as client:
-            # Create query API
-            query_api = client.query_api()
-
-            # Query the last record in the database
-            query_statement = f"""
-                from(bucket:"{INFLUXDB_BUCKET}")
-                |> range(start:0)
-                |> filter(fn: (r) =>
-                        r.ticker == "{ticker}" and
-                        r.frequency == "{frequency}" and
-                        r._measurement == "{INFLUXDB_MEASUREMENT}"
-                    )
-                |> last()
-                """
-
-            # Execute the query
-            tables = query_api.query(query=query_statement, org=INFLUXDB_ORG)
-
-            # Get the last record date string if any
-            return (
-                (tables[0].records[0]).get_time().date()
-                if tables and tables[0].records
-                else None
-            )
+        client = get_influxdb_client(**self._client_parameters)
+
+        # Create query API
+        query_api = client.query_api()
+
+        # Query the last record in the database
+        query_statement = f"""
+            from(bucket:"{INFLUXDB_BUCKET}")
+            |> range(start:0)
+            |> filter(fn: (r) =>
+                    r.ticker == "{ticker}" and
+                    r.frequency == "{frequency}" and
+                    r._measurement == "{INFLUXDB_MEASUREMENT}"
+                )
+            |> last()
+            """
+
+        # Execute the query
+        tables = query_api.query(query=query_statement, org=INFLUXDB_ORG)
+
+        # Get the last record date string if any
+        return (
+            (tables[0].records[0]).get_time().date()
+            if tables and tables[0].records
+            else None
+        )
@@ -0,0 +1,335 @@
+from errno import EEXIST, ENOTEMPTY
+from hashlib import blake2b
+from json import dumps, loads
+from pathlib import Path
+from shutil import rmtree
+from tempfile import NamedTemporaryFile, mkdtemp
+from typing import TypedDict
+
+import numpy as np
+import pandas as pd
+
+from apollo.settings import DEFAULT_DATE_FORMAT, PRCS_DIR
+
+
+class LocalStoreMetadata(TypedDict):
+    """Local store metadata type definition."""
+
+    # Content hash of the current version,
+    # names the directory it is stored in
+    version: str
+    columns: list[str]
+    last_record_date: str
+
+    # Content hash of the last record, so that
+    # records synced later can be checked against it
+    last_record_hash: str
+
+
+def hash_price_data(dataframe: pd.DataFrame) -> str:
+    """
+    Calculate content hash of price data.
+
+    :param dataframe: Dataframe with price data.
+    :returns: Hex digest of the index and columns content.
+    """
+
+    digest = blake2b(digest_size=16)
+
+    digest.update(np.ascontiguousarray(dataframe.index.to_numpy()).tobytes())
+
+    for position, column in enumerate(dataframe.columns):
+        values = dataframe.iloc[:, position].to_numpy()
+
+        # Python objects (i.e. ticker) are hashed by their text
+        if values.dtype == object:
+            values = values.astype(str)
+
+        digest.update(str(column).encode())
+        digest.update(np.ascontiguousarray(values).tobytes())
+
+    return digest.hexdigest()
+
+
+class LocalStoreConnector:
+    """
+    Local Store Connector class.
+
+    Stores price data of each ticker and frequency on local disk,
+    as NumPy array file per column, read back as read-only
+    memory-mapped arrays without parsing or copying.
+
+    Each write renames a complete version directory named by content hash
+    into place and replaces metadata pointing to the current version
+    atomically, so that readers never observe partially written
+    price data and arrays memory-mapped by other processes stay intact.
+    """
+
+    def __init__(self, directory: Path = PRCS_DIR) -> None:
+        """
+        Construct Local Store Connector.
+
+        :param directory: Directory to store price data in.
+        """
+
+        self._directory = directory
+
+    def read_metadata(self, ticker: str, frequency: str) -> LocalStoreMetadata | None:
+        """
+        Read metadata of the stored price data.
+
+        :param ticker: Ticker of the stored price data.
+        :param frequency: Frequency of the stored price data.
+        :returns: Metadata or None if no price data is stored.
+        """
+
+        directory = self._get_directory(ticker, frequency)
+
+        try:
+            metadata: LocalStoreMetadata = loads(
+                (directory / "metadata.json").read_text(),
+            )
+
+        except FileNotFoundError:
+            return None
+
+        # Metadata pointing to a version removed by
+        # a concurrent writer is as good as none,
+        # so that price data is written again
+        if not (directory / metadata["version"]).is_dir():
+            return None
+
+        return metadata
+
+    def write_price_data(
+        self,
+        ticker: str,
+        frequency: str,
+        dataframe: pd.DataFrame,
+    ) -> None:
+        """
+        Write price data to the local store, replacing stored price data.
+
+        :param ticker: Ticker of the price data.
+        :param frequency: Frequency of the price data.
+        :param dataframe: Price dataframe to write to the local store.
+        """
+
+        directory = self._get_directory(ticker, frequency)
+
+        version = hash_price_data(dataframe)
+
+        metadata = self.read_metadata(ticker, frequency)
+
+        # Same content is already stored
+        if metadata is not None and metadata["version"] == version:
+            return
+
+        last_record_datetime: pd.Timestamp = dataframe.index[-1]
+
+        metadata = {
+            "version": version,
+            "columns": [str(column) for column in dataframe.columns],
+            "last_record_date": last_record_datetime.strftime(DEFAULT_DATE_FORMAT),
+            "last_record_hash": hash_price_data(dataframe.iloc[-1:]),
+        }
+
+        try:
+            self._write_version(directory, version, dataframe)
+            self._publish_version(directory, version, metadata)
+
+        # Price data was removed by another process
+        # meanwhile, it is written again on the next sync
+        except FileNotFoundError:
+            return
+
+    def _write_version(
+        self,
+        directory: Path,
+        version: str,
+        dataframe: pd.DataFrame,
+    ) -> None:
+        """
+        Write version of price data unless it is already written.
+
+        Files are written to a temporary directory unique to the writer,
+        which is renamed to the version directory once complete,
+        so that version directories are never partially written.
+
+        :param directory: Directory of the ticker and frequency.
+        :param version: Content hash of the price data.
+        :param dataframe: Price dataframe to write.
+        """
+
+        version_directory = directory / version
+
+        # Same content was written by another process
+        if version_directory.is_dir():
+            return
+
+        directory.mkdir(parents=True, exist_ok=True)
+
+        temporary_directory = Path(
+            mkdtemp(prefix=f"{version}.", suffix=".tmp", dir=directory),
+        )
+
+        try:
+            np.save(temporary_directory / "index.npy", dataframe.index.to_numpy())
+
+            for position in range(len(dataframe.columns)):
+                values = dataframe.iloc[:, position].to_numpy()
+
+                # Strings (i.e. ticker) are stored as fixed width
+                # unicode, so that they can be memory-mapped as well
+                if values.dtype == object:
+                    values = values.astype(str)
+
+                np.save(temporary_directory / f"{position}.npy", values)
+
+            temporary_directory.rename(version_directory)
+
+        # Version directory was renamed into place
+        # by another process writing the same content
+        except OSError as error:
+            if error.errno not in {ENOTEMPTY, EEXIST}:
+                raise
+
+        finally:
+            rmtree(temporary_directory, ignore_errors=True)
+
+    def _publish_version(
+        self,
+        directory: Path,
+        version: str,
+        metadata: LocalStoreMetadata,
+    ) -> None:
+        """
+        Point readers to the version and remove versions older than it.
+
+        :param directory: Directory of the ticker and frequency.
+        :param version: Content hash of the published price data.
+        :param metadata: Metadata of the published price data.
+        """
+
+        # Replace metadata atomically,
+        # through a file unique to the writer
+        with NamedTemporaryFile(
+            mode="w",
+            prefix="metadata.",
+            suffix=".tmp",
+            dir=directory,
+            delete=False,
+        ) as temporary_metadata_file:
+            temporary_metadata_file.write(dumps(metadata))
+
+        Path(temporary_metadata_file.name).replace(directory / "metadata.json")
+
+        published_time = (directory / version).stat().st_mtime_ns
+
+        # Metadata may point to a version published by another process meanwhile
+        current_metadata = loads((directory / "metadata.json").read_text())
+
+        # NOTE: versions written after this one, the current one and
+        # temporary directories of writers in progress are kept,
+        # processes that memory-mapped removed versions
+        # keep reading their files until they are done
+        for path in directory.iterdir():
+            if (
+                not path.is_dir()
+                or path.suffix == ".tmp"
+                or path.name in {version, current_metadata["version"]}
+            ):
+                continue
+
+            try:
+                if path.stat().st_mtime_ns < published_time:
+                    rmtree(path, ignore_errors=True)
+
+            # Removed by another process meanwhile
+            except FileNotFoundError:
+                continue
+
+    def read_price_data(
+        self,
+        ticker: str,
+        frequency: str,
+        start_date: str,
+        end_date: str,
+        max_period: bool,
+    ) -> pd.DataFrame | None:
+        """
+        Read price data from the local store.
+
+        :param ticker: Ticker to read prices data for.
+        :param frequency: Frequency of read price data.
+        :param start_date: Start point to read price data from (inclusive).
+        :param end_date: End point until which to read prices data (exclusive).
+        :param max_period: Flag to read the maximum available period of price data.
+        :returns: Dataframe with read-only price data or None if none is stored.
+        """
+
+        metadata = self.read_metadata(ticker, frequency)
+
+        if metadata is None:
+            return None
+
+        version_directory = self._get_directory(ticker, frequency) / metadata["version"]
+
+        try:
+            index = pd.DatetimeIndex(
+                np.load(version_directory / "index.npy", mmap_mode="r"),
+                name="date",
+            )
+
+            columns = {}
+
+            for position, column in enumerate(metadata["columns"]):
+                values = np.asarray(
+                    np.load(version_directory / f"{position}.npy", mmap_mode="r"),
+                )
+
+                columns[column] = (
+                    values.astype(object) if values.dtype.kind == "U" else values
+                )
+
+        # Version was replaced by another process after metadata was read,
+        # or its files are unreadable, price data is read from the database
+        except (FileNotFoundError, ValueError, EOFError):
+            return None
+
+        # NOTE: columns are not consolidated
+        # if they are not copied, each column
+        # keeps viewing its memory-mapped array
+        dataframe = pd.DataFrame(columns, index=index, copy=False)
+
+        if max_period:
+            return dataframe
+
+        # Records are stored in order, so that
+        # the range is a view of the stored records
+        return dataframe.iloc[
+            index.searchsorted(pd.Timestamp(start_date)) : index.searchsorted(
+                pd.Timestamp(end_date),
+            )
+        ]
+
+    def remove_price_data(self, ticker: str, frequency: str) -> None:
+        """
+        Remove price data from the local store.
+
+        :param ticker: Ticker of the price data.
+        :param frequency: Frequency of the price data.
+        """
+
+        rmtree(self._get_directory(ticker, frequency), ignore_errors=True)
+
+    def _get_directory(self, ticker: str, frequency: str) -> Path:
+        """
+        Get directory price data of the ticker and frequency is stored in.
+
+        :param ticker: Ticker of the price data.
+        :param frequency: Frequency of the price data.
+        :returns: Path to the directory.
+        """
+
+        return self._directory / ticker / frequency
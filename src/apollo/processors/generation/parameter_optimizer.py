@@ -1,13 +1,23 @@
 import sys
-from itertools import product
+from collections.abc import Callable, Sequence
+from contextlib import ExitStack
+from functools import partial
+from itertools import groupby
 from json import dumps
 from logging import getLogger
+from math import ceil, inf, prod
 from multiprocessing import Pool
+from time import perf_counter
 
 import pandas as pd
 from numpy import arange
 
-from apollo.backtesters.backtesting_runner import BacktestingRunner
+from apollo.backtesters.backtesting_runner import (
+    BACKTESTING_COLUMNS,
+    BacktestingRunner,
+)
+from apollo.backtesters.native_backtesting_engine import NativeBatchBacktestingEngine
+from apollo.calculators.calculation_cache import CALCULATION_CACHE
 from apollo.connectors.database.postgres_connector import PostgresConnector
 from apollo.core.strategy_catalogue_map import STRATEGY_CATALOGUE_MAP
 from apollo.errors.system_invariants import OptimizedPositionAlreadyExistsError
@@ -16,17 +26,37 @@ from apollo.providers.price_data_enhancer import PriceDataEnhancer
 from apollo.providers.price_data_provider import PriceDataProvider
 from apollo.settings import (
     BACKTESTING_CASH_SIZE,
+    BACKTESTING_ENGINE,
+    DEFAULT_SEARCH_BUDGET,
     END_DATE,
     FREQUENCY,
+    FULL_OPTIMIZATION_RESULTS,
     MAX_PERIOD,
     NO_SIGNAL,
+    OPTIMIZATION_RESULTS_SIZE,
+    SEARCH_BUDGET,
+    SEARCH_MODE,
     START_DATE,
     STRATEGY,
     TICKER,
+    BacktestingEngine,
     ParameterOptimizerMode,
+    SearchMode,
+)
+from apollo.strategies.base.volatility_adjusted_strategy import (
+    VolatilityAdjustedStrategy,
 )
 from apollo.utils.configuration import Configuration
-from apollo.utils.multiprocessing_capable import MultiprocessingCapable
+from apollo.utils.multiprocessing_capable import MultiprocessingCapable, ParallelJob
+from apollo.utils.parameter_grid import ParameterGrid
+from apollo.utils.shared_dataframe import (
+    SharedDataframe,
+    SharedDataframeDescriptor,
+    attach_shared_dataframes,
+    get_shared_dataframe,
+)
+from apollo.utils.top_results import TopResults, get_ranking_key
+from apollo.utils.tree_parzen_estimator import TreeParzenEstimator
 from apollo.utils.types import (
     ParameterCombinations,
     ParameterKeysAndCombinations,
@@ -35,6 +65,42 @@ from apollo.utils.types import (
 
 logger = getLogger(__name__)
 
+# Parameters that only affect trade execution
+# and have no influence on modeled trading signals
+EXECUTION_PARAMETERS = ("sl_volatility_multiplier", "tp_volatility_multiplier")
+
+# Statistics backtesting results are ranked by, in order of importance
+RANKING_STATISTICS = ["Sharpe Ratio", "Return [%]", "# Trades"]
+
+# Number of rounds adaptive search spreads its budget over,
+# each round is proposed based on results of the previous ones
+ADAPTIVE_SEARCH_ROUNDS = 8
+
+# Seed of adaptive search, so that repeated runs propose the same combinations
+ADAPTIVE_SEARCH_SEED = 0
+
+# Number of rungs of successive halving, each backtesting over
+# history longer by the rate, the last one over the whole price data
+SUCCESSIVE_HALVING_RUNGS = 3
+
+# Rate history grows by and sweeps are reduced by between rungs
+SUCCESSIVE_HALVING_RATE = 3
+
+
+def optimize_each_sweep(
+    function: Callable[[ParameterGrid], pd.DataFrame],
+    sweeps: Sequence[ParameterGrid],
+) -> list[pd.DataFrame]:
+    """
+    Optimize parameters over each sweep separately.
+
+    :param function: Function optimizing parameters over combinations.
+    :param sweeps: Sweeps of execution-only parameters to optimize over.
+    :returns: DataFrame with the best backtesting results of each sweep.
+    """
+
+    return [function(sweep) for sweep in sweeps]
+
 
 class ParameterOptimizer(MultiprocessingCapable):
     """
@@ -64,6 +130,15 @@ class ParameterOptimizer(MultiprocessingCapable):
 
         self._operation_mode = operation_mode
 
+        # Backtesting library is used unless configured otherwise
+        self._backtesting_engine = BacktestingEngine(
+            BACKTESTING_ENGINE or BacktestingEngine.BACKTESTING_PY,
+        )
+
+        # Every combination is backtested unless configured otherwise
+        self._search_mode = SearchMode(SEARCH_MODE or SearchMode.EXHAUSTIVE)
+        self._search_budget = int(SEARCH_BUDGET or DEFAULT_SEARCH_BUDGET)
+
         self._configuration = Configuration()
         self._database_connector = PostgresConnector()
         self._price_data_provider = PriceDataProvider()
@@ -112,13 +187,12 @@ class ParameterOptimizer(MultiprocessingCapable):
                     "System invariant violated, previous position not dispatched.",
                 )
 
-            # Iterate over each strategy in the catalogue
-            for strategy in STRATEGY_CATALOGUE_MAP:
-                # And optimize each
-                self._run_optimization_process(
-                    ticker=screened_position.ticker,
-                    strategy=strategy,
-                )
+            # Optimize each strategy in the catalogue
+            # within the same pool of processes
+            self._run_optimization_process(
+                ticker=screened_position.ticker,
+                strategies=list(STRATEGY_CATALOGUE_MAP),
+            )
 
             # Update the screened position to optimized
             self._database_connector.update_position_by_status(
@@ -140,17 +214,338 @@ class ParameterOptimizer(MultiprocessingCapable):
     def _run_optimization_process(
         self,
         ticker: str = str(TICKER),
-        strategy: str = str(STRATEGY),
+        strategies: list[str] | None = None,
     ) -> None:
         """
         Run the optimization process for single or multiple strategies.
 
+        All strategies are optimized within a single pool of processes,
+        so that processes are spawned once for the whole catalogue
+        and processes done with one strategy pick up work of the others.
+
         :param ticker: Ticker symbol.
-        :param strategy: Strategy name.
+        :param strategies: Strategy names, configured strategy if not provided.
+        """
+
+        strategies = strategies or [str(STRATEGY)]
+
+        keys_by_strategy: dict[str, list[str]] = {}
+
+        with ExitStack() as stack:
+            jobs: list[ParallelJob] = []
+            signal_radices: list[list[int]] = []
+            shared_price_dataframes: dict[str, SharedDataframeDescriptor] = {}
+
+            for strategy in strategies:
+                # Get parameter set for the strategy
+                parameter_set = self._configuration.get_parameter_set(strategy)
+
+                # Publish the price data once for all processes,
+                # instead of pickling it into arguments of each batch
+                shared_price_dataframes[strategy] = stack.enter_context(
+                    SharedDataframe(
+                        self._get_price_dataframe(ticker, strategy, parameter_set),
+                    ),
+                )
+
+                # Build keys and combinations of parameters to optimize
+                keys, combinations = self._construct_parameter_combinations(
+                    parameter_set,
+                )
+                keys_by_strategy[strategy] = keys
+
+                signal_radices.append(
+                    self._get_signal_radices(parameter_set, keys),
+                )
+
+                # NOTE: batches of either scheduling mode hold whole sweeps
+                # of execution-only parameters, so that signals modeled
+                # for the sweep are not modeled again in another process
+                jobs.append(
+                    {
+                        "function": partial(
+                            self._optimize_parameters_on_shared_data,
+                            strategy_name=strategy,
+                            parameter_set=parameter_set,
+                            keys=keys,
+                        ),
+                        # NOTE: combinations are generated lazily,
+                        # each batch only carries bounds of its slice
+                        "inputs": combinations,
+                        "granularity": self._get_sweep_size(parameter_set),
+                    },
+                )
+
+            pool = stack.enter_context(
+                Pool(
+                    processes=self._available_cores,
+                    initializer=attach_shared_dataframes,
+                    initargs=(shared_price_dataframes,),
+                ),
+            )
+
+            # Backtest batches of parameter combinations of all strategies,
+            # either all of them or only those selected by the search mode
+            if self._search_mode == SearchMode.ADAPTIVE:
+                results = self._search_adaptively(pool, jobs, signal_radices)
+
+            elif self._search_mode == SearchMode.SUCCESSIVE_HALVING:
+                results = self._search_successive_halving(pool, jobs)
+
+            else:
+                results = self._process_jobs_in_parallel(pool, jobs)
+
+        for strategy, strategy_results in zip(strategies, results, strict=True):
+            results_dataframe = pd.concat(strategy_results)
+
+            # Searched combinations may all be without signals,
+            # most likely with small budget of adaptive search
+            if results_dataframe.empty:
+                logger.warning(
+                    f"No backtesting results for {strategy}, nothing to output.",
+                )
+
+                continue
+
+            # Describe the best combinations with parameter names
+            results_dataframe["parameters"] = results_dataframe.pop(
+                "combination",
+            ).map(
+                lambda combination, keys=keys_by_strategy[strategy]: str(
+                    dict(zip(keys, combination, strict=True)),
+                ),
+            )
+
+            # Output the concatenated best results
+            # from each process to the database
+            self._output_results(
+                ticker=ticker,
+                strategy=strategy,
+                results_dataframe=results_dataframe,
+            )
+
+    def _search_adaptively(
+        self,
+        pool: Pool,
+        jobs: list[ParallelJob],
+        signal_radices: list[list[int]],
+    ) -> list[list[pd.DataFrame]]:
+        """
+        Backtest budget of parameter combinations focused on promising regions.
+
+        Combinations of signal-affecting parameters are proposed
+        by Tree-structured Parzen Estimator in rounds, each backtested
+        along with its whole sweep of execution-only parameters.
+
+        Proposals of all jobs in a round are processed in parallel,
+        then the best result of each sweep is observed by its estimator.
+
+        :param pool: Pool of processes to process proposals with.
+        :param jobs: Jobs with grids of combinations to search.
+        :param signal_radices: Number of values of each signal-affecting parameter.
+        :returns: DataFrames with the best backtesting results of each sweep, per job.
+        """
+
+        estimators = [
+            TreeParzenEstimator(radices, seed=ADAPTIVE_SEARCH_SEED)
+            for radices in signal_radices
+        ]
+
+        round_size = ceil(self._search_budget / ADAPTIVE_SEARCH_ROUNDS)
+
+        results: list[list[pd.DataFrame]] = [[] for _ in jobs]
+
+        for search_round in range(1, ADAPTIVE_SEARCH_ROUNDS + 1):
+            proposals = [
+                estimator.propose(min(round_size, self._search_budget - len(estimator)))
+                for estimator in estimators
+            ]
+
+            # Budget is spent or every combination is backtested
+            if not any(proposals):
+                break
+
+            round_results = self._process_sweeps_in_parallel(pool, jobs, proposals)
+
+            for estimator, job_proposals, job_results, sweep_results in zip(
+                estimators,
+                proposals,
+                results,
+                round_results,
+                strict=True,
+            ):
+                for index, sweep_result in zip(
+                    job_proposals,
+                    sweep_results,
+                    strict=True,
+                ):
+                    estimator.observe(index, self._get_sweep_score(sweep_result))
+
+                job_results.extend(sweep_results)
+
+            logger.info(
+                f"Adaptive search round {search_round} complete. "
+                f"Backtested sweeps: {[len(estimator) for estimator in estimators]}",
+            )
+
+        return results
+
+    def _search_successive_halving(
+        self,
+        pool: Pool,
+        jobs: list[ParallelJob],
+    ) -> list[list[pd.DataFrame]]:
+        """
+        Backtest parameter combinations over growing history, promoting the best.
+
+        Every combination of signal-affecting parameters is backtested
+        along with its whole sweep of execution-only parameters over
+        the most recent slice of the price data first; only the best
+        fraction of them is promoted to the next, longer slice,
+        until finalists are backtested over the whole price data.
+
+        Sweeps of all jobs in a rung are processed in parallel.
+
+        :param pool: Pool of processes to process sweeps with.
+        :param jobs: Jobs with grids of combinations to search.
+        :returns: DataFrames with the best results of each finalist sweep, per job.
+        """
+
+        results: list[list[pd.DataFrame]] = []
+
+        # All sweeps enter the first rung
+        survivors = [
+            list(range(len(job["inputs"]) // job["granularity"])) for job in jobs
+        ]
+
+        for rung in range(1, SUCCESSIVE_HALVING_RUNGS + 1):
+            # Each rung backtests over history longer by the rate,
+            # the last one over the whole price data
+            history_fraction = float(
+                SUCCESSIVE_HALVING_RATE ** (rung - SUCCESSIVE_HALVING_RUNGS),
+            )
+
+            started = perf_counter()
+
+            results = self._process_sweeps_in_parallel(
+                pool,
+                jobs,
+                survivors,
+                history_fraction=history_fraction,
+            )
+
+            backtested_sweeps = [len(job_survivors) for job_survivors in survivors]
+
+            # Promote the best fraction of sweeps (none from the last rung),
+            # ranked the same way results are ranked on output
+            if rung < SUCCESSIVE_HALVING_RUNGS:
+                survivors = [
+                    [
+                        index
+                        for index, _ in sorted(
+                            zip(job_survivors, sweep_results, strict=True),
+                            key=lambda survivor: self._get_sweep_score(survivor[1]),
+                            reverse=True,
+                        )[: ceil(len(job_survivors) / SUCCESSIVE_HALVING_RATE)]
+                    ]
+                    for job_survivors, sweep_results in zip(
+                        survivors,
+                        results,
+                        strict=True,
+                    )
+                ]
+
+            logger.info(
+                f"Successive halving rung {rung} complete. "
+                f"History fraction: {history_fraction:.3f}, "
+                f"backtested sweeps: {backtested_sweeps}, "
+                f"surviving sweeps: {[len(job_sweeps) for job_sweeps in survivors]}, "
+                f"time: {perf_counter() - started:.2f}s",
+            )
+
+        # Only results of finalists backtested
+        # over the whole price data are output
+        return results
+
+    def _process_sweeps_in_parallel(
+        self,
+        pool: Pool,
+        jobs: list[ParallelJob],
+        sweeps: list[list[int]],
+        history_fraction: float = 1.0,
+    ) -> list[list[pd.DataFrame]]:
+        """
+        Backtest selected sweeps of each job in parallel.
+
+        :param pool: Pool of processes to process sweeps with.
+        :param jobs: Jobs with grids of combinations.
+        :param sweeps: Indices of sweeps to backtest, per job.
+        :param history_fraction: Most recent fraction of price data to backtest over.
+        :returns: DataFrame with the best backtesting results of each sweep, per job.
+        """
+
+        results = self._process_jobs_in_parallel(
+            pool,
+            [
+                {
+                    "function": partial(
+                        optimize_each_sweep,
+                        partial(job["function"], history_fraction=history_fraction),
+                    ),
+                    # Combination of signal-affecting parameters
+                    # spans the whole sweep of execution-only parameters
+                    "inputs": [
+                        job["inputs"][
+                            index * job["granularity"] : (index + 1)
+                            * job["granularity"]
+                        ]
+                        for index in job_sweeps
+                    ],
+                    "granularity": 1,
+                }
+                for job, job_sweeps in zip(jobs, sweeps, strict=True)
+            ],
+        )
+
+        # Flatten results of batches back to results of each sweep
+        return [
+            [
+                sweep_result
+                for batch_results in job_results
+                for sweep_result in batch_results
+            ]
+            for job_results in results
+        ]
+
+    def _get_sweep_score(self, sweep_result: pd.DataFrame) -> tuple[float, ...]:
+        """
+        Get score of the sweep by its best result.
+
+        :param sweep_result: DataFrame with the best results of the sweep.
+        :returns: Ranking key of the best result, the lowest if there is none.
         """
 
-        # Get parameter set for the strategy
-        parameter_set = self._configuration.get_parameter_set(strategy)
+        # Sweep results are ranked from the best,
+        # sweeps without results (or signals) are the worst
+        if not len(sweep_result):
+            return (-inf,) * len(RANKING_STATISTICS)
+
+        return get_ranking_key(sweep_result.iloc[0], RANKING_STATISTICS)
+
+    def _get_price_dataframe(
+        self,
+        ticker: str,
+        strategy: str,
+        parameter_set: ParameterSet,
+    ) -> pd.DataFrame:
+        """
+        Get price data enhanced for the strategy.
+
+        :param ticker: Ticker symbol.
+        :param strategy: Strategy name.
+        :param parameter_set: Parameter specifications.
+        :returns: Dataframe with enhanced price data.
+        """
 
         period = "Maximum available" if MAX_PERIOD else f"{START_DATE} - {END_DATE}"
         logger.info(
@@ -179,38 +574,47 @@ class ParameterOptimizer(MultiprocessingCapable):
             ]
 
         # Enhance the price data based on the configuration
-        price_dataframe = self._price_data_enhancer.enhance_price_data(
+        return self._price_data_enhancer.enhance_price_data(
             price_dataframe,
             parameter_set["additional_data_enhancers"],
         )
 
-        # Build keys and combinations of parameters to optimize
-        keys, combinations = self._construct_parameter_combinations(
-            parameter_set,
-        )
+    def _optimize_parameters_on_shared_data(
+        self,
+        combinations: ParameterCombinations,
+        strategy_name: str,
+        parameter_set: ParameterSet,
+        keys: list[str],
+        history_fraction: float = 1.0,
+    ) -> pd.DataFrame:
+        """
+        Run the optimization process over price data shared with this process.
 
-        # Break down combinations into equal batches
-        batches = self._create_batches(combinations)
+        :param combinations: Iterable of tuples with parameter combinations.
+        :param strategy_name: Strategy name.
+        :param parameter_set: parameter specifications.
+        :param keys: List of parameter keys.
+        :param history_fraction: Most recent fraction of price data to backtest over.
 
-        # Create arguments to supply to each process
-        batch_arguments = [
-            (strategy, batch, price_dataframe, parameter_set, keys) for batch in batches
-        ]
+        :returns: DataFrame with backtesting results.
+        """
 
-        # Process each batch in parallel
-        with Pool(processes=self._available_cores) as pool:
-            # Backtest each batch of parameter combinations
-            results = pool.starmap(self._optimize_parameters, batch_arguments)
+        price_dataframe = get_shared_dataframe(strategy_name)
 
-            # Concatenate the results from each process
-            combined_results = pd.concat(results)
+        # Shorter history is only a cheaper approximation
+        # used to discard bad combinations early
+        if history_fraction < 1.0:
+            price_dataframe = price_dataframe.iloc[
+                -ceil(len(price_dataframe) * history_fraction) :
+            ]
 
-            # Output the results to the database
-            self._output_results(
-                ticker=ticker,
-                strategy=strategy,
-                results_dataframe=combined_results,
-            )
+        return self._optimize_parameters(
+            strategy_name=strategy_name,
+            combinations=combinations,
+            price_dataframe=price_dataframe,
+            parameter_set=parameter_set,
+            keys=keys,
+        )
 
     def _optimize_parameters(
         self,
@@ -223,18 +627,25 @@ class ParameterOptimizer(MultiprocessingCapable):
         """
         Run the optimization process.
 
+        Model trading signals once per combination of signal-affecting parameters
+        and backtest them over the sweep of execution-only parameters.
+
         :param strategy_name: Strategy name.
         :param combinations: Iterable of tuples with parameter combinations.
         :param price_dataframe: Dataframe with price data.
         :param parameter_set: parameter specifications.
         :param keys: List of parameter keys.
 
-        :returns: DataFrame with backtesting results.
+        :returns: DataFrame with the best backtesting results.
         """
 
-        # Initialize the results dataframe
-        # to supply to each backtesting process
-        results_dataframe = pd.DataFrame()
+        # Keep only the best results as they are produced,
+        # unless the full results table is requested,
+        # so that memory and the results sent back stay small
+        top_results = TopResults(
+            ranking_statistics=RANKING_STATISTICS,
+            max_size=None if FULL_OPTIMIZATION_RESULTS else OPTIMIZATION_RESULTS_SIZE,
+        )
 
         # Instantiate the strategy class by typecasting
         # the strategy name from configuration to the corresponding class
@@ -244,20 +655,55 @@ class ParameterOptimizer(MultiprocessingCapable):
             {},
         )
 
-        # Iterate over each combination of parameters
-        for combination in combinations:
+        # Indices of parameters that affect the signals,
+        # execution-only parameters are swept over modeled signals
+        signal_indices = [
+            index for index, key in enumerate(keys) if key not in EXECUTION_PARAMETERS
+        ]
+
+        # Materialize combinations of the batch, as they are iterated twice,
+        # once to precalculate indicators and once to backtest them
+        combinations = list(combinations)
+
+        # Precalculate indicators for all window sizes at once,
+        # so that modeling signals of each combination reads them from cache
+        self._precalculate_indicators(
+            strategy_class=strategy_class,
+            combinations=combinations,
+            price_dataframe=price_dataframe,
+            parameter_set=parameter_set,
+            signal_keys=[keys[i] for i in signal_indices],
+            signal_indices=signal_indices,
+        )
+
+        # Group consecutive combinations sharing signal-affecting parameters
+        #
+        # NOTE: combinations are ordered with execution-only parameters last
+        # and batches are cut at sweep boundaries, so each group
+        # holds the whole execution parameters sweep
+        signal_groups = groupby(
+            combinations,
+            key=lambda combination: tuple(combination[i] for i in signal_indices),
+        )
+
+        # Iterate over each combination of signal-affecting parameters
+        for signal_combination, execution_combinations in signal_groups:
             # We copy the dataframe to have a clean
             # set of prices for each combination we are testing
             dataframe_to_test = price_dataframe.copy()
 
             # Construct back a dictionary with parameter names and values
-            combination_to_test = {
-                **dict(zip(keys, combination)),
-            }
+            signal_parameters = dict(
+                zip(
+                    [keys[i] for i in signal_indices],
+                    signal_combination,
+                    strict=True,
+                ),
+            )
 
             # Extract the strategy-specific parameters
             strategy_specific_parameters = {
-                key: combination_to_test[key]
+                key: signal_parameters[key]
                 for key in parameter_set["strategy_specific_parameters"]
             }
 
@@ -275,7 +721,7 @@ class ParameterOptimizer(MultiprocessingCapable):
             try:
                 strategy_instance = strategy_class(
                     dataframe=dataframe_to_test,
-                    window_size=int(combination_to_test["window_size"]),
+                    window_size=int(signal_parameters["window_size"]),
                     **strategy_specific_parameters,
                 )
 
@@ -284,38 +730,157 @@ class ParameterOptimizer(MultiprocessingCapable):
                 logger.exception("Parameters misconfigured, see traceback")
                 sys.exit(1)
 
-            # Model the trading signals
+            # Model the trading signals (and ATR) once
+            # for the whole execution parameters sweep
             strategy_instance.model_trading_signals()
 
-            # Skip this run if there are no signals
+            # Skip the whole sweep if there are no signals
             if (dataframe_to_test["signal"] == NO_SIGNAL).all():
                 continue
 
-            # Instantiate the backtesting runner and run the backtesting process
-            backtesting_runner = BacktestingRunner(
-                dataframe=dataframe_to_test,
-                strategy_name=strategy_name,
-                lot_size_cash=BACKTESTING_CASH_SIZE,
-                sl_volatility_multiplier=combination_to_test[
-                    "sl_volatility_multiplier"
-                ],
-                tp_volatility_multiplier=combination_to_test[
-                    "tp_volatility_multiplier"
-                ],
+            # Native engine ranks the whole sweep in a single batched pass,
+            # so that only its best combination is fully backtested
+            #
+            # NOTE: results are ranked the same way on output,
+            # therefore, no other combination of the sweep can be the best one
+            #
+            # NOTE: full results table holds every combination,
+            # hence, if requested, the whole sweep is fully backtested
+            #
+            # NOTE: batched pass yields ranking statistics only,
+            # while written results hold every statistic (drawdowns,
+            # exposure, win rate, etc.), hence the best combination
+            # is run once more by the single-run engine
+            execution_sweep = list(execution_combinations)
+
+            if (
+                self._backtesting_engine == BacktestingEngine.NATIVE
+                and not FULL_OPTIMIZATION_RESULTS
+            ):
+                execution_sweep = self._rank_execution_combinations(
+                    dataframe_to_test,
+                    keys,
+                    execution_sweep,
+                )[:1]
+
+            sl_index = keys.index("sl_volatility_multiplier")
+            tp_index = keys.index("tp_volatility_multiplier")
+
+            # Sweep execution-only parameters over modeled signals
+            for combination in execution_sweep:
+                # Instantiate the backtesting runner and run the backtesting process
+                #
+                # NOTE: backtesting process does not modify supplied dataframe,
+                # therefore it is safe to reuse it across the sweep
+                backtesting_runner = BacktestingRunner(
+                    dataframe=dataframe_to_test,
+                    strategy_name=strategy_name,
+                    lot_size_cash=BACKTESTING_CASH_SIZE,
+                    sl_volatility_multiplier=combination[sl_index],
+                    tp_volatility_multiplier=combination[tp_index],
+                    engine=self._backtesting_engine,
+                )
+
+                stats = backtesting_runner.run()
+
+                # Preserve the parameters used for this run,
+                # as values only, they are named once results are merged
+                stats["combination"] = combination
+
+                top_results.add(stats)
+
+        # Report how much work the calculation cache saved in this process
+        logger.debug(f"Calculation cache statistics: {CALCULATION_CACHE.statistics}")
+
+        return top_results.to_dataframe()
+
+    def _precalculate_indicators(
+        self,
+        strategy_class: type[VolatilityAdjustedStrategy],
+        combinations: ParameterCombinations,
+        price_dataframe: pd.DataFrame,
+        parameter_set: ParameterSet,
+        signal_keys: list[str],
+        signal_indices: list[int],
+    ) -> None:
+        """
+        Precalculate indicators of the strategy for every window size at once.
+
+        Window-independent intermediates of batch calculators
+        are calculated once instead of once per window size.
+
+        :param strategy_class: Strategy class.
+        :param combinations: Iterable of tuples with parameter combinations.
+        :param price_dataframe: Dataframe with price data.
+        :param parameter_set: parameter specifications.
+        :param signal_keys: Keys of signal-affecting parameters.
+        :param signal_indices: Indices of signal-affecting parameters.
+        """
+
+        # Distinct combinations of signal-affecting parameters,
+        # each one spans the whole sweep of execution-only parameters
+        signal_combinations = [
+            dict(zip(signal_keys, signal_combination, strict=True))
+            for signal_combination in dict.fromkeys(
+                tuple(combination[i] for i in signal_indices)
+                for combination in combinations
             )
+        ]
 
-            stats = backtesting_runner.run()
+        strategy_class.precalculate_indicators(
+            dataframe=price_dataframe,
+            window_sizes=sorted(
+                {
+                    int(signal_parameters["window_size"])
+                    for signal_parameters in signal_combinations
+                },
+            ),
+            strategy_specific_parameters=[
+                {
+                    key: signal_parameters[key]
+                    for key in parameter_set["strategy_specific_parameters"]
+                }
+                for signal_parameters in signal_combinations
+            ],
+        )
 
-            # Construct a Dataframe with the results of this run
-            this_run_results = pd.DataFrame(stats).transpose()
+    def _rank_execution_combinations(
+        self,
+        dataframe: pd.DataFrame,
+        keys: list[str],
+        execution_combinations: list[tuple[float, ...]],
+    ) -> list[tuple[float, ...]]:
+        """
+        Rank sweep of execution-only parameters in a single batched pass.
 
-            # Preserve the parameters used for this run
-            this_run_results["parameters"] = str(combination_to_test)
+        :param dataframe: Dataframe with modeled signals.
+        :param keys: List of parameter keys.
+        :param execution_combinations: Combinations sharing modeled signals.
 
-            # Append the results of this run to the results dataframe
-            results_dataframe = pd.concat([results_dataframe, this_run_results])
+        :returns: Combinations ordered from the best to the worst.
+        """
 
-        return results_dataframe
+        sl_index = keys.index("sl_volatility_multiplier")
+        tp_index = keys.index("tp_volatility_multiplier")
+
+        # Rename price columns of a copy, as backtesting runner does,
+        # so that the dataframe of the caller is left intact
+        dataframe = dataframe.rename(columns=BACKTESTING_COLUMNS)
+
+        sweep_results = NativeBatchBacktestingEngine(
+            dataframe=dataframe,
+            lot_size_cash=BACKTESTING_CASH_SIZE,
+            sl_volatility_multipliers=[
+                combination[sl_index] for combination in execution_combinations
+            ],
+            tp_volatility_multipliers=[
+                combination[tp_index] for combination in execution_combinations
+            ],
+        ).run()
+
+        sweep_results.sort_values(RANKING_STATISTICS, ascending=False, inplace=True)
+
+        return [execution_combinations[index] for index in sweep_results.index]
 
     def _construct_parameter_combinations(
         self,
@@ -339,8 +904,65 @@ class ParameterOptimizer(MultiprocessingCapable):
             if (isinstance(value, dict) and "range" in value)
         }
 
-        # Generate all possible combinations of parameter values
-        return list(parameter_ranges.keys()), product(*parameter_ranges.values())
+        # Order execution-only parameters last, so that
+        # each combination of signal-affecting parameters
+        # is followed by its sweep of execution-only parameters
+        parameter_ranges = dict(
+            sorted(
+                parameter_ranges.items(),
+                key=lambda item: item[0] in EXECUTION_PARAMETERS,
+            ),
+        )
+
+        # Generate all possible combinations of parameter values lazily
+        return list(parameter_ranges.keys()), ParameterGrid(
+            [values.tolist() for values in parameter_ranges.values()],
+        )
+
+    def _get_sweep_size(self, parameter_set: ParameterSet) -> int:
+        """
+        Get number of execution-only parameter combinations in each sweep.
+
+        :param parameter_set: TypedDict with parameter specifications.
+        :returns: Number of combinations swept over each modeled signals.
+        """
+
+        return prod(
+            len(
+                self._get_combination_ranges(
+                    parameter_set[key]["range"][0],
+                    parameter_set[key]["range"][1],
+                    parameter_set[key]["step"],
+                ),
+            )
+            for key in EXECUTION_PARAMETERS
+            if key in parameter_set
+        )
+
+    def _get_signal_radices(
+        self,
+        parameter_set: ParameterSet,
+        keys: list[str],
+    ) -> list[int]:
+        """
+        Get number of values of each signal-affecting parameter.
+
+        :param parameter_set: TypedDict with parameter specifications.
+        :param keys: List of parameter keys.
+        :returns: Number of values of each signal-affecting parameter, in order of keys.
+        """
+
+        return [
+            len(
+                self._get_combination_ranges(
+                    parameter_set[key]["range"][0],
+                    parameter_set[key]["range"][1],
+                    parameter_set[key]["step"],
+                ),
+            )
+            for key in keys
+            if key not in EXECUTION_PARAMETERS
+        ]
 
     def _get_combination_ranges(
         self,
@@ -378,7 +1000,7 @@ class ParameterOptimizer(MultiprocessingCapable):
 
         # Sort the results by sharpe ratio, total return, and number of trades
         results_dataframe.sort_values(
-            ["Sharpe Ratio", "Return [%]", "# Trades"],
+            RANKING_STATISTICS,
             ascending=False,
             inplace=True,
         )
@@ -10,6 +10,7 @@ from apollo.calculators.kaufman_efficiency_ratio import (
     KaufmanEfficiencyRatioCalculator,
 )
 from apollo.connectors.api.yahoo_api_connector import YahooApiConnector
+from apollo.connectors.database.influxdb_connector import close_influxdb_clients
 from apollo.connectors.database.postgres_connector import PostgresConnector
 from apollo.errors.api import EmptyYahooApiResponseError
 from apollo.errors.system_invariants import ScreenedPositionAlreadyExistsError
@@ -118,15 +119,16 @@ class TickerScreener(MultiprocessingCapable):
             self._sp500_components_scraper.scrape_sp500_components()
         )
 
-        # Break down tickers into equal batches
-        batches = self._create_batches(sp500_components_tickers)
-
-        # Process each batch in parallel
+        # Process batches of tickers in parallel
         with Pool(processes=self._available_cores) as pool:
             # Request prices and
             # earnings date and calculate
             # measures for each ticker in the batch
-            results = pool.map(self._calculate_measures, batches)
+            results = self._process_in_parallel(
+                pool,
+                self._calculate_measures,
+                sp500_components_tickers,
+            )
 
             # Combine the computed results
             combined_results = pd.concat(results)
@@ -230,6 +232,10 @@ class TickerScreener(MultiprocessingCapable):
 
                 continue
 
+        # Pool workers exit without running exit handlers,
+        # hence connections reused across the batch are released here
+        close_influxdb_clients()
+
         return results_dataframe
 
     def _select_suitable_ticker(self, results_dataframe: pd.DataFrame) -> str:
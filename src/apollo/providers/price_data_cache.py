@@ -0,0 +1,184 @@
+from collections import OrderedDict
+from collections.abc import Hashable
+from time import monotonic
+from typing import TypedDict
+
+import numpy as np
+import pandas as pd
+
+from apollo.settings import PRICE_DATA_CACHE_SIZE, PRICE_DATA_CACHE_TTL
+
+
+class PriceDataCacheStatistics(TypedDict):
+    """Price data cache statistics type definition."""
+
+    hits: int
+    misses: int
+    expirations: int
+    evictions: int
+    size: int
+
+
+class PriceDataCache:
+    """
+    Price Data Cache class.
+
+    In-process, bounded, least recently used
+    cache of price dataframes with time to live.
+
+    Cached dataframes hold read-only columns, callers get
+    shallow copies of them, so that columns can be added
+    to the copies, yet cached prices cannot be modified.
+    """
+
+    def __init__(self, max_size: int, time_to_live: float) -> None:
+        """
+        Construct Price Data Cache.
+
+        :param max_size: Maximum number of entries to keep.
+        :param time_to_live: Seconds after which entries expire.
+        """
+
+        self._max_size = max_size
+        self._time_to_live = time_to_live
+
+        # NOTE: entries hold expiration time
+        # along with the cached dataframe
+        self._entries: OrderedDict[Hashable, tuple[float, pd.DataFrame]] = OrderedDict()
+
+        self._hits = 0
+        self._misses = 0
+        self._expirations = 0
+        self._evictions = 0
+
+    @property
+    def statistics(self) -> PriceDataCacheStatistics:
+        """
+        Get hit, miss, expiration and eviction counters along with current size.
+
+        :returns: Price data cache statistics.
+        """
+
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "expirations": self._expirations,
+            "evictions": self._evictions,
+            "size": len(self._entries),
+        }
+
+    def get(self, key: Hashable) -> pd.DataFrame | None:
+        """
+        Get cached price data and mark it as recently used.
+
+        :param key: Price data key.
+        :returns: Read-only view of price data or None if not cached or expired.
+        """
+
+        entry = self._entries.get(key)
+
+        if entry is not None and entry[0] <= monotonic():
+            del self._entries[key]
+            self._expirations += 1
+
+            entry = None
+
+        if entry is None:
+            self._misses += 1
+
+            return None
+
+        self._hits += 1
+        self._entries.move_to_end(key)
+
+        return entry[1].copy(deep=False)
+
+    def put(self, key: Hashable, dataframe: pd.DataFrame) -> pd.DataFrame:
+        """
+        Cache price data, evicting the least recently used entries.
+
+        :param key: Price data key.
+        :param dataframe: Price data to cache.
+        :returns: Read-only view of cached price data.
+        """
+
+        columns = {}
+
+        # Copy columns into read-only arrays,
+        # so they cannot be modified through the views
+        for position, column in enumerate(dataframe.columns):
+            series = dataframe.iloc[:, position]
+
+            # Extension types have no flags to set
+            if not isinstance(series.dtype, np.dtype):
+                columns[column] = series.array.copy()
+
+                continue
+
+            values = series.to_numpy()
+
+            # NOTE: read-only arrays (i.e. memory-mapped from the local store)
+            # are kept as they are, copying them would lose zero-copy reads
+            if not self._is_read_only(values):
+                values = values.copy()
+                values.setflags(write=False)
+
+            columns[column] = values
+
+        # NOTE: columns are not consolidated
+        # if they are not copied, each column
+        # keeps its own read-only array
+        cached_dataframe = pd.DataFrame(columns, index=dataframe.index, copy=False)
+
+        # Nothing to keep
+        # if caching is disabled
+        if self._max_size < 1:
+            return cached_dataframe
+
+        self._entries[key] = (monotonic() + self._time_to_live, cached_dataframe)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+        return cached_dataframe.copy(deep=False)
+
+    @staticmethod
+    def _is_read_only(values: np.ndarray) -> bool:
+        """
+        Check if array cannot be modified, neither directly nor through its base.
+
+        :param values: Array to check.
+        :returns: Boolean indicating if array is read-only.
+        """
+
+        base: object = values
+
+        # Read-only view of writable array
+        # changes along with the array
+        while isinstance(base, np.ndarray):
+            if base.flags.writeable:
+                return False
+
+            base = base.base
+
+        return True
+
+    def clear(self) -> None:
+        """Remove all entries and reset counters."""
+
+        self._entries.clear()
+
+        self._hits = 0
+        self._misses = 0
+        self._expirations = 0
+        self._evictions = 0
+
+
+# Process-wide price data cache,
+# each worker process holds its own
+PRICE_DATA_CACHE = PriceDataCache(
+    max_size=PRICE_DATA_CACHE_SIZE,
+    time_to_live=PRICE_DATA_CACHE_TTL,
+)
@@ -1,15 +1,38 @@
-from datetime import datetime
+from datetime import date, datetime, timedelta
 from logging import getLogger
+from typing import cast
+from zoneinfo import ZoneInfo
 
+import numpy as np
 import pandas as pd
 
 from apollo.connectors.api.yahoo_api_connector import YahooApiConnector
 from apollo.connectors.database.influxdb_connector import InfluxDbConnector
-from apollo.settings import DEFAULT_DATE_FORMAT
+from apollo.connectors.database.local_store_connector import (
+    LocalStoreConnector,
+    hash_price_data,
+)
+from apollo.providers.price_data_cache import PRICE_DATA_CACHE
+from apollo.settings import (
+    DEFAULT_DATE_FORMAT,
+    EXCHANGE,
+    EXCHANGE_TIME_ZONE_AND_HOURS,
+    PRICE_DATA_STORE,
+    PriceDataStore,
+)
 from apollo.utils.price_data_availability_helper import PriceDataAvailabilityHelper
 
 logger = getLogger(__name__)
 
+# Number of days before the last record
+# to request along with new records, so that
+# adjustment of already stored records can be verified
+PRICE_DATA_OVERLAP_DAYS = 7
+
+# Relative difference of adjustment factors
+# tolerated before records are considered re-adjusted
+ADJUSTMENT_FACTOR_TOLERANCE = 1e-4
+
 
 class PriceDataProvider:
     """
@@ -28,6 +51,12 @@ class PriceDataProvider:
         self._api_connector = YahooApiConnector()
         self._database_connector = InfluxDbConnector()
 
+        # Local store is an optional tier
+        # in front of the database
+        self._local_store_connector = (
+            LocalStoreConnector() if PRICE_DATA_STORE == PriceDataStore.LOCAL else None
+        )
+
     def get_price_data(
         self,
         ticker: str,
@@ -42,6 +71,13 @@ class PriceDataProvider:
         If price data is missing from storage, prepare dataframe
         for consistency, adjust price values and save to storage.
 
+        If stored price data is outdated, append only newer records,
+        unless a corporate action re-adjusted the stored ones.
+
+        Price data is cached within the process for a limited time,
+        returned dataframes are read-only views, columns can be added to them,
+        but existing values cannot be modified.
+
         :param ticker: Ticker to provide prices data for.
         :param frequency: Frequency of provided price data.
         :param start_date: Start point to provide price data from (inclusive).
@@ -55,6 +91,17 @@ class PriceDataProvider:
             end_date=end_date,
         )
 
+        # Price data requested earlier in this process
+        # is served without querying storage or API
+        cache_key = (ticker, frequency, start_date, end_date, max_period)
+
+        cached_price_data = PRICE_DATA_CACHE.get(cache_key)
+
+        if cached_price_data is not None:
+            logger.info(f"{ticker} price data read from cache.")
+
+            return cached_price_data
+
         price_data: pd.DataFrame
 
         last_record_date = self._database_connector.get_last_record_date(
@@ -72,35 +119,30 @@ class PriceDataProvider:
             )
         )
 
-        if price_data_needs_update:
-            price_data = self._api_connector.request_price_data(
+        # Stored prices are only rewritten as a whole
+        # if there are none or a corporate action changed them,
+        # otherwise, only records after the last one are appended
+        price_data_needs_rewrite = price_data_needs_update and (
+            last_record_date is None
+            or not self._append_price_data(
                 ticker=ticker,
                 frequency=frequency,
-                start_date=start_date,
-                end_date=end_date,
-                max_period=max_period,
-            )
-
-            # At this point in time,
-            # if prices were requested intraday
-            # Yahoo Finance API sporadically returns an intraday close
-            # which is undesirable, since it leads to data inconsistency.
-            # If it is the case, we remove the last record from the dataframe.
-            last_queried_datetime: datetime = price_data.index[-1]
-            last_queried_date = last_queried_datetime.date()
-
-            price_data_includes_intraday = (
-                PriceDataAvailabilityHelper.check_if_price_data_includes_intraday(
-                    last_queried_date,
-                )
+                last_record_date=last_record_date,
             )
+        )
 
-            if price_data_includes_intraday:
-                price_data.drop(index=last_queried_date, inplace=True)
+        if price_data_needs_rewrite:
+            # NOTE: corporate action re-adjusts every stored record,
+            # hence the whole history is requested and rewritten,
+            # so that stored prices share the same adjustment
+            rewrite_history = last_record_date is not None
 
-            price_data = self._prepare_price_data(
-                dataframe=price_data,
+            price_data = self._request_price_data(
                 ticker=ticker,
+                frequency=frequency,
+                start_date=start_date,
+                end_date=end_date,
+                max_period=max_period or rewrite_history,
             )
 
             self._database_connector.write_price_data(
@@ -108,21 +150,328 @@ class PriceDataProvider:
                 dataframe=price_data,
             )
 
+            # Only the requested range is provided
+            if rewrite_history and not max_period:
+                price_data = price_data[
+                    (price_data.index >= pd.Timestamp(start_date))
+                    & (price_data.index < pd.Timestamp(end_date))
+                ]
+
+            # Local copy is synced again
+            # from the database on the next read
+            if self._local_store_connector is not None:
+                self._local_store_connector.remove_price_data(
+                    ticker=ticker,
+                    frequency=frequency,
+                )
+
             logger.info(f"Requested {ticker} price data from Yahoo Finance API.")
 
         # Otherwise, read from disk
         else:
-            price_data = self._database_connector.read_price_data(
+            price_data = self._read_price_data(
                 ticker=ticker,
                 frequency=frequency,
                 start_date=start_date,
                 end_date=end_date,
                 max_period=max_period,
+                # Last record date is outdated if records were appended
+                last_record_date=None if price_data_needs_update else last_record_date,
             )
 
             logger.info(f"{ticker} price data read from storage.")
 
-        return price_data
+        return PRICE_DATA_CACHE.put(cache_key, price_data)
+
+    def _request_price_data(
+        self,
+        ticker: str,
+        frequency: str,
+        start_date: str,
+        end_date: str,
+        max_period: bool,
+    ) -> pd.DataFrame:
+        """
+        Request price data from API and prepare it for storage.
+
+        :param ticker: Ticker to request prices data for.
+        :param frequency: Frequency of requested price data.
+        :param start_date: Start point to request price data from (inclusive).
+        :param end_date: End point until which to request prices data (exclusive).
+        :param max_period: Flag to request the maximum available period of price data.
+        :returns: Dataframe with price data prepared for storage.
+        """
+
+        price_data = self._api_connector.request_price_data(
+            ticker=ticker,
+            frequency=frequency,
+            start_date=start_date,
+            end_date=end_date,
+            max_period=max_period,
+        )
+
+        # At this point in time,
+        # if prices were requested intraday
+        # Yahoo Finance API sporadically returns an intraday close
+        # which is undesirable, since it leads to data inconsistency.
+        # If it is the case, we remove the last record from the dataframe.
+        last_queried_datetime: datetime = price_data.index[-1]
+        last_queried_date = last_queried_datetime.date()
+
+        price_data_includes_intraday = (
+            PriceDataAvailabilityHelper.check_if_price_data_includes_intraday(
+                last_queried_date,
+            )
+        )
+
+        if price_data_includes_intraday:
+            price_data.drop(index=last_queried_date, inplace=True)
+
+        return self._prepare_price_data(
+            dataframe=price_data,
+            ticker=ticker,
+        )
+
+    def _append_price_data(
+        self,
+        ticker: str,
+        frequency: str,
+        last_record_date: date,
+    ) -> bool:
+        """
+        Append price data recorded after the last record to storage.
+
+        Prices are requested along with a few already stored records,
+        if their adjustment factor changed, a corporate action
+        (split or dividend) re-adjusted every record before it
+        and stored prices must be rewritten instead.
+
+        :param ticker: Ticker to append prices data for.
+        :param frequency: Frequency of appended price data.
+        :param last_record_date: Last record date.
+        :returns: Boolean indicating if price data was appended.
+        """
+
+        # Overlap with stored records is requested
+        # regardless of how long ago the last record is
+        overlap_start_date = (
+            last_record_date - timedelta(days=PRICE_DATA_OVERLAP_DAYS)
+        ).strftime(DEFAULT_DATE_FORMAT)
+
+        overlap_end_date = self._get_next_exchange_date()
+
+        price_data = self._request_price_data(
+            ticker=ticker,
+            frequency=frequency,
+            start_date=overlap_start_date,
+            end_date=overlap_end_date,
+            max_period=False,
+        )
+
+        stored_price_data = self._database_connector.read_price_data(
+            ticker=ticker,
+            frequency=frequency,
+            start_date=overlap_start_date,
+            end_date=overlap_end_date,
+            max_period=False,
+        )
+
+        overlapping_dates = price_data.index.intersection(stored_price_data.index)
+
+        # Adjustment factor of overlapping records must be unchanged,
+        # without overlap, change cannot be ruled out
+        adjustment_factor = (
+            price_data.loc[overlapping_dates, "adj close"]
+            / price_data.loc[overlapping_dates, "close"]
+        )
+        stored_adjustment_factor = (
+            stored_price_data.loc[overlapping_dates, "adj close"]
+            / stored_price_data.loc[overlapping_dates, "close"]
+        )
+
+        if overlapping_dates.empty or not np.allclose(
+            adjustment_factor,
+            stored_adjustment_factor,
+            rtol=ADJUSTMENT_FACTOR_TOLERANCE,
+        ):
+            logger.info(
+                f"{ticker} adjustment factor changed, "
+                "corporate action detected, rewriting price data.",
+            )
+
+            return False
+
+        price_data = price_data[price_data.index.date > last_record_date]
+
+        if not price_data.empty:
+            self._database_connector.write_price_data(
+                frequency=frequency,
+                dataframe=price_data,
+            )
+
+        logger.info(
+            f"Appended {len(price_data)} {ticker} price records "
+            "from Yahoo Finance API.",
+        )
+
+        return True
+
+    def _read_price_data(
+        self,
+        ticker: str,
+        frequency: str,
+        start_date: str,
+        end_date: str,
+        max_period: bool,
+        last_record_date: date | None,
+    ) -> pd.DataFrame:
+        """
+        Read price data from storage.
+
+        If local store is configured, it is synced with the database
+        and price data is read from it, unless another process
+        replaced it in the meantime.
+
+        :param ticker: Ticker to read prices data for.
+        :param frequency: Frequency of read price data.
+        :param start_date: Start point to read price data from (inclusive).
+        :param end_date: End point until which to read prices data (exclusive).
+        :param max_period: Flag to read the maximum available period of price data.
+        :param last_record_date: Last record date in the database, if known.
+        :returns: Dataframe with price data.
+        """
+
+        if self._local_store_connector is not None:
+            self._sync_local_store(
+                ticker=ticker,
+                frequency=frequency,
+                start_date=start_date,
+                end_date=end_date,
+                last_record_date=last_record_date,
+            )
+
+            price_data = self._local_store_connector.read_price_data(
+                ticker=ticker,
+                frequency=frequency,
+                start_date=start_date,
+                end_date=end_date,
+                max_period=max_period,
+            )
+
+            if price_data is not None:
+                return price_data
+
+        return self._database_connector.read_price_data(
+            ticker=ticker,
+            frequency=frequency,
+            start_date=start_date,
+            end_date=end_date,
+            max_period=max_period,
+        )
+
+    def _sync_local_store(
+        self,
+        ticker: str,
+        frequency: str,
+        start_date: str,
+        end_date: str,
+        last_record_date: date | None,
+    ) -> None:
+        """
+        Sync local store with the database, which remains the source of truth.
+
+        Local store is current if its last record is the last one
+        in the database, otherwise, records after it are read and appended,
+        unless the last stored record itself changed (i.e. prices were
+        rewritten after a corporate action), in which case, as well as
+        if there is no local copy yet, all records are read.
+
+        :param ticker: Ticker to sync prices data for.
+        :param frequency: Frequency of synced price data.
+        :param start_date: Start point of requested price data (inclusive).
+        :param end_date: End point of requested price data (exclusive).
+        :param last_record_date: Last record date in the database, if known.
+        """
+
+        local_store_connector = cast("LocalStoreConnector", self._local_store_connector)
+
+        metadata = local_store_connector.read_metadata(ticker, frequency)
+
+        if metadata is not None:
+            # Local store is current
+            if last_record_date is not None and (
+                metadata["last_record_date"]
+                == last_record_date.strftime(DEFAULT_DATE_FORMAT)
+            ):
+                return
+
+            # Read records from the last stored one onwards
+            price_data = self._database_connector.read_price_data(
+                ticker=ticker,
+                frequency=frequency,
+                start_date=metadata["last_record_date"],
+                end_date=self._get_next_exchange_date(),
+                max_period=False,
+            )
+
+            stored_price_data = local_store_connector.read_price_data(
+                ticker=ticker,
+                frequency=frequency,
+                start_date=start_date,
+                end_date=end_date,
+                max_period=True,
+            )
+
+            # Last stored record must be unchanged in the database
+            if (
+                stored_price_data is not None
+                and not price_data.empty
+                and hash_price_data(price_data.iloc[:1]) == metadata["last_record_hash"]
+            ):
+                local_store_connector.write_price_data(
+                    ticker=ticker,
+                    frequency=frequency,
+                    dataframe=pd.concat([stored_price_data, price_data.iloc[1:]]),
+                )
+
+                logger.info(
+                    f"Synced {len(price_data) - 1} {ticker} "
+                    "price records to local store.",
+                )
+
+                return
+
+        price_data = self._database_connector.read_price_data(
+            ticker=ticker,
+            frequency=frequency,
+            start_date=start_date,
+            end_date=end_date,
+            max_period=True,
+        )
+
+        local_store_connector.write_price_data(
+            ticker=ticker,
+            frequency=frequency,
+            dataframe=price_data,
+        )
+
+        logger.info(f"Synced all {ticker} price records to local store.")
+
+    def _get_next_exchange_date(self) -> str:
+        """
+        Get tomorrow date in configured exchange.
+
+        Serves as exclusive end point of requests including today.
+
+        :returns: Tomorrow date in configured exchange.
+        """
+
+        return (
+            datetime.now(
+                tz=ZoneInfo(EXCHANGE_TIME_ZONE_AND_HOURS[str(EXCHANGE)]["timezone"]),
+            ).date()
+            + timedelta(days=1)
+        ).strftime(DEFAULT_DATE_FORMAT)
 
     def _validate_provided_start_and_end_date(
         self,
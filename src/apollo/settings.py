@@ -20,18 +20,30 @@ SP500_COMPONENTS_URL = getenv("SP500_COMPONENTS_URL")
 SCREENING_WINDOW_SIZE = getenv("SCREENING_WINDOW_SIZE")
 SUPPORTED_DATA_ENHANCERS = getenv("SUPPORTED_DATA_ENHANCERS")
 SCREENING_LIQUIDITY_THRESHOLD = getenv("SCREENING_LIQUIDITY_THRESHOLD")
+BACKTESTING_ENGINE = getenv("BACKTESTING_ENGINE")
+SCHEDULING_MODE = getenv("SCHEDULING_MODE")
+FULL_OPTIMIZATION_RESULTS = getenv("FULL_OPTIMIZATION_RESULTS")
+SEARCH_MODE = getenv("SEARCH_MODE")
+SEARCH_BUDGET = getenv("SEARCH_BUDGET")
+PRICE_DATA_STORE = getenv("PRICE_DATA_STORE")
 
 NO_SIGNAL = 0
 LONG_SIGNAL = 1
 SHORT_SIGNAL = -1
 
 BACKTESTING_CASH_SIZE = 1000
+CALCULATION_CACHE_MAX_BYTES = 32 * 1024 * 1024
+PRICE_DATA_CACHE_SIZE = 64
+PRICE_DATA_CACHE_TTL = 15 * 60
+OPTIMIZATION_RESULTS_SIZE = 10
+DEFAULT_SEARCH_BUDGET = 200
 MISSING_DATA_PLACEHOLDER = np.inf
 
 ROOT_DIR = Path(curdir).resolve()
 PARM_DIR = Path(f"{ROOT_DIR}/parameters")
 PLOT_DIR = Path(f"{ROOT_DIR}/backtesting_plots")
 TRDS_DIR = Path(f"{ROOT_DIR}/backtesting_trades")
+PRCS_DIR = Path(f"{ROOT_DIR}/price_data")
 
 DEFAULT_DATE_FORMAT = "%Y-%m-%d"
 DEFAULT_TIME_FORMAT = "%H:%M"
@@ -69,6 +81,56 @@ class ParameterOptimizerMode(str, Enum):
     MULTIPLE_STRATEGIES = "multiple_strategies"
 
 
+class BacktestingEngine(str, Enum):
+    """
+    Engine used to run backtesting process.
+
+    Denotes whether backtesting library or its native
+    reimplementation simulates the trade execution.
+    """
+
+    BACKTESTING_PY = "backtesting.py"
+    NATIVE = "native"
+
+
+class SchedulingMode(str, Enum):
+    """
+    Mode of scheduling work between processes.
+
+    Denotes whether inputs are split into equal batches upfront
+    or pulled by processes in chunks sized by measured cost.
+    """
+
+    STATIC = "static"
+    DYNAMIC = "dynamic"
+
+
+class PriceDataStore(str, Enum):
+    """
+    Store price data is read from.
+
+    Denotes whether price data is read from the database directly
+    or from local memory-mapped files synced from the database.
+    """
+
+    INFLUXDB = "influxdb"
+    LOCAL = "local"
+
+
+class SearchMode(str, Enum):
+    """
+    Mode of searching parameter combinations.
+
+    Denotes whether every combination is backtested,
+    only a budget of them, focused on promising regions,
+    or only the best of them over growing history.
+    """
+
+    EXHAUSTIVE = "exhaustive"
+    ADAPTIVE = "adaptive"
+    SUCCESSIVE_HALVING = "successive_halving"
+
+
 EXCHANGE_TIME_ZONE_AND_HOURS = {
     "NYSE": {
         "timezone": "America/New_York",
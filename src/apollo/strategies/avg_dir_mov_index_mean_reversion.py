@@ -1,8 +1,11 @@
+from typing import Any
+
 import pandas as pd
 
 from apollo.calculators.average_directional_movement_index import (
     AverageDirectionalMovementIndexCalculator,
 )
+from apollo.calculators.calculation_cache import cache_batch_calculation
 from apollo.settings import LONG_SIGNAL, SHORT_SIGNAL
 from apollo.strategies.base.base_strategy import BaseStrategy
 from apollo.strategies.base.vix_enhanced_strategy import VIXEnhancedStrategy
@@ -102,6 +105,49 @@ class AverageDirectionalMovementIndexMeanReversion(
             window_size=window_size,
         )
 
+    @classmethod
+    def precalculate_indicators(
+        cls,
+        dataframe: pd.DataFrame,
+        window_sizes: list[int],
+        strategy_specific_parameters: list[dict[str, Any]],  # noqa: ARG003
+    ) -> None:
+        """
+        Precalculate ATR and ADX for multiple window sizes at once.
+
+        ADX of each window size is calculated over ATR of the same window size.
+
+        :param dataframe: Dataframe with price data, it is not modified.
+        :param window_sizes: Window sizes to precalculate indicators for.
+        :param strategy_specific_parameters: Parameters to precalculate indicators for.
+        """
+
+        average_true_range = cls._precalculate_volatility(dataframe, window_sizes)
+
+        calculator_class = AverageDirectionalMovementIndexCalculator
+
+        cache_batch_calculation(
+            calculator_class.calculate_average_directional_movement_index,
+            [
+                calculator_class(
+                    pd.DataFrame(
+                        {
+                            "adj high": dataframe["adj high"],
+                            "adj low": dataframe["adj low"],
+                            "atr": average_true_range[:, position],
+                        },
+                    ),
+                    window_size,
+                )
+                for position, window_size in enumerate(window_sizes)
+            ],
+            calculator_class.calculate_average_directional_movement_index_batch(
+                dataframe,
+                window_sizes,
+                average_true_range,
+            ),
+        )
+
     def model_trading_signals(self) -> None:
         """Model entry and exit signals."""
 
@@ -1,6 +1,10 @@
+from typing import Any
+
+import numpy as np
 from pandas import DataFrame
 
 from apollo.calculators.average_true_range import AverageTrueRangeCalculator
+from apollo.calculators.calculation_cache import cache_batch_calculation
 
 
 class VolatilityAdjustedStrategy:
@@ -36,3 +40,66 @@ class VolatilityAdjustedStrategy:
             window_size=window_size,
         )
         self._atr_calculator.calculate_average_true_range()
+
+    @classmethod
+    def precalculate_indicators(
+        cls,
+        dataframe: DataFrame,
+        window_sizes: list[int],
+        strategy_specific_parameters: list[dict[str, Any]],  # noqa: ARG003
+    ) -> None:
+        """
+        Precalculate indicators for multiple window sizes at once.
+
+        Indicators are calculated by batch calculators and cached,
+        so that strategies constructed with any of the window sizes
+        (and strategy specific parameters) write them from the cache.
+
+        Volatility is precalculated for every strategy,
+        strategies with other batch calculators extend it.
+
+        :param dataframe: Dataframe with price data, it is not modified.
+        :param window_sizes: Window sizes to precalculate indicators for.
+        :param strategy_specific_parameters: Parameters to precalculate indicators for.
+        """
+
+        cls._precalculate_volatility(dataframe, window_sizes)
+
+    @staticmethod
+    def _precalculate_volatility(
+        dataframe: DataFrame,
+        window_sizes: list[int],
+    ) -> np.ndarray:
+        """
+        Precalculate ATR for multiple window sizes at once.
+
+        :param dataframe: Dataframe with price data, it is not modified.
+        :param window_sizes: Window sizes to precalculate ATR for.
+        :returns: ATR array of shape (bars, window sizes).
+        """
+
+        # Input columns as strategy sees them,
+        # previous close is precalculated by base strategy
+        inputs = DataFrame(
+            {
+                "adj high": dataframe["adj high"],
+                "adj low": dataframe["adj low"],
+                "prev_close": dataframe["adj close"].shift(1),
+            },
+        )
+
+        batch_result = AverageTrueRangeCalculator.calculate_average_true_range_batch(
+            inputs,
+            window_sizes,
+        )
+
+        cache_batch_calculation(
+            AverageTrueRangeCalculator.calculate_average_true_range,
+            [
+                AverageTrueRangeCalculator(inputs, window_size)
+                for window_size in window_sizes
+            ],
+            batch_result,
+        )
+
+        return batch_result["atr"]
@@ -1,5 +1,8 @@
+from typing import Any
+
 from pandas import DataFrame
 
+from apollo.calculators.calculation_cache import cache_batch_calculation
 from apollo.calculators.chaikin_accumulation_distribution import (
     ChaikinAccumulationDistributionCalculator,
 )
@@ -96,6 +99,37 @@ class KeltnerChaikinMeanReversion(
             window_size=window_size,
         )
 
+    @classmethod
+    def precalculate_indicators(
+        cls,
+        dataframe: DataFrame,
+        window_sizes: list[int],
+        strategy_specific_parameters: list[dict[str, Any]],  # noqa: ARG003
+    ) -> None:
+        """
+        Precalculate ATR and HMA for multiple window sizes at once.
+
+        :param dataframe: Dataframe with price data, it is not modified.
+        :param window_sizes: Window sizes to precalculate indicators for.
+        :param strategy_specific_parameters: Parameters to precalculate indicators for.
+        """
+
+        cls._precalculate_volatility(dataframe, window_sizes)
+
+        inputs = dataframe[["adj close"]]
+
+        cache_batch_calculation(
+            HullMovingAverageCalculator.calculate_hull_moving_average,
+            [
+                HullMovingAverageCalculator(inputs, window_size)
+                for window_size in window_sizes
+            ],
+            HullMovingAverageCalculator.calculate_hull_moving_average_batch(
+                inputs,
+                window_sizes,
+            ),
+        )
+
     def model_trading_signals(self) -> None:
         """Model entry and exit signals."""
 
@@ -1,5 +1,8 @@
+from typing import Any
+
 from pandas import DataFrame
 
+from apollo.calculators.calculation_cache import cache_batch_calculation
 from apollo.calculators.linear_regression_channel import (
     LinearRegressionChannelCalculator,
 )
@@ -78,6 +81,54 @@ class LinearRegressionChannelMeanReversion(
             channel_sd_spread=channel_sd_spread,
         )
 
+    @classmethod
+    def precalculate_indicators(
+        cls,
+        dataframe: DataFrame,
+        window_sizes: list[int],
+        strategy_specific_parameters: list[dict[str, Any]],
+    ) -> None:
+        """
+        Precalculate ATR and regression channel for multiple window sizes at once.
+
+        Channel is precalculated for each standard deviation spread,
+        spreads the strategy would reject are left to the strategy to report.
+
+        :param dataframe: Dataframe with price data, it is not modified.
+        :param window_sizes: Window sizes to precalculate indicators for.
+        :param strategy_specific_parameters: Parameters to precalculate indicators for.
+        """
+
+        cls._precalculate_volatility(dataframe, window_sizes)
+
+        inputs = dataframe[["adj close"]]
+
+        channel_sd_spreads = {
+            parameters.get("channel_sd_spread")
+            for parameters in strategy_specific_parameters
+        }
+
+        for channel_sd_spread in channel_sd_spreads:
+            if not isinstance(channel_sd_spread, float):
+                continue
+
+            cache_batch_calculation(
+                LinearRegressionChannelCalculator.calculate_linear_regression_channel,
+                [
+                    LinearRegressionChannelCalculator(
+                        inputs,
+                        window_size,
+                        channel_sd_spread,
+                    )
+                    for window_size in window_sizes
+                ],
+                LinearRegressionChannelCalculator.calculate_linear_regression_channel_batch(
+                    inputs,
+                    window_sizes,
+                    channel_sd_spread,
+                ),
+            )
+
     def model_trading_signals(self) -> None:
         """Model entry and exit signals."""
 
@@ -1,5 +1,8 @@
+from typing import Any
+
 from pandas import DataFrame
 
+from apollo.calculators.calculation_cache import cache_batch_calculation
 from apollo.calculators.distribution_moments import DistributionMomentsCalculator
 from apollo.settings import LONG_SIGNAL, SHORT_SIGNAL
 from apollo.strategies.base.base_strategy import BaseStrategy
@@ -84,6 +87,37 @@ class SkewnessKurtosisVolatilityTrendFollowing(
 
         self._dm_calculator = DistributionMomentsCalculator(dataframe, window_size)
 
+    @classmethod
+    def precalculate_indicators(
+        cls,
+        dataframe: DataFrame,
+        window_sizes: list[int],
+        strategy_specific_parameters: list[dict[str, Any]],  # noqa: ARG003
+    ) -> None:
+        """
+        Precalculate ATR and distribution moments for multiple window sizes at once.
+
+        :param dataframe: Dataframe with price data, it is not modified.
+        :param window_sizes: Window sizes to precalculate indicators for.
+        :param strategy_specific_parameters: Parameters to precalculate indicators for.
+        """
+
+        cls._precalculate_volatility(dataframe, window_sizes)
+
+        inputs = dataframe[["adj close"]]
+
+        cache_batch_calculation(
+            DistributionMomentsCalculator.calculate_distribution_moments,
+            [
+                DistributionMomentsCalculator(inputs, window_size)
+                for window_size in window_sizes
+            ],
+            DistributionMomentsCalculator.calculate_distribution_moments_batch(
+                inputs,
+                window_sizes,
+            ),
+        )
+
     def model_trading_signals(self) -> None:
         """Model entry and exit signals."""
 
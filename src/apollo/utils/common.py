@@ -5,6 +5,7 @@ from apollo.core.strategy_catalogue_map import STRATEGY_CATALOGUE_MAP
 from apollo.settings import (
     ALPACA_API_KEY,
     ALPACA_SECRET_KEY,
+    BACKTESTING_ENGINE,
     DEFAULT_DATE_FORMAT,
     END_DATE,
     EXCHANGE,
@@ -16,8 +17,12 @@ from apollo.settings import (
     INFLUXDB_TOKEN,
     INFLUXDB_URL,
     POSTGRES_URL,
+    PRICE_DATA_STORE,
+    SCHEDULING_MODE,
     SCREENING_LIQUIDITY_THRESHOLD,
     SCREENING_WINDOW_SIZE,
+    SEARCH_BUDGET,
+    SEARCH_MODE,
     SP500_COMPONENTS_URL,
     SP500_FUTURES_TICKER,
     START_DATE,
@@ -25,7 +30,11 @@ from apollo.settings import (
     SUPPORTED_DATA_ENHANCERS,
     TICKER,
     VIX_TICKER,
+    BacktestingEngine,
     PriceDataFrequency,
+    PriceDataStore,
+    SchedulingMode,
+    SearchMode,
 )
 
 
@@ -52,6 +61,11 @@ def ensure_environment_is_configured() -> None:
     :raises ValueError: If the strategy is not a valid strategy.
     :raises ValueError: If the exchange is not a valid exchange.
     :raises ValueError: If the frequency is not a valid frequency.
+    :raises ValueError: If the backtesting engine is not a valid engine.
+    :raises ValueError: If the scheduling mode is not a valid mode.
+    :raises ValueError: If the search mode is not a valid mode.
+    :raises ValueError: If the search budget is not a positive integer.
+    :raises ValueError: If the price data store is not a valid store.
     """
 
     required_variables = {
@@ -103,3 +117,42 @@ def ensure_environment_is_configured() -> None:
             f"Invalid FREQUENCY environment variable: {FREQUENCY}. "
             f"Accepted values: {', '.join([f.value for f in PriceDataFrequency])}",
         )
+
+    # Check if the optional backtesting engine is a valid engine
+    backtesting_engines = [engine.value for engine in BacktestingEngine]
+    if BACKTESTING_ENGINE and BACKTESTING_ENGINE not in backtesting_engines:
+        raise ValueError(
+            f"Invalid BACKTESTING_ENGINE environment variable: {BACKTESTING_ENGINE}. "
+            f"Accepted values: {', '.join(backtesting_engines)}",
+        )
+
+    # Check if the optional scheduling mode is a valid mode
+    scheduling_modes = [mode.value for mode in SchedulingMode]
+    if SCHEDULING_MODE and SCHEDULING_MODE not in scheduling_modes:
+        raise ValueError(
+            f"Invalid SCHEDULING_MODE environment variable: {SCHEDULING_MODE}. "
+            f"Accepted values: {', '.join(scheduling_modes)}",
+        )
+
+    # Check if the optional search mode is a valid mode
+    search_modes = [mode.value for mode in SearchMode]
+    if SEARCH_MODE and SEARCH_MODE not in search_modes:
+        raise ValueError(
+            f"Invalid SEARCH_MODE environment variable: {SEARCH_MODE}. "
+            f"Accepted values: {', '.join(search_modes)}",
+        )
+
+    # Check if the optional search budget is a positive integer
+    if SEARCH_BUDGET and not (SEARCH_BUDGET.isdigit() and int(SEARCH_BUDGET) > 0):
+        raise ValueError(
+            f"Invalid SEARCH_BUDGET environment variable: {SEARCH_BUDGET}. "
+            "Accepted values: positive integers",
+        )
+
+    # Check if the optional price data store is a valid store
+    price_data_stores = [store.value for store in PriceDataStore]
+    if PRICE_DATA_STORE and PRICE_DATA_STORE not in price_data_stores:
+        raise ValueError(
+            f"Invalid PRICE_DATA_STORE environment variable: {PRICE_DATA_STORE}. "
+            f"Accepted values: {', '.join(price_data_stores)}",
+        )
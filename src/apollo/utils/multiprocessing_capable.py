@@ -1,12 +1,80 @@
-from collections.abc import Iterable
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Sequence
+from logging import getLogger
+from math import ceil
 from multiprocessing import cpu_count
-from typing import TypeVar
+from multiprocessing.pool import Pool
+from os import getpid
+from queue import SimpleQueue
+from time import perf_counter
+from typing import Any, TypedDict, TypeVar
+
+from apollo.settings import SCHEDULING_MODE, SchedulingMode
+
+logger = getLogger(__name__)
 
 # Declare a generic type for inputs
 # collection item since different tasks
 # operate on different types of data structures
 TItem = TypeVar("TItem")
 
+# Declare a generic type for
+# results of processing a batch
+TResult = TypeVar("TResult")
+
+# Duration each dynamically scheduled chunk should take,
+# long enough to amortize dispatching, short enough to balance the load
+TARGET_CHUNK_DURATION = 0.5
+
+# Number of chunks each process holds at once,
+# so that it never waits for the next one to be dispatched
+CHUNKS_PER_PROCESS = 2
+
+
+class ParallelJob(TypedDict):
+    """Parallel job type definition."""
+
+    # Function processing a batch of inputs
+    function: Callable[[Sequence[Any]], Any]
+    inputs: Sequence[Any]
+
+    # Number of consecutive items that must stay together
+    granularity: int
+
+
+class SchedulingStatistics(TypedDict):
+    """Scheduling statistics type definition."""
+
+    processes: int
+    jobs: int
+    items: int
+    chunks: int
+    min_chunk_size: int
+    max_chunk_size: int
+    item_cost: float
+    wall_time: float
+    busy_time: float
+    utilization: float
+
+
+def process_timed_chunk(
+    function: Callable[[Sequence[TItem]], TResult],
+    chunk: Sequence[TItem],
+) -> tuple[TResult, float, int]:
+    """
+    Process chunk of inputs and measure how long it took.
+
+    :param function: Function processing the chunk.
+    :param chunk: Chunk of inputs to process.
+    :returns: Result, processing time and id of the process.
+    """
+
+    started = perf_counter()
+
+    result = function(chunk)
+
+    return result, perf_counter() - started, getpid()
+
 
 class MultiprocessingCapable:
     """
@@ -22,26 +90,47 @@ class MultiprocessingCapable:
         # Get number of available cores
         self._available_cores = cpu_count()
 
-    def _create_batches(self, inputs: Iterable[TItem]) -> list[list[TItem]]:
+        # Equal batches are scheduled unless configured otherwise
+        self._scheduling_mode = SchedulingMode(
+            SCHEDULING_MODE or SchedulingMode.STATIC,
+        )
+
+    def _create_batches(
+        self,
+        inputs: Iterable[TItem],
+        granularity: int = 1,
+    ) -> list[Sequence[TItem]]:
         """
         Break inputs collection into equal batches.
 
+        Batches are cut at multiples of granularity,
+        so that consecutive items that must stay together
+        are never split between two batches.
+
         :param inputs: Inputs collection to batch.
+        :param granularity: Number of consecutive items that must stay together.
         :returns: List of batches with collection items.
         """
 
-        # Map inputs to list if it is not one already
-        inputs = list(inputs) if not isinstance(inputs, list) else inputs
+        # Map inputs to list if it cannot be sliced already
+        #
+        # NOTE: lazy sequences are sliced without
+        # materializing items, as long as they implement slicing
+        inputs = list(inputs) if not isinstance(inputs, Sequence) else inputs
 
         # Calculate the
         # total number of items
         items_count = len(inputs)
 
-        # Calculate the base size of each batch
-        base_batch_size = items_count // self._available_cores
+        # Calculate the total number of units
+        # of items that must stay together
+        units_count = ceil(items_count / granularity)
 
-        # Calculate the size of the remainder batch
-        remainder_batch_size = items_count % self._available_cores
+        # Calculate the base size of each batch in units
+        base_batch_size = units_count // self._available_cores
+
+        # Calculate the size of the remainder batch in units
+        remainder_batch_size = units_count % self._available_cores
 
         start_index = 0
         batches_to_return = []
@@ -49,16 +138,282 @@ class MultiprocessingCapable:
         # Iterate over the number of batches
         for i in range(self._available_cores):
             # Calculate the current batch size
-            current_batch_size = base_batch_size + (
-                1 if i < remainder_batch_size else 0
-            )
+            current_batch_size = (
+                base_batch_size + (1 if i < remainder_batch_size else 0)
+            ) * granularity
 
-            # Slice and append the current batch
+            # Slice and append the current batch,
+            # the last unit may be incomplete
             batches_to_return.append(
-                inputs[start_index : start_index + current_batch_size],
+                inputs[
+                    start_index : min(start_index + current_batch_size, items_count)
+                ],
             )
 
             # Update the start index for the next batch
-            start_index += current_batch_size
+            start_index = min(start_index + current_batch_size, items_count)
 
         return batches_to_return
+
+    def _process_in_parallel(
+        self,
+        pool: Pool,
+        function: Callable[[Sequence[TItem]], TResult],
+        inputs: Iterable[TItem],
+        granularity: int = 1,
+    ) -> list[TResult]:
+        """
+        Process inputs in parallel according to the scheduling mode.
+
+        :param pool: Pool of processes to process inputs with.
+        :param function: Function processing a batch of inputs.
+        :param inputs: Inputs collection to process.
+        :param granularity: Number of consecutive items that must stay together.
+        :returns: Results of each processed batch, in order of inputs.
+        """
+
+        if self._scheduling_mode == SchedulingMode.DYNAMIC:
+            job: ParallelJob = {
+                "function": function,
+                "inputs": list(inputs) if not isinstance(inputs, Sequence) else inputs,
+                "granularity": granularity,
+            }
+
+            return self._process_dynamically(pool, [job])[0]
+
+        return pool.map(function, self._create_batches(inputs, granularity))
+
+    def _process_jobs_in_parallel(
+        self,
+        pool: Pool,
+        jobs: list[ParallelJob],
+    ) -> list[list[Any]]:
+        """
+        Process inputs of several jobs in parallel within the same pool.
+
+        Batches of all jobs are queued at once, so that
+        processes idle after finishing batches of one job
+        pick up batches of the other jobs instead of waiting.
+
+        :param pool: Pool of processes to process inputs with.
+        :param jobs: Jobs to process.
+        :returns: Results of each processed batch, in order of inputs, per job.
+        """
+
+        if self._scheduling_mode == SchedulingMode.DYNAMIC:
+            return self._process_dynamically(pool, jobs)
+
+        # Queue batches of all jobs before waiting for any of them
+        async_results = [
+            pool.map_async(
+                job["function"],
+                self._create_batches(job["inputs"], job["granularity"]),
+            )
+            for job in jobs
+        ]
+
+        return [async_result.get() for async_result in async_results]
+
+    def _process_dynamically(
+        self,
+        pool: Pool,
+        jobs: list[ParallelJob],
+    ) -> list[list[Any]]:
+        """
+        Process inputs of jobs in chunks pulled by processes as they become idle.
+
+        First chunks of each job are a single unit long to measure cost
+        of its item, following chunks are sized to take about the target duration.
+
+        Chunks of each job are dispatched right after chunks of the previous one,
+        and chunks of the last job shrink as its inputs run out,
+        so that all processes finish at about the same time.
+
+        :param pool: Pool of processes to process inputs with.
+        :param jobs: Jobs to process.
+        :returns: Results of each processed chunk, in order of inputs, per job.
+
+        :raises Exception: If processing of any chunk raised, re-raised.
+        """
+
+        # Completed chunks are reported from
+        # the result handler thread of the pool
+        completions: SimpleQueue[
+            tuple[int, tuple[Any, float, int] | None, BaseException | None]
+        ] = SimpleQueue()
+
+        results: list[dict[int, Any]] = [{} for _ in jobs]
+        busy_time_by_process: defaultdict[int, float] = defaultdict(float)
+
+        # Job index and size of each dispatched chunk
+        chunks: list[tuple[int, int]] = []
+
+        # Cost of an item is measured per job,
+        # since jobs differ in how expensive their items are
+        busy_time_by_job = [0.0 for _ in jobs]
+        processed_items_by_job = [0 for _ in jobs]
+
+        job_index = 0
+        dispatched_items = 0
+        pending_chunks = 0
+
+        started = perf_counter()
+
+        while job_index < len(jobs) or pending_chunks:
+            # Keep each process supplied with chunks
+            while (
+                job_index < len(jobs)
+                and pending_chunks < self._available_cores * CHUNKS_PER_PROCESS
+            ):
+                job = jobs[job_index]
+
+                remaining_items = len(job["inputs"]) - dispatched_items
+
+                # Move on to the next job once
+                # all inputs of this one are dispatched
+                if not remaining_items:
+                    job_index += 1
+                    dispatched_items = 0
+
+                    continue
+
+                chunk_size = self._get_chunk_size(
+                    remaining_items=remaining_items,
+                    busy_time=busy_time_by_job[job_index],
+                    processed_items=processed_items_by_job[job_index],
+                    granularity=job["granularity"],
+                    last_job=job_index == len(jobs) - 1,
+                )
+
+                chunk_index = len(chunks)
+                chunks.append((job_index, chunk_size))
+
+                pool.apply_async(
+                    process_timed_chunk,
+                    (
+                        job["function"],
+                        job["inputs"][dispatched_items : dispatched_items + chunk_size],
+                    ),
+                    callback=lambda result, index=chunk_index: completions.put(
+                        (index, result, None),
+                    ),
+                    error_callback=lambda error, index=chunk_index: completions.put(
+                        (index, None, error),
+                    ),
+                )
+
+                dispatched_items += chunk_size
+                pending_chunks += 1
+
+            # All jobs may have been empty
+            if not pending_chunks:
+                break
+
+            chunk_index, timed_result, error = completions.get()
+            pending_chunks -= 1
+
+            if error is not None:
+                raise error
+
+            result, busy_time, process_id = timed_result
+            chunk_job_index, chunk_size = chunks[chunk_index]
+
+            results[chunk_job_index][chunk_index] = result
+            busy_time_by_process[process_id] += busy_time
+            busy_time_by_job[chunk_job_index] += busy_time
+            processed_items_by_job[chunk_job_index] += chunk_size
+
+        self._log_scheduling_statistics(
+            jobs=len(jobs),
+            items=sum(len(job["inputs"]) for job in jobs),
+            chunk_sizes=[chunk_size for _, chunk_size in chunks],
+            busy_time_by_process=busy_time_by_process,
+            wall_time=perf_counter() - started,
+        )
+
+        return [
+            [job_results[chunk_index] for chunk_index in sorted(job_results)]
+            for job_results in results
+        ]
+
+    def _get_chunk_size(
+        self,
+        remaining_items: int,
+        busy_time: float,
+        processed_items: int,
+        granularity: int,
+        last_job: bool = True,
+    ) -> int:
+        """
+        Get size of the next chunk based on measured cost of an item.
+
+        :param remaining_items: Number of items not dispatched yet.
+        :param busy_time: Time spent processing chunks so far.
+        :param processed_items: Number of items processed so far.
+        :param granularity: Number of consecutive items that must stay together.
+        :param last_job: Whether no other job is left to keep processes busy.
+        :returns: Size of the next chunk.
+        """
+
+        # Probe with a single unit until the cost is measured
+        if not processed_items or not busy_time:
+            return min(granularity, remaining_items)
+
+        item_cost = busy_time / processed_items
+
+        # Size the chunk to the target duration
+        chunk_size = TARGET_CHUNK_DURATION / item_cost
+
+        # Leave enough work for other processes,
+        # unless other jobs are left to keep them busy
+        if last_job:
+            chunk_size = min(
+                chunk_size,
+                remaining_items / (self._available_cores * CHUNKS_PER_PROCESS),
+            )
+
+        # Round the size up to whole units
+        chunk_size = max(ceil(chunk_size / granularity), 1) * granularity
+
+        return min(chunk_size, remaining_items)
+
+    def _log_scheduling_statistics(
+        self,
+        jobs: int,
+        items: int,
+        chunk_sizes: list[int],
+        busy_time_by_process: dict[int, float],
+        wall_time: float,
+    ) -> SchedulingStatistics:
+        """
+        Log how evenly the work was spread between processes.
+
+        :param jobs: Number of processed jobs.
+        :param items: Number of processed items.
+        :param chunk_sizes: Size of each processed chunk.
+        :param busy_time_by_process: Time each process spent processing chunks.
+        :param wall_time: Time the whole processing took.
+        :returns: Scheduling statistics.
+        """
+
+        busy_time = sum(busy_time_by_process.values())
+
+        scheduling_statistics: SchedulingStatistics = {
+            "processes": len(busy_time_by_process),
+            "jobs": jobs,
+            "items": items,
+            "chunks": len(chunk_sizes),
+            "min_chunk_size": min(chunk_sizes, default=0),
+            "max_chunk_size": max(chunk_sizes, default=0),
+            "item_cost": busy_time / items if items else 0.0,
+            "wall_time": wall_time,
+            "busy_time": busy_time,
+            # Share of the available process time spent on processing
+            "utilization": (
+                busy_time / (wall_time * self._available_cores) if wall_time else 0.0
+            ),
+        }
+
+        logger.info(f"Scheduling statistics: {scheduling_statistics}")
+
+        return scheduling_statistics
@@ -0,0 +1,151 @@
+from collections.abc import Iterator, Sequence
+from math import prod
+from typing import overload
+
+
+class ParameterGrid(Sequence[tuple[float, ...]]):
+    """
+    Parameter Grid class.
+
+    Lazy equivalent of the product of parameter ranges,
+    combinations are decoded from their index on demand
+    instead of being materialized upfront.
+
+    Index of a combination is a mixed-radix number,
+    each parameter being a digit with radix of its range length
+    (the last parameter changing the fastest, as in the product).
+
+    Slices are grids too, they only hold ranges and bounds,
+    so that they are cheap to create and send to other processes.
+    """
+
+    def __init__(
+        self,
+        ranges: list[list[float]],
+        start: int = 0,
+        stop: int | None = None,
+    ) -> None:
+        """
+        Construct Parameter Grid.
+
+        :param ranges: Values of each parameter.
+        :param start: Index of the first combination of the grid.
+        :param stop: Index after the last combination of the grid, all if not provided.
+        """
+
+        self._ranges = ranges
+
+        self._start = start
+        self._stop = prod(len(values) for values in ranges) if stop is None else stop
+
+    @property
+    def radices(self) -> list[int]:
+        """
+        Get number of values of each parameter.
+
+        :returns: Number of values of each parameter.
+        """
+
+        return [len(values) for values in self._ranges]
+
+    def __len__(self) -> int:
+        """
+        Get number of combinations in the grid.
+
+        :returns: Number of combinations.
+        """
+
+        return max(self._stop - self._start, 0)
+
+    @overload
+    def __getitem__(self, index: int) -> tuple[float, ...]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "ParameterGrid": ...
+
+    def __getitem__(
+        self,
+        index: int | slice,
+    ) -> "tuple[float, ...] | ParameterGrid":
+        """
+        Get combination at the index or grid with the slice of combinations.
+
+        :param index: Index of the combination or slice of combinations.
+        :returns: Combination or grid with combinations.
+
+        :raises IndexError: If index is out of range.
+        :raises ValueError: If slice is not contiguous.
+        """
+
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+
+            if step != 1:
+                raise ValueError("Parameter grid can only be sliced contiguously.")
+
+            return ParameterGrid(
+                self._ranges,
+                start=self._start + start,
+                stop=self._start + max(stop, start),
+            )
+
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError("Parameter grid index out of range.")
+
+        return self._get_combination(self._get_digits(self._start + index))
+
+    def __iter__(self) -> Iterator[tuple[float, ...]]:
+        """
+        Iterate over combinations of the grid.
+
+        :returns: Iterator over combinations.
+        """
+
+        if not len(self):
+            return
+
+        digits = self._get_digits(self._start)
+
+        for _ in range(len(self)):
+            yield self._get_combination(digits)
+
+            # Increment digits, carrying over
+            # to the preceding parameter on overflow
+            for position in reversed(range(len(digits))):
+                digits[position] += 1
+
+                if digits[position] < len(self._ranges[position]):
+                    break
+
+                digits[position] = 0
+
+    def _get_digits(self, index: int) -> list[int]:
+        """
+        Decode index into positions of values within each range.
+
+        :param index: Index of the combination.
+        :returns: Position of value for each parameter.
+        """
+
+        digits = []
+
+        for values in reversed(self._ranges):
+            index, digit = divmod(index, len(values))
+            digits.append(digit)
+
+        return digits[::-1]
+
+    def _get_combination(self, digits: list[int]) -> tuple[float, ...]:
+        """
+        Get combination of values at the positions.
+
+        :param digits: Position of value for each parameter.
+        :returns: Combination of parameter values.
+        """
+
+        return tuple(
+            values[digit] for values, digit in zip(self._ranges, digits, strict=True)
+        )
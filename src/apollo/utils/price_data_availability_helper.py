@@ -1,13 +1,43 @@
-from datetime import date, datetime, timedelta
+from datetime import date, datetime
 from zoneinfo import ZoneInfo
 
-from numpy import is_busday
+import pandas as pd
+import pandas_market_calendars as mcal
 
-from apollo.settings import (
-    DEFAULT_TIME_FORMAT,
-    EXCHANGE,
-    EXCHANGE_TIME_ZONE_AND_HOURS,
-)
+from apollo.settings import EXCHANGE, EXCHANGE_TIME_ZONE_AND_HOURS
+
+# Trading sessions of the configured exchange by year
+_exchange_sessions: dict[int, pd.DataFrame] = {}
+
+
+def get_exchange_sessions(year: int) -> pd.DataFrame:
+    """
+    Get trading sessions of the configured exchange in the year.
+
+    Sessions are computed from the exchange calendar once per year
+    and process, exchange holidays are left out and early closes
+    are reflected by the close time of the session.
+
+    :param year: Year to get trading sessions in.
+    :returns: Dataframe with open and close time of each session, by session date.
+    """
+
+    if year not in _exchange_sessions:
+        exchange_timezone = EXCHANGE_TIME_ZONE_AND_HOURS[str(EXCHANGE)]["timezone"]
+
+        schedule = mcal.get_calendar(str(EXCHANGE)).schedule(
+            start_date=f"{year}-01-01",
+            end_date=f"{year}-12-31",
+        )
+
+        _exchange_sessions[year] = pd.DataFrame(
+            {
+                "open": schedule["market_open"].dt.tz_convert(exchange_timezone),
+                "close": schedule["market_close"].dt.tz_convert(exchange_timezone),
+            },
+        ).set_index(schedule.index.date)
+
+    return _exchange_sessions[year]
 
 
 class PriceDataAvailabilityHelper:
@@ -18,7 +48,8 @@ class PriceDataAvailabilityHelper:
     based on provided last record date and current point in time in exchange.
     Determines if queried price data includes intraday values that should be avoided.
 
-    NOTE: This does not yet factor in exchange holidays or partial trading days.
+    Trading sessions of the exchange calendar are used,
+    so that exchange holidays and early closes are factored in.
     """
 
     @staticmethod
@@ -26,41 +57,37 @@ class PriceDataAvailabilityHelper:
         """
         Identify if prices need to be re-queried.
 
-        Re-query prices if either:
+        Re-query prices if last record date is before the last
+        trading session that already closed, therefore:
 
-        * Last record date is before previous business day.
-        * Last record date is previous business day and data available from exchange.
+        * Last record date is before previous trading session.
+        * Last record date is previous trading session and today's session closed.
 
         :param last_record_date: Last record date.
         :returns: Boolean indicating if prices need to be re-queried.
         """
 
-        # Get today date in configured exchange
-        configured_exchange_date = datetime.now(
+        # Get current point in time in configured exchange
+        configured_exchange_datetime = datetime.now(
             tz=ZoneInfo(EXCHANGE_TIME_ZONE_AND_HOURS[str(EXCHANGE)]["timezone"]),
-        ).date()
+        )
 
-        # Get previous business day
-        previous_business_day = configured_exchange_date - timedelta(days=1)
+        # Look back into the previous year as well,
+        # in case no session of this year closed yet
+        for year in (
+            configured_exchange_datetime.year,
+            configured_exchange_datetime.year - 1,
+        ):
+            exchange_sessions = get_exchange_sessions(year)
 
-        # If minus one day offset falls on weekend
-        # loop back until we get to the previous business day
-        while not is_busday(previous_business_day):
-            previous_business_day -= timedelta(days=1)
+            closed_sessions = exchange_sessions.index[
+                exchange_sessions["close"] <= configured_exchange_datetime
+            ]
 
-        # Check if the data is available from the exchange
-        data_available_from_exchange = (
-            PriceDataAvailabilityHelper.check_if_price_data_available_from_exchange(
-                configured_exchange_date,
-            )
-        )
+            if not closed_sessions.empty:
+                return last_record_date < closed_sessions[-1]
 
-        # Re-query prices
-        # if last record date is before previous business day
-        # or last record date is previous business day and data available from exchange
-        return last_record_date < previous_business_day or (
-            last_record_date == previous_business_day and data_available_from_exchange
-        )
+        return True
 
     @staticmethod
     def check_if_price_data_available_from_exchange(
@@ -73,23 +100,23 @@ class PriceDataAvailabilityHelper:
         :returns: Boolean indicating if data is available from exchange.
         """
 
-        # Check if today is a business day in configured exchange
-        is_business_day = bool(is_busday(configured_exchange_date))
+        # Get the session of the date, if it is a trading day
+        exchange_sessions = get_exchange_sessions(configured_exchange_date.year)
+
+        if configured_exchange_date not in exchange_sessions.index:
+            return False
 
         # Get the time in configured exchange
-        configured_exchange_time = datetime.now(
+        configured_exchange_datetime = datetime.now(
             tz=ZoneInfo(EXCHANGE_TIME_ZONE_AND_HOURS[str(EXCHANGE)]["timezone"]),
-        ).time()
-
-        # Get configured exchange closing hours
-        configured_exchange_close = datetime.strptime(
-            EXCHANGE_TIME_ZONE_AND_HOURS[str(EXCHANGE)]["hours"]["close"],
-            DEFAULT_TIME_FORMAT,
-        ).time()
+        )
 
-        # Check if it is after hours on business day
+        # Check if the session closed (possibly early)
         # assuming that, therefore, data is available from exchange
-        return is_business_day and configured_exchange_time >= configured_exchange_close
+        return (
+            configured_exchange_datetime
+            >= exchange_sessions.loc[configured_exchange_date, "close"]
+        )
 
     @staticmethod
     def check_if_price_data_includes_intraday(last_queried_date: date) -> bool:
@@ -100,36 +127,23 @@ class PriceDataAvailabilityHelper:
         :returns: Boolean indicating if queried price data includes intraday.
         """
 
-        # Get today date in configured exchange
-        configured_exchange_date = datetime.now(
-            tz=ZoneInfo(EXCHANGE_TIME_ZONE_AND_HOURS[str(EXCHANGE)]["timezone"]),
-        ).date()
-
-        # Check if today is a business day
-        is_business_day = bool(is_busday(configured_exchange_date))
-
-        # Get the time in configured exchange
-        configured_exchange_time = datetime.now(
+        # Get current point in time in configured exchange
+        configured_exchange_datetime = datetime.now(
             tz=ZoneInfo(EXCHANGE_TIME_ZONE_AND_HOURS[str(EXCHANGE)]["timezone"]),
-        ).time()
+        )
 
-        # Get configured exchange opening hours
-        configured_exchange_open = datetime.strptime(
-            EXCHANGE_TIME_ZONE_AND_HOURS[str(EXCHANGE)]["hours"]["open"],
-            DEFAULT_TIME_FORMAT,
-        ).time()
+        configured_exchange_date = configured_exchange_datetime.date()
 
-        # Get configured exchange closing hours
-        configured_exchange_close = datetime.strptime(
-            EXCHANGE_TIME_ZONE_AND_HOURS[str(EXCHANGE)]["hours"]["close"],
-            DEFAULT_TIME_FORMAT,
-        ).time()
+        # Get sessions of the year, today is a trading day
+        # only if it has a session
+        exchange_sessions = get_exchange_sessions(configured_exchange_date.year)
 
         # Check if last queried date is today
-        # and if the data was queried during exchange hours
-        return last_queried_date == configured_exchange_date and (
-            is_business_day
-            and configured_exchange_open
-            <= configured_exchange_time
-            <= configured_exchange_close
+        # and if the data was queried during the session
+        return (
+            last_queried_date == configured_exchange_date
+            and configured_exchange_date in exchange_sessions.index
+            and exchange_sessions.loc[configured_exchange_date, "open"]
+            <= configured_exchange_datetime
+            <= exchange_sessions.loc[configured_exchange_date, "close"]
         )
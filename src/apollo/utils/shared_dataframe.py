@@ -0,0 +1,175 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from types import TracebackType
+from typing import TypedDict
+
+import numpy as np
+import pandas as pd
+from pandas.api.extensions import ExtensionArray
+
+# Memory-backed file system, if available,
+# keeps published arrays off the disk
+#
+# NOTE: arrays are published into private
+# temporary directory created within it
+SHARED_MEMORY_DIR = Path("/dev/shm")  # noqa: S108
+
+
+class SharedDataframeDescriptor(TypedDict):
+    """Shared dataframe descriptor type definition."""
+
+    directory: str
+    columns: list[str]
+
+    # Columns that are not shared, since their values
+    # are Python objects, travel along with the descriptor
+    object_columns: dict[str, ExtensionArray]
+
+    # Index is small compared to the columns
+    # and travels along with the descriptor as well
+    index: pd.Index
+
+
+class SharedDataframe:
+    """
+    Shared Dataframe class.
+
+    Publishes columns of the dataframe once, as memory-mapped arrays,
+    so that worker processes can attach them without copying.
+
+    Published arrays are removed when the context is exited.
+
+    Usage example:
+
+    with SharedDataframe(dataframe) as descriptor:
+        with Pool(
+            initializer=attach_shared_dataframes,
+            initargs=({"prices": descriptor},),
+        ) as pool:
+            ...
+    """
+
+    def __init__(self, dataframe: pd.DataFrame) -> None:
+        """
+        Construct Shared Dataframe.
+
+        :param dataframe: Dataframe to publish.
+        """
+
+        self._dataframe = dataframe
+
+        self._directory: TemporaryDirectory | None = None
+
+    def __enter__(self) -> SharedDataframeDescriptor:
+        """
+        Publish the dataframe.
+
+        :returns: Descriptor to attach the dataframe with.
+        """
+
+        self._directory = TemporaryDirectory(
+            prefix="apollo-",
+            dir=SHARED_MEMORY_DIR if SHARED_MEMORY_DIR.is_dir() else None,
+        )
+
+        object_columns = {}
+
+        for position, column in enumerate(self._dataframe.columns):
+            series = self._dataframe.iloc[:, position]
+
+            # Python objects and extension types cannot be memory-mapped
+            if not isinstance(series.dtype, np.dtype) or series.dtype == object:
+                object_columns[column] = series.array
+
+                continue
+
+            np.save(Path(self._directory.name) / f"{position}.npy", series.to_numpy())
+
+        return {
+            "directory": self._directory.name,
+            "columns": list(self._dataframe.columns),
+            "object_columns": object_columns,
+            "index": self._dataframe.index,
+        }
+
+    def __exit__(
+        self,
+        exception_type: type[BaseException] | None,
+        exception: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """
+        Remove published arrays.
+
+        :param exception_type: Type of raised exception if any.
+        :param exception: Raised exception if any.
+        :param traceback: Traceback of raised exception if any.
+        """
+
+        if self._directory is not None:
+            self._directory.cleanup()
+            self._directory = None
+
+
+def load_shared_dataframe(descriptor: SharedDataframeDescriptor) -> pd.DataFrame:
+    """
+    Load published dataframe with read-only views of memory-mapped arrays.
+
+    :param descriptor: Descriptor of the published dataframe.
+    :returns: Read-only dataframe sharing memory with other processes.
+    """
+
+    columns = {}
+
+    for position, column in enumerate(descriptor["columns"]):
+        if column in descriptor["object_columns"]:
+            columns[column] = descriptor["object_columns"][column]
+
+            continue
+
+        columns[column] = np.asarray(
+            np.load(
+                Path(descriptor["directory"]) / f"{position}.npy",
+                mmap_mode="r",
+            ),
+        )
+
+    # NOTE: columns are not consolidated
+    # if they are not copied, each column
+    # keeps viewing its memory-mapped array
+    return pd.DataFrame(columns, index=descriptor["index"], copy=False)
+
+
+# Dataframes attached to this (worker) process by their names
+_attached_dataframes: dict[str, pd.DataFrame] = {}
+
+
+def attach_shared_dataframes(descriptors: dict[str, SharedDataframeDescriptor]) -> None:
+    """
+    Attach published dataframes to this process.
+
+    Meant to be used as initializer of the worker processes pool.
+
+    :param descriptors: Descriptors of the published dataframes by their names.
+    """
+
+    _attached_dataframes.clear()
+
+    for name, descriptor in descriptors.items():
+        _attached_dataframes[name] = load_shared_dataframe(descriptor)
+
+
+def get_shared_dataframe(name: str) -> pd.DataFrame:
+    """
+    Get dataframe attached to this process.
+
+    :param name: Name of the dataframe.
+    :returns: Read-only dataframe sharing memory with other processes.
+
+    :raises RuntimeError: If no such dataframe is attached to this process.
+    """
+
+    if name not in _attached_dataframes:
+        raise RuntimeError(f"Shared dataframe {name} is not attached to this process.")
+
+    return _attached_dataframes[name]
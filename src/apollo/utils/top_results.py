@@ -0,0 +1,104 @@
+from heapq import heappush, heapreplace
+from math import inf, isnan
+
+import pandas as pd
+
+
+def get_ranking_key(
+    results: pd.Series,
+    ranking_statistics: list[str],
+) -> tuple[float, ...]:
+    """
+    Get key backtesting results are ranked by, higher is better.
+
+    :param results: Series with backtesting statistics.
+    :param ranking_statistics: Statistics to rank by, in order of importance.
+    :returns: Tuple with ranking statistics.
+    """
+
+    # Missing statistics (e.g. Sharpe Ratio without trades)
+    # rank last, as they do when results are sorted
+    return tuple(
+        -inf if isnan(value := float(results[statistic])) else value
+        for statistic in ranking_statistics
+    )
+
+
+class TopResults:
+    """
+    Top Results class.
+
+    Accumulates backtesting results as they are produced,
+    keeping only the best ones ranked by given statistics.
+
+    Results are held in a bounded min-heap,
+    so the worst kept result is replaced in logarithmic time
+    and memory does not grow with the number of combinations.
+    """
+
+    def __init__(self, ranking_statistics: list[str], max_size: int | None) -> None:
+        """
+        Construct Top Results.
+
+        :param ranking_statistics: Statistics to rank by, in order of importance.
+        :param max_size: Maximum number of results to keep, all if not provided.
+        """
+
+        self._ranking_statistics = ranking_statistics
+        self._max_size = max_size
+
+        # NOTE: heap entries are ranking key, negated
+        # order of addition and the results themselves,
+        # so that earlier results win ties
+        self._entries: list[tuple[tuple[float, ...], int, pd.Series]] = []
+
+        self._added = 0
+
+    def __len__(self) -> int:
+        """
+        Get number of kept results.
+
+        :returns: Number of kept results.
+        """
+
+        return len(self._entries)
+
+    def add(self, results: pd.Series) -> None:
+        """
+        Add results of single backtesting run.
+
+        Private statistics (trades, equity curve and strategy)
+        are dropped, since they are heavy and never written.
+
+        :param results: Series with backtesting statistics and parameters.
+        """
+
+        entry = (
+            get_ranking_key(results, self._ranking_statistics),
+            -self._added,
+            results.drop(
+                [label for label in results.index if str(label).startswith("_")],
+            ),
+        )
+
+        self._added += 1
+
+        if self._max_size is None or len(self._entries) < self._max_size:
+            heappush(self._entries, entry)
+
+        # Replace the worst kept result if the new one is better
+        elif entry[:2] > self._entries[0][:2]:
+            heapreplace(self._entries, entry)
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Get kept results as dataframe.
+
+        :returns: Dataframe with kept results, from the best to the worst.
+        """
+
+        entries = sorted(self._entries, key=lambda entry: entry[:2], reverse=True)
+
+        return pd.DataFrame(
+            [results for _, _, results in entries],
+        ).reset_index(drop=True)
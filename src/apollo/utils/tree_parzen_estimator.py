@@ -0,0 +1,260 @@
+from math import ceil, prod
+
+import numpy as np
+
+# Share of the observed candidates considered good
+GOOD_FRACTION = 0.25
+
+# Number of observations proposals are sampled randomly before,
+# not enough to tell good regions of the grid from bad ones
+STARTUP_OBSERVATIONS = 10
+
+# Number of candidates sampled from good distribution for each proposal
+CANDIDATES_PER_PROPOSAL = 24
+
+# Weights of a value and its neighbours when smoothing the distributions,
+# values of each parameter are ordered, so that nearby values share evidence
+SMOOTHING_KERNEL = np.array([0.25, 0.5, 0.25])
+
+
+class TreeParzenEstimator:
+    """
+    Tree-structured Parzen Estimator class.
+
+    Proposes candidates of a grid of discrete parameter values
+    to evaluate, focusing on the regions where good ones were observed.
+
+    Observed candidates are split into good and bad ones by their score,
+    values of each parameter are modeled by smoothed categorical
+    distributions of both groups and candidates sampled from the good
+    distribution are ranked by their likelihood ratio of good to bad.
+
+    Candidates are addressed by their index in the grid, a mixed-radix
+    number with the last parameter changing the fastest.
+    """
+
+    def __init__(self, radices: list[int], seed: int | None = None) -> None:
+        """
+        Construct Tree-structured Parzen Estimator.
+
+        :param radices: Number of values of each parameter.
+        :param seed: Seed of the random generator.
+        """
+
+        self._radices = radices
+        self._size = prod(radices)
+
+        self._generator = np.random.default_rng(seed)
+
+        self._observations: dict[int, tuple[float, ...]] = {}
+        self._proposed: set[int] = set()
+
+    def __len__(self) -> int:
+        """
+        Get number of observed candidates.
+
+        :returns: Number of observed candidates.
+        """
+
+        return len(self._observations)
+
+    @property
+    def exhausted(self) -> bool:
+        """
+        Whether every candidate of the grid was proposed.
+
+        :returns: True if no candidate is left to propose.
+        """
+
+        return len(self._proposed) >= self._size
+
+    def propose(self, size: int) -> list[int]:
+        """
+        Propose candidates to evaluate next.
+
+        :param size: Number of candidates to propose.
+        :returns: Indices of proposed candidates, never proposed before.
+        """
+
+        size = min(size, self._size - len(self._proposed))
+
+        proposals: list[int] = []
+
+        # Model distributions only once there is enough evidence
+        densities = (
+            self._get_densities()
+            if len(self._observations) >= STARTUP_OBSERVATIONS
+            else None
+        )
+
+        while len(proposals) < size:
+            index = (
+                self._sample_promising_candidate(*densities)
+                if densities is not None
+                else None
+            )
+
+            # Fall back to a random candidate if all sampled ones were proposed
+            if index is None:
+                index = self._sample_random_candidate()
+
+            self._proposed.add(index)
+            proposals.append(index)
+
+        return proposals
+
+    def observe(self, index: int, score: tuple[float, ...]) -> None:
+        """
+        Observe score of the evaluated candidate.
+
+        :param index: Index of the candidate.
+        :param score: Score of the candidate, higher is better.
+        """
+
+        self._observations[index] = score
+
+    def _get_densities(self) -> tuple[list[np.ndarray], list[np.ndarray]]:
+        """
+        Get distributions of values of each parameter in good and bad candidates.
+
+        :returns: Good and bad distributions of each parameter.
+        """
+
+        ranked_indices = sorted(
+            self._observations,
+            key=lambda index: self._observations[index],
+            reverse=True,
+        )
+
+        good_size = max(ceil(len(ranked_indices) * GOOD_FRACTION), 1)
+
+        good_digits = np.array(
+            [self._get_digits(index) for index in ranked_indices[:good_size]],
+        )
+        bad_digits = np.array(
+            [self._get_digits(index) for index in ranked_indices[good_size:]],
+        ).reshape(-1, len(self._radices))
+
+        return (
+            [
+                self._get_density(good_digits[:, position], radix)
+                for position, radix in enumerate(self._radices)
+            ],
+            [
+                self._get_density(bad_digits[:, position], radix)
+                for position, radix in enumerate(self._radices)
+            ],
+        )
+
+    def _get_density(self, digits: np.ndarray, radix: int) -> np.ndarray:
+        """
+        Get smoothed distribution of values of single parameter.
+
+        :param digits: Positions of observed values of the parameter.
+        :param radix: Number of values of the parameter.
+        :returns: Probability of each value of the parameter.
+        """
+
+        # Uniform prior keeps every value possible
+        weights = np.bincount(digits, minlength=radix).astype(float) + 1.0
+
+        # NOTE: edges are padded with their own weights,
+        # so that they do not lose mass to the missing neighbours
+        weights = np.convolve(
+            np.pad(weights, 1, mode="edge"),
+            SMOOTHING_KERNEL,
+            mode="valid",
+        )
+
+        return weights / weights.sum()
+
+    def _sample_promising_candidate(
+        self,
+        good_densities: list[np.ndarray],
+        bad_densities: list[np.ndarray],
+    ) -> int | None:
+        """
+        Sample candidates from good distribution and pick the most promising one.
+
+        :param good_densities: Good distribution of each parameter.
+        :param bad_densities: Bad distribution of each parameter.
+        :returns: Index of the most promising candidate not proposed yet, if any.
+        """
+
+        digits = np.column_stack(
+            [
+                self._generator.choice(radix, size=CANDIDATES_PER_PROPOSAL, p=density)
+                for radix, density in zip(self._radices, good_densities, strict=True)
+            ],
+        )
+
+        # Ratio of good to bad likelihood, in log space
+        scores = sum(
+            np.log(good_density[digits[:, position]])
+            - np.log(bad_density[digits[:, position]])
+            for position, (good_density, bad_density) in enumerate(
+                zip(good_densities, bad_densities, strict=True),
+            )
+        )
+
+        for candidate in np.argsort(-scores, kind="stable"):
+            index = self._get_index(digits[candidate])
+
+            if index not in self._proposed:
+                return index
+
+        return None
+
+    def _sample_random_candidate(self) -> int:
+        """
+        Sample random candidate not proposed yet.
+
+        :returns: Index of the candidate.
+        """
+
+        # Rejection sampling is cheap while most of the grid is left,
+        # otherwise, pick among the remaining candidates directly
+        if len(self._proposed) < self._size // 2:
+            while (
+                index := int(self._generator.integers(self._size))
+            ) in self._proposed:
+                pass
+
+            return index
+
+        remaining = [
+            index for index in range(self._size) if index not in self._proposed
+        ]
+
+        return int(self._generator.choice(remaining))
+
+    def _get_digits(self, index: int) -> list[int]:
+        """
+        Decode index of the candidate into positions of values.
+
+        :param index: Index of the candidate.
+        :returns: Position of value for each parameter.
+        """
+
+        digits = []
+
+        for radix in reversed(self._radices):
+            index, digit = divmod(index, radix)
+            digits.append(digit)
+
+        return digits[::-1]
+
+    def _get_index(self, digits: np.ndarray) -> int:
+        """
+        Encode positions of values into index of the candidate.
+
+        :param digits: Position of value for each parameter.
+        :returns: Index of the candidate.
+        """
+
+        index = 0
+
+        for digit, radix in zip(digits, self._radices, strict=True):
+            index = index * radix + int(digit)
+
+        return index
@@ -5,7 +5,7 @@ import pytest
 from pandas import DataFrame
 
 from apollo.backtesters.backtesting_runner import BacktestingRunner
-from apollo.settings import BACKTESTING_CASH_SIZE, STRATEGY
+from apollo.settings import BACKTESTING_CASH_SIZE, STRATEGY, BacktestingEngine
 from tests.fixtures.files_and_directories import PLOT_DIR, TRDS_DIR
 
 
@@ -61,6 +61,65 @@ def test__backtesting_runner__for_running_the_process(
     assert stats["_strategy"] == STRATEGY
 
 
+@pytest.mark.usefixtures("dataframe")
+def test__backtesting_runner__for_running_the_native_engine(
+    dataframe: DataFrame,
+) -> None:
+    """
+    Test Backtesting Runner for running the native engine.
+
+    Backtesting runner must run the native engine and return statistics.
+    Statistics must have strategy name from environment variables.
+    """
+
+    dataframe["atr"] = 0
+    dataframe["signal"] = 0
+
+    backtesting_runner = BacktestingRunner(
+        dataframe=dataframe,
+        strategy_name=str(STRATEGY),
+        lot_size_cash=BACKTESTING_CASH_SIZE,
+        sl_volatility_multiplier=0.01,
+        tp_volatility_multiplier=0.01,
+        engine=BacktestingEngine.NATIVE,
+    )
+
+    stats = backtesting_runner.run()
+
+    assert stats is not None
+    assert stats["_strategy"] == STRATEGY
+
+
+@pytest.mark.usefixtures("dataframe")
+def test__backtesting_runner__with_native_engine_writing_result_plot(
+    dataframe: DataFrame,
+) -> None:
+    """
+    Test Backtesting Runner with native engine writing the result plot.
+
+    Backtesting runner must raise ValueError
+    if result plot is requested from native engine.
+    """
+
+    exception_message = "Native engine does not support writing result plot."
+
+    with pytest.raises(
+        ValueError,
+        match=exception_message,
+    ) as exception:
+        BacktestingRunner(
+            dataframe=dataframe,
+            strategy_name=str(STRATEGY),
+            lot_size_cash=BACKTESTING_CASH_SIZE,
+            sl_volatility_multiplier=0.01,
+            tp_volatility_multiplier=0.01,
+            write_result_plot=True,
+            engine=BacktestingEngine.NATIVE,
+        )
+
+    assert str(exception.value) == exception_message
+
+
 @pytest.mark.usefixtures("dataframe", "clean_data")
 @patch("apollo.backtesters.backtesting_runner.PLOT_DIR", PLOT_DIR)
 def test__backtesting_runner__for_creating_plots_directory(
@@ -0,0 +1,336 @@
+import numpy as np
+import pandas as pd
+import pytest
+from backtesting import Backtest
+
+from apollo.backtesters.native_backtesting_engine import (
+    NativeBacktestingEngine,
+    NativeBatchBacktestingEngine,
+)
+from apollo.backtesters.strategy_simulation_agent import StrategySimulationAgent
+from apollo.calculators.average_true_range import AverageTrueRangeCalculator
+from apollo.settings import BACKTESTING_CASH_SIZE, LONG_SIGNAL, NO_SIGNAL, SHORT_SIGNAL
+from tests.utils.precalculate_shared_values import precalculate_shared_values
+
+# Statistics mapped by BacktestingResults model
+MAPPED_STATISTICS = [
+    "Exposure Time [%]",
+    "Return [%]",
+    "Buy & Hold Return [%]",
+    "Return (Ann.) [%]",
+    "Volatility (Ann.) [%]",
+    "Sharpe Ratio",
+    "Sortino Ratio",
+    "Calmar Ratio",
+    "Max. Drawdown [%]",
+    "Avg. Drawdown [%]",
+    "Max. Drawdown Duration",
+    "Avg. Drawdown Duration",
+    "# Trades",
+    "Win Rate [%]",
+    "Best Trade [%]",
+    "Worst Trade [%]",
+    "Avg. Trade [%]",
+    "Max. Trade Duration",
+    "Avg. Trade Duration",
+    "SQN",
+]
+
+TRADES_COLUMNS = [
+    "Size",
+    "EntryBar",
+    "ExitBar",
+    "EntryPrice",
+    "ExitPrice",
+    "SL",
+    "TP",
+    "PnL",
+    "ReturnPct",
+    "EntryTime",
+    "ExitTime",
+]
+
+
+def create_random_walk_dataframe(bars: int, seed: int) -> pd.DataFrame:
+    """
+    Create dataframe with random walk prices, volatility and signals.
+
+    :param bars: Number of bars.
+    :param seed: Seed of the random generator.
+    :returns: Dataframe ready to be backtested.
+    """
+
+    generator = np.random.default_rng(seed)
+
+    close = 100 * np.exp(np.cumsum(generator.normal(0, 0.01, bars)))
+    open_ = close * (1 + generator.normal(0, 0.003, bars))
+    high = np.maximum(open_, close) * (1 + np.abs(generator.normal(0, 0.005, bars)))
+    low = np.minimum(open_, close) * (1 - np.abs(generator.normal(0, 0.005, bars)))
+
+    dataframe = pd.DataFrame(
+        {
+            "Open": open_,
+            "High": high,
+            "Low": low,
+            "Close": close,
+            "Volume": generator.integers(100_000, 1_000_000, bars),
+        },
+        index=pd.date_range("2000-01-03", periods=bars, freq="B", name="date"),
+    )
+
+    dataframe["atr"] = (dataframe["High"] - dataframe["Low"]).rolling(5, 1).mean()
+    dataframe["signal"] = generator.choice(
+        [NO_SIGNAL, LONG_SIGNAL, SHORT_SIGNAL],
+        size=bars,
+        p=[0.8, 0.1, 0.1],
+    )
+
+    return dataframe
+
+
+def mimic_backtesting_library(
+    dataframe: pd.DataFrame,
+    lot_size_cash: float,
+    sl_volatility_multiplier: float,
+    tp_volatility_multiplier: float,
+) -> pd.Series:
+    """
+    Mimic backtesting process as run by Backtesting Runner.
+
+    :param dataframe: Dataframe to backtest.
+    :param lot_size_cash: Initial cash amount to backtest with.
+    :param sl_volatility_multiplier: Stop loss volatility multiplier.
+    :param tp_volatility_multiplier: Take profit volatility multiplier.
+    :returns: Series with backtesting statistics.
+    """
+
+    StrategySimulationAgent.sl_volatility_multiplier = sl_volatility_multiplier
+    StrategySimulationAgent.tp_volatility_multiplier = tp_volatility_multiplier
+
+    return Backtest(
+        data=dataframe,
+        strategy=StrategySimulationAgent,
+        cash=lot_size_cash,
+        exclusive_orders=True,
+        trade_on_close=True,
+    ).run()
+
+
+def assert_statistics_parity(
+    control_stats: pd.Series,
+    stats: pd.Series,
+) -> None:
+    """
+    Assert statistics, trades and equity curves are identical.
+
+    :param control_stats: Statistics produced by backtesting library.
+    :param stats: Statistics produced by native engine.
+    """
+
+    pd.testing.assert_series_equal(
+        stats[MAPPED_STATISTICS],
+        control_stats[MAPPED_STATISTICS],
+    )
+
+    pd.testing.assert_frame_equal(
+        stats["_trades"][TRADES_COLUMNS],
+        control_stats["_trades"][TRADES_COLUMNS],
+        check_dtype=False,
+    )
+
+    pd.testing.assert_series_equal(
+        stats["_equity_curve"]["Equity"],
+        control_stats["_equity_curve"]["Equity"],
+    )
+
+
+@pytest.mark.parametrize("seed", range(10))
+@pytest.mark.parametrize(
+    ("sl_volatility_multiplier", "tp_volatility_multiplier"),
+    [(0.1, 0.1), (0.5, 1.0), (1.0, 0.5), (2.0, 2.0)],
+)
+def test__native_backtesting_engine__for_parity_with_backtesting_library(
+    seed: int,
+    sl_volatility_multiplier: float,
+    tp_volatility_multiplier: float,
+) -> None:
+    """
+    Test Native Backtesting Engine for parity with backtesting library.
+
+    Engine must produce the same statistics, trades and equity curve
+    as backtesting library running Strategy Simulation Agent.
+    """
+
+    dataframe = create_random_walk_dataframe(bars=500, seed=seed)
+
+    control_stats = mimic_backtesting_library(
+        dataframe=dataframe,
+        lot_size_cash=BACKTESTING_CASH_SIZE,
+        sl_volatility_multiplier=sl_volatility_multiplier,
+        tp_volatility_multiplier=tp_volatility_multiplier,
+    )
+
+    stats = NativeBacktestingEngine(
+        dataframe=dataframe,
+        lot_size_cash=BACKTESTING_CASH_SIZE,
+        sl_volatility_multiplier=sl_volatility_multiplier,
+        tp_volatility_multiplier=tp_volatility_multiplier,
+    ).run()
+
+    assert_statistics_parity(control_stats, stats)
+
+
+@pytest.mark.usefixtures("dataframe", "window_size")
+@pytest.mark.parametrize("signal", [NO_SIGNAL, LONG_SIGNAL, SHORT_SIGNAL])
+def test__native_backtesting_engine__for_parity_on_price_data(
+    dataframe: pd.DataFrame,
+    window_size: int,
+    signal: int,
+) -> None:
+    """
+    Test Native Backtesting Engine for parity on price data.
+
+    Engine must produce the same statistics, trades and equity curve
+    as backtesting library, including runs without any trades
+    and runs with trades left open at the end of the backtest.
+    """
+
+    dataframe = precalculate_shared_values(dataframe)
+
+    AverageTrueRangeCalculator(
+        dataframe=dataframe,
+        window_size=window_size,
+    ).calculate_average_true_range()
+
+    dataframe.dropna(inplace=True)
+
+    dataframe.rename(
+        columns={
+            "open": "Open",
+            "high": "High",
+            "low": "Low",
+            "close": "Close",
+            "volume": "Volume",
+        },
+        inplace=True,
+    )
+
+    # Alternate the signal with no signal
+    dataframe["signal"] = NO_SIGNAL
+    dataframe.iloc[::3, dataframe.columns.get_loc("signal")] = signal
+
+    control_stats = mimic_backtesting_library(
+        dataframe=dataframe,
+        lot_size_cash=BACKTESTING_CASH_SIZE,
+        sl_volatility_multiplier=0.5,
+        tp_volatility_multiplier=0.5,
+    )
+
+    stats = NativeBacktestingEngine(
+        dataframe=dataframe,
+        lot_size_cash=BACKTESTING_CASH_SIZE,
+        sl_volatility_multiplier=0.5,
+        tp_volatility_multiplier=0.5,
+    ).run()
+
+    assert_statistics_parity(control_stats, stats)
+
+
+def test__native_backtesting_engine__for_raising_on_invalid_brackets() -> None:
+    """
+    Test Native Backtesting Engine for raising on invalid brackets.
+
+    Engine must raise ValueError if stop loss of open trade is not positive.
+    """
+
+    dataframe = create_random_walk_dataframe(bars=50, seed=0)
+
+    # Enter single long trade,
+    # with limit entry far enough to be filled
+    dataframe["signal"] = NO_SIGNAL
+    dataframe.iloc[1, dataframe.columns.get_loc("signal")] = LONG_SIGNAL
+
+    exception_message = "Stop loss and take profit must be positive and finite."
+
+    with pytest.raises(
+        ValueError,
+        match=exception_message,
+    ) as exception:
+        NativeBacktestingEngine(
+            dataframe=dataframe,
+            lot_size_cash=BACKTESTING_CASH_SIZE,
+            sl_volatility_multiplier=1_000.0,
+            tp_volatility_multiplier=10.0,
+        ).run()
+
+    assert str(exception.value) == exception_message
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test__native_batch_backtesting_engine__for_parity_with_backtesting_library(
+    seed: int,
+) -> None:
+    """
+    Test Native Batch Backtesting Engine for parity with backtesting library.
+
+    Engine must produce the same Sharpe Ratio, return and number of trades
+    for each pair of multipliers as backtesting library running each pair.
+    """
+
+    dataframe = create_random_walk_dataframe(bars=500, seed=seed)
+
+    sl_volatility_multipliers = [0.1, 0.1, 0.5, 1.0, 2.0]
+    tp_volatility_multipliers = [0.1, 1.0, 0.5, 2.0, 0.1]
+
+    results = NativeBatchBacktestingEngine(
+        dataframe=dataframe,
+        lot_size_cash=BACKTESTING_CASH_SIZE,
+        sl_volatility_multipliers=sl_volatility_multipliers,
+        tp_volatility_multipliers=tp_volatility_multipliers,
+    ).run()
+
+    assert len(results) == len(sl_volatility_multipliers)
+
+    for pair, row in results.iterrows():
+        control_stats = mimic_backtesting_library(
+            dataframe=dataframe,
+            lot_size_cash=BACKTESTING_CASH_SIZE,
+            sl_volatility_multiplier=sl_volatility_multipliers[pair],
+            tp_volatility_multiplier=tp_volatility_multipliers[pair],
+        )
+
+        assert row["sl_volatility_multiplier"] == sl_volatility_multipliers[pair]
+        assert row["tp_volatility_multiplier"] == tp_volatility_multipliers[pair]
+
+        pd.testing.assert_series_equal(
+            row[["Sharpe Ratio", "Return [%]", "# Trades"]],
+            control_stats[["Sharpe Ratio", "Return [%]", "# Trades"]],
+            check_dtype=False,
+            check_names=False,
+        )
+
+
+def test__native_batch_backtesting_engine__for_raising_on_unpaired_multipliers() -> (
+    None
+):
+    """
+    Test Native Batch Backtesting Engine for raising on unpaired multipliers.
+
+    Engine must raise ValueError if there are more stop loss multipliers
+    than take profit multipliers or vice versa.
+    """
+
+    exception_message = "Each stop loss multiplier must have take profit pair."
+
+    with pytest.raises(
+        ValueError,
+        match=exception_message,
+    ) as exception:
+        NativeBatchBacktestingEngine(
+            dataframe=create_random_walk_dataframe(bars=50, seed=0),
+            lot_size_cash=BACKTESTING_CASH_SIZE,
+            sl_volatility_multipliers=[0.1, 0.5],
+            tp_volatility_multipliers=[0.1],
+        )
+
+    assert str(exception.value) == exception_message
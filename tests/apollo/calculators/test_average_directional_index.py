@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -200,3 +201,59 @@ def test__calculate_average_directional_movement_index__for_correct_calculation(
         dataframe["prev_dx_adx_ampl"],
         control_dataframe["prev_dx_adx_ampl"],
     )
+
+
+@pytest.mark.usefixtures("dataframe")
+def test__calculate_average_directional_movement_index_batch__for_window_parity(
+    dataframe: pd.DataFrame,
+) -> None:
+    """
+    Test calculate_average_directional_movement_index_batch for window parity.
+
+    Each column of resulting arrays must be identical to the column
+    calculated for the same window size alone.
+
+    Dataframe must be left untouched.
+    """
+
+    dataframe = precalculate_shared_values(dataframe)
+
+    window_sizes = [5, 10, 15, 20]
+
+    control_dataframe = dataframe.copy()
+
+    adx_calculator = AverageDirectionalMovementIndexCalculator
+    batch_result = adx_calculator.calculate_average_directional_movement_index_batch(
+        dataframe,
+        window_sizes,
+    )
+
+    pd.testing.assert_frame_equal(dataframe, control_dataframe)
+
+    for i, window_size in enumerate(window_sizes):
+        window_dataframe = control_dataframe.copy()
+
+        AverageTrueRangeCalculator(
+            dataframe=window_dataframe,
+            window_size=window_size,
+        ).calculate_average_true_range()
+
+        AverageDirectionalMovementIndexCalculator(
+            window_dataframe,
+            window_size,
+        ).calculate_average_directional_movement_index()
+
+        for column in (
+            "pdi",
+            "mdi",
+            "dx",
+            "dx_adx_ampl",
+            "prev_pdi",
+            "prev_mdi",
+            "prev_dx",
+            "prev_dx_adx_ampl",
+        ):
+            np.testing.assert_array_equal(
+                batch_result[column][:, i],
+                window_dataframe[column].to_numpy(),
+            )
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -141,6 +142,113 @@ def test__calculate_average_true_range__for_correct_atr_calculation(
     pd.testing.assert_series_equal(dataframe["atr"], control_dataframe["atr"])
 
 
+@pytest.mark.usefixtures("dataframe")
+@pytest.mark.parametrize("parity_window_size", [2, 5, 10, 15, 20])
+def test__calculate_average_true_range__for_parity_with_rolling_calculation(
+    dataframe: pd.DataFrame,
+    parity_window_size: int,
+) -> None:
+    """
+    Test calculate_average_true_range method for parity with rolling calculation.
+
+    Resulting TR and ATR columns must be identical to
+    the ones produced by rolling, per-window TR calculation
+    for every window size used throughout parameter files.
+    """
+
+    dataframe = precalculate_shared_values(dataframe)
+
+    control_dataframe = dataframe.copy()
+
+    control_dataframe["tr"] = (
+        control_dataframe["adj close"]
+        .rolling(
+            parity_window_size,
+        )
+        .apply(
+            mimic_calc_tr,
+            args=(control_dataframe,),
+        )
+    )
+
+    control_dataframe["atr"] = (
+        control_dataframe["tr"]
+        .ewm(
+            alpha=1 / parity_window_size,
+            min_periods=parity_window_size,
+            adjust=False,
+        )
+        .mean()
+    )
+
+    atr_calculator = AverageTrueRangeCalculator(
+        dataframe=dataframe,
+        window_size=parity_window_size,
+    )
+
+    atr_calculator.calculate_average_true_range()
+
+    pd.testing.assert_series_equal(dataframe["tr"], control_dataframe["tr"])
+    pd.testing.assert_series_equal(dataframe["atr"], control_dataframe["atr"])
+
+
+@pytest.mark.usefixtures("dataframe")
+def test__calculate_average_true_range_batch__for_window_parity(
+    dataframe: pd.DataFrame,
+) -> None:
+    """
+    Test calculate_average_true_range_batch for window parity.
+
+    Each column of resulting arrays must be identical to the column
+    calculated for the same window size alone.
+
+    Dataframe must be left untouched.
+    """
+
+    dataframe = precalculate_shared_values(dataframe)
+
+    window_sizes = [5, 10, 15, 20]
+
+    control_dataframe = dataframe.copy()
+
+    batch_result = AverageTrueRangeCalculator.calculate_average_true_range_batch(
+        dataframe,
+        window_sizes,
+    )
+
+    pd.testing.assert_frame_equal(dataframe, control_dataframe)
+
+    for i, window_size in enumerate(window_sizes):
+        window_dataframe = control_dataframe.copy()
+
+        AverageTrueRangeCalculator(
+            window_dataframe,
+            window_size,
+        ).calculate_average_true_range()
+
+        for column in ("tr", "atr"):
+            np.testing.assert_array_equal(
+                batch_result[column][:, i],
+                window_dataframe[column].to_numpy(),
+            )
+
+
+@pytest.mark.usefixtures("dataframe")
+def test__calculate_average_true_range_batch__for_raising_without_window_sizes(
+    dataframe: pd.DataFrame,
+) -> None:
+    """
+    Test calculate_average_true_range_batch method for raising without window sizes.
+
+    Batch calculation must raise ValueError if no window sizes are provided.
+    """
+
+    dataframe = precalculate_shared_values(dataframe)
+
+    with pytest.raises(ValueError, match="At least one window size is required"):
+        AverageTrueRangeCalculator.calculate_average_true_range_batch(dataframe, [])
+
+
 def mimic_calc_tr(series: pd.Series, dataframe: pd.DataFrame) -> float:
     """
     Mimicry of TR calculation for testing purposes.
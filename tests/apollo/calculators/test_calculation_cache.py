@@ -0,0 +1,252 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from apollo.calculators.average_true_range import AverageTrueRangeCalculator
+from apollo.calculators.calculation_cache import (
+    CALCULATION_CACHE,
+    CalculationCache,
+    cache_batch_calculation,
+)
+from apollo.calculators.hull_moving_average import HullMovingAverageCalculator
+from tests.utils.precalculate_shared_values import precalculate_shared_values
+
+
+def test__calculation_cache__for_least_recently_used_eviction() -> None:
+    """
+    Test CalculationCache for least recently used eviction.
+
+    Least recently used entry must be evicted once cache is full.
+    Hits, misses and evictions must be counted.
+    """
+
+    # Room for two single value columns
+    calculation_cache = CalculationCache(max_bytes=2 * np.dtype(np.float64).itemsize)
+
+    calculation_cache.put("first", {"column": np.array([1.0])})
+    calculation_cache.put("second", {"column": np.array([2.0])})
+
+    # Mark the first entry as recently used
+    assert calculation_cache.get("first") is not None
+
+    calculation_cache.put("third", {"column": np.array([3.0])})
+
+    assert calculation_cache.get("second") is None
+    assert calculation_cache.get("first") is not None
+    assert calculation_cache.get("third") is not None
+
+    assert calculation_cache.statistics == {
+        "hits": 3,
+        "misses": 1,
+        "evictions": 1,
+        "size": 2,
+        "bytes": 2 * np.dtype(np.float64).itemsize,
+    }
+
+
+def test__calculation_cache__for_eviction_by_total_size() -> None:
+    """
+    Test CalculationCache for eviction by total size.
+
+    Least recently used entries must be evicted until cached columns fit.
+    Columns larger than the cache must not be cached at all.
+    """
+
+    calculation_cache = CalculationCache(max_bytes=4 * np.dtype(np.float64).itemsize)
+
+    calculation_cache.put("first", {"column": np.zeros(1)})
+    calculation_cache.put("second", {"column": np.zeros(2)})
+
+    # Both previous entries must make room
+    calculation_cache.put("third", {"column": np.zeros(3)})
+
+    assert calculation_cache.statistics == {
+        "hits": 0,
+        "misses": 0,
+        "evictions": 2,
+        "size": 1,
+        "bytes": 3 * np.dtype(np.float64).itemsize,
+    }
+
+    calculation_cache.put("oversized", {"column": np.zeros(5)})
+
+    assert calculation_cache.get("oversized") is None
+    assert calculation_cache.get("third") is not None
+
+
+@pytest.mark.usefixtures("dataframe", "window_size")
+def test__memoize_calculation__for_identical_columns_on_hit(
+    dataframe: pd.DataFrame,
+    window_size: int,
+) -> None:
+    """
+    Test memoize_calculation decorator for identical columns on hit.
+
+    Repeated calculation over the same data must be served from the cache,
+    producing the same columns as the original calculation.
+    """
+
+    CALCULATION_CACHE.clear()
+
+    dataframe = precalculate_shared_values(dataframe)
+    control_dataframe = dataframe.copy()
+
+    AverageTrueRangeCalculator(
+        dataframe=control_dataframe,
+        window_size=window_size,
+    ).calculate_average_true_range()
+
+    AverageTrueRangeCalculator(
+        dataframe=dataframe,
+        window_size=window_size,
+    ).calculate_average_true_range()
+
+    assert CALCULATION_CACHE.statistics["misses"] == 1
+    assert CALCULATION_CACHE.statistics["hits"] == 1
+
+    pd.testing.assert_frame_equal(dataframe, control_dataframe)
+
+
+@pytest.mark.usefixtures("dataframe", "window_size")
+def test__memoize_calculation__for_cache_isolated_from_dataframe(
+    dataframe: pd.DataFrame,
+    window_size: int,
+) -> None:
+    """
+    Test memoize_calculation decorator for cache isolated from dataframe.
+
+    Modifying output columns in place must not corrupt cached results.
+    """
+
+    CALCULATION_CACHE.clear()
+
+    hma_calculator = HullMovingAverageCalculator(
+        dataframe=dataframe.copy(),
+        window_size=window_size,
+    )
+    hma_calculator.calculate_hull_moving_average()
+
+    control_hma = hma_calculator._dataframe["hma"].copy()  # noqa: SLF001
+
+    hit_dataframe = dataframe.copy()
+
+    HullMovingAverageCalculator(
+        dataframe=hit_dataframe,
+        window_size=window_size,
+    ).calculate_hull_moving_average()
+
+    # Corrupt the column served from the cache
+    hit_dataframe.loc[:, "hma"] = 0.0
+
+    control_dataframe = dataframe.copy()
+
+    HullMovingAverageCalculator(
+        dataframe=control_dataframe,
+        window_size=window_size,
+    ).calculate_hull_moving_average()
+
+    assert CALCULATION_CACHE.statistics == {
+        "hits": 2,
+        "misses": 1,
+        "evictions": 0,
+        "size": 1,
+        "bytes": len(dataframe) * np.dtype(np.float64).itemsize,
+    }
+
+    pd.testing.assert_series_equal(control_dataframe["hma"], control_hma)
+
+
+@pytest.mark.usefixtures("dataframe", "window_size")
+def test__memoize_calculation__for_miss_on_changed_data_or_parameters(
+    dataframe: pd.DataFrame,
+    window_size: int,
+) -> None:
+    """
+    Test memoize_calculation decorator for miss on changed data or parameters.
+
+    Calculation must run again if input columns or parameters change.
+    """
+
+    CALCULATION_CACHE.clear()
+
+    HullMovingAverageCalculator(
+        dataframe=dataframe.copy(),
+        window_size=window_size,
+    ).calculate_hull_moving_average()
+
+    changed_dataframe = dataframe.copy()
+    changed_dataframe.iloc[-1, changed_dataframe.columns.get_loc("adj close")] += 1
+
+    HullMovingAverageCalculator(
+        dataframe=changed_dataframe,
+        window_size=window_size,
+    ).calculate_hull_moving_average()
+
+    HullMovingAverageCalculator(
+        dataframe=dataframe.copy(),
+        window_size=window_size + 1,
+    ).calculate_hull_moving_average()
+
+    assert CALCULATION_CACHE.statistics == {
+        "hits": 0,
+        "misses": 3,
+        "evictions": 0,
+        "size": 3,
+        "bytes": 3 * len(dataframe) * np.dtype(np.float64).itemsize,
+    }
+
+
+@pytest.mark.usefixtures("dataframe")
+def test__cache_batch_calculation__for_hits_of_memoized_calculation(
+    dataframe: pd.DataFrame,
+) -> None:
+    """
+    Test cache_batch_calculation function for hits of memoized calculation.
+
+    Memoized calculation of each window size must be served from the cache,
+    producing the same columns as the calculation run alone.
+    """
+
+    window_sizes = [5, 10]
+
+    dataframe = precalculate_shared_values(dataframe)
+
+    control_dataframes = {}
+
+    for window_size in window_sizes:
+        control_dataframes[window_size] = dataframe.copy()
+
+        AverageTrueRangeCalculator(
+            dataframe=control_dataframes[window_size],
+            window_size=window_size,
+        ).calculate_average_true_range()
+
+    CALCULATION_CACHE.clear()
+
+    cache_batch_calculation(
+        AverageTrueRangeCalculator.calculate_average_true_range,
+        [
+            AverageTrueRangeCalculator(dataframe, window_size)
+            for window_size in window_sizes
+        ],
+        AverageTrueRangeCalculator.calculate_average_true_range_batch(
+            dataframe,
+            window_sizes,
+        ),
+    )
+
+    for window_size in window_sizes:
+        window_dataframe = dataframe.copy()
+
+        AverageTrueRangeCalculator(
+            dataframe=window_dataframe,
+            window_size=window_size,
+        ).calculate_average_true_range()
+
+        pd.testing.assert_frame_equal(
+            window_dataframe,
+            control_dataframes[window_size],
+        )
+
+    assert CALCULATION_CACHE.statistics["misses"] == 0
+    assert CALCULATION_CACHE.statistics["hits"] == len(window_sizes)
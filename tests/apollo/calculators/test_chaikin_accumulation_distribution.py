@@ -93,6 +93,57 @@ def test__calculate_chaikin_accumulation_distribution_line__for_correct_adl_calc
     pd.testing.assert_series_equal(dataframe["prev_adl"], control_dataframe["prev_adl"])
 
 
+@pytest.mark.usefixtures("dataframe", "window_size")
+def test__calculate_chaikin_accumulation_distribution_line__for_zero_range_bars(
+    dataframe: pd.DataFrame,
+    window_size: int,
+) -> None:
+    """
+    Test calculate_chaikin_accumulation_distribution_line for zero-range bars.
+
+    Bars where high equals low must resolve to the same
+    missing and infinite values as the rolling calculation.
+    """
+
+    # Flatten one bar completely and one bar
+    # with close outside of its zero range
+    flat_bar = dataframe.index[window_size * 2]
+    flat_bar_with_gap = dataframe.index[window_size * 4]
+
+    dataframe.loc[flat_bar, ["adj high", "adj close"]] = dataframe.loc[
+        flat_bar,
+        "adj low",
+    ]
+    dataframe.loc[flat_bar_with_gap, "adj high"] = dataframe.loc[
+        flat_bar_with_gap,
+        "adj low",
+    ]
+
+    accumulation_distribution_line = (
+        np.full((1, window_size - 1), np.nan).flatten().tolist()
+    )
+
+    control_dataframe = dataframe.copy()
+
+    control_dataframe["adj close"].rolling(window_size).apply(
+        mimic_calc_adl,
+        args=(
+            control_dataframe,
+            accumulation_distribution_line,
+        ),
+    )
+
+    control_dataframe["adl"] = accumulation_distribution_line
+
+    cad_calculator = ChaikinAccumulationDistributionCalculator(
+        dataframe=dataframe,
+        window_size=window_size,
+    )
+    cad_calculator.calculate_chaikin_accumulation_distribution_line()
+
+    pd.testing.assert_series_equal(dataframe["adl"], control_dataframe["adl"])
+
+
 def mimic_calc_adl(
     series: pd.Series,
     dataframe: pd.DataFrame,
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -102,3 +103,42 @@ def test__calculate_distribution_moments__for_correct_moments_calculation(
     pd.testing.assert_series_equal(dataframe["kurt"], control_dataframe["kurt"])
 
     pd.testing.assert_series_equal(dataframe["z_score"], control_dataframe["z_score"])
+
+
+@pytest.mark.usefixtures("dataframe")
+def test__calculate_distribution_moments_batch__for_window_parity(
+    dataframe: pd.DataFrame,
+) -> None:
+    """
+    Test calculate_distribution_moments_batch for window parity.
+
+    Each column of resulting arrays must be identical to the column
+    calculated for the same window size alone.
+
+    Dataframe must be left untouched.
+    """
+
+    window_sizes = [5, 10, 15, 20]
+
+    control_dataframe = dataframe.copy()
+
+    batch_result = DistributionMomentsCalculator.calculate_distribution_moments_batch(
+        dataframe,
+        window_sizes,
+    )
+
+    pd.testing.assert_frame_equal(dataframe, control_dataframe)
+
+    for i, window_size in enumerate(window_sizes):
+        window_dataframe = control_dataframe.copy()
+
+        DistributionMomentsCalculator(
+            window_dataframe,
+            window_size,
+        ).calculate_distribution_moments()
+
+        for column in ("avg", "std", "skew", "kurt", "z_score"):
+            np.testing.assert_array_equal(
+                batch_result[column][:, i],
+                window_dataframe[column].to_numpy(),
+            )
@@ -97,6 +97,87 @@ def test__calculate_hull_moving_average__for_correct_hma_calculation(
     pd.testing.assert_series_equal(dataframe["hma"], control_dataframe["hma"])
 
 
+@pytest.mark.usefixtures("dataframe")
+@pytest.mark.parametrize("parity_window_size", [2, 5, 10, 15, 20])
+def test__calculate_hull_moving_average__for_parity_with_rolling_calculation(
+    dataframe: pd.DataFrame,
+    parity_window_size: int,
+) -> None:
+    """
+    Test calculate_hull_moving_average method for parity with rolling calculation.
+
+    Resulting "hma" column must be identical to the one produced by
+    rolling, per-window WMA calculation for every window size
+    used throughout parameter files.
+    """
+
+    control_dataframe = dataframe.copy()
+
+    wma_difference = 2 * _calc_wma(
+        control_dataframe["adj close"],
+        parity_window_size // 2,
+    ) - _calc_wma(
+        control_dataframe["adj close"],
+        parity_window_size,
+    )
+
+    control_dataframe["hma"] = _calc_wma(
+        wma_difference,
+        int(np.sqrt(parity_window_size)),
+    )
+
+    hma_calculator = HullMovingAverageCalculator(
+        dataframe=dataframe,
+        window_size=parity_window_size,
+    )
+    hma_calculator.calculate_hull_moving_average()
+
+    pd.testing.assert_series_equal(
+        dataframe["hma"],
+        control_dataframe["hma"],
+        check_exact=True,
+    )
+
+
+@pytest.mark.usefixtures("dataframe")
+def test__calculate_hull_moving_average_batch__for_window_parity(
+    dataframe: pd.DataFrame,
+) -> None:
+    """
+    Test calculate_hull_moving_average_batch for window parity.
+
+    Each column of resulting arrays must be identical to the column
+    calculated for the same window size alone.
+
+    Dataframe must be left untouched.
+    """
+
+    window_sizes = [5, 10, 15, 20]
+
+    control_dataframe = dataframe.copy()
+
+    batch_result = HullMovingAverageCalculator.calculate_hull_moving_average_batch(
+        dataframe,
+        window_sizes,
+    )
+
+    pd.testing.assert_frame_equal(dataframe, control_dataframe)
+
+    for i, window_size in enumerate(window_sizes):
+        window_dataframe = control_dataframe.copy()
+
+        HullMovingAverageCalculator(
+            window_dataframe,
+            window_size,
+        ).calculate_hull_moving_average()
+
+        for column in ("hma",):
+            np.testing.assert_array_equal(
+                batch_result[column][:, i],
+                window_dataframe[column].to_numpy(),
+            )
+
+
 def _calc_wma(
     series: pd.Series,
     window_size: int,
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -84,3 +85,44 @@ def test__calculate_kaufman_efficiency_ratio__for_correct_ker_calculation(
     ker_calculator.calculate_kaufman_efficiency_ratio()
 
     pd.testing.assert_series_equal(dataframe["ker"], control_dataframe["ker"])
+
+
+@pytest.mark.usefixtures("dataframe")
+def test__calculate_kaufman_efficiency_ratio_batch__for_window_parity(
+    dataframe: pd.DataFrame,
+) -> None:
+    """
+    Test calculate_kaufman_efficiency_ratio_batch for window parity.
+
+    Each column of resulting arrays must be identical to the column
+    calculated for the same window size alone.
+
+    Dataframe must be left untouched.
+    """
+
+    window_sizes = [5, 10, 15, 20]
+
+    control_dataframe = dataframe.copy()
+
+    batch_result = (
+        KaufmanEfficiencyRatioCalculator.calculate_kaufman_efficiency_ratio_batch(
+            dataframe,
+            window_sizes,
+        )
+    )
+
+    pd.testing.assert_frame_equal(dataframe, control_dataframe)
+
+    for i, window_size in enumerate(window_sizes):
+        window_dataframe = control_dataframe.copy()
+
+        KaufmanEfficiencyRatioCalculator(
+            window_dataframe,
+            window_size,
+        ).calculate_kaufman_efficiency_ratio()
+
+        for column in ("ker",):
+            np.testing.assert_array_equal(
+                batch_result[column][:, i],
+                window_dataframe[column].to_numpy(),
+            )
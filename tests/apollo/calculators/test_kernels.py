@@ -0,0 +1,112 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from apollo.calculators import kernels
+from apollo.settings import MISSING_DATA_PLACEHOLDER
+
+
+@pytest.mark.usefixtures("dataframe", "window_size")
+def test__shift__for_parity_with_pandas_shift(
+    dataframe: pd.DataFrame,
+    window_size: int,
+) -> None:
+    """
+    Test shift kernel for parity with Pandas shift.
+
+    Resulting array must be identical to shifted series
+    for any number of periods, including periods beyond series length.
+    """
+
+    adj_close = dataframe["adj close"]
+
+    for periods in (1, 2, window_size, adj_close.shape[0] + 1):
+        np.testing.assert_array_equal(
+            kernels.shift(adj_close.to_numpy(dtype=np.float64), periods),
+            adj_close.shift(periods).to_numpy(),
+        )
+
+
+def test__where_present__for_zeroing_missing_data() -> None:
+    """
+    Test where_present kernel for zeroing missing data.
+
+    Values must be kept where source data is present and zeroed otherwise.
+    """
+
+    source = np.array([1.0, MISSING_DATA_PLACEHOLDER, 3.0, np.nan])
+    values = np.array([10.0, 20.0, 30.0, 40.0])
+
+    np.testing.assert_array_equal(
+        kernels.where_present(source, values, MISSING_DATA_PLACEHOLDER),
+        np.array([10.0, 0.0, 30.0, 40.0]),
+    )
+
+
+def test__percentage_change__for_parity_with_pandas_pct_change() -> None:
+    """
+    Test percentage_change kernel for parity with Pandas pct_change.
+
+    Missing values must be forward filled before calculation,
+    as Pandas does with its default fill method.
+    """
+
+    values = np.array([np.nan, 1.0, 2.0, np.nan, 4.0, MISSING_DATA_PLACEHOLDER, 5.0])
+
+    np.testing.assert_array_equal(
+        kernels.percentage_change(values),
+        pd.Series(values).ffill().pct_change(fill_method=None).to_numpy(),
+    )
+
+
+@pytest.mark.usefixtures("dataframe", "window_size")
+def test__kernels__for_leaving_inputs_untouched(
+    dataframe: pd.DataFrame,
+    window_size: int,
+) -> None:
+    """
+    Test kernels for leaving inputs untouched.
+
+    Kernels must not modify arrays passed to them.
+    """
+
+    adj_high = dataframe["adj high"].to_numpy(dtype=np.float64)
+    adj_low = dataframe["adj low"].to_numpy(dtype=np.float64)
+    adj_close = dataframe["adj close"].to_numpy(dtype=np.float64)
+
+    control_high = adj_high.copy()
+    control_low = adj_low.copy()
+    control_close = adj_close.copy()
+
+    true_range = kernels.true_range(adj_high, adj_low, kernels.shift(adj_close))
+    control_true_range = true_range.copy()
+
+    kernels.mask_warm_up(true_range, window_size)
+    kernels.hull_moving_average(adj_close, window_size)
+    kernels.linear_regression_channel(adj_close, window_size, 1.0)
+    kernels.swing_events(adj_high, adj_low, adj_close, window_size, 0.03, 1.0, -1.0)
+
+    np.testing.assert_array_equal(adj_high, control_high)
+    np.testing.assert_array_equal(adj_low, control_low)
+    np.testing.assert_array_equal(adj_close, control_close)
+    np.testing.assert_array_equal(true_range, control_true_range)
+
+
+def test__weighted_true_range__with_invalid_base_calculation() -> None:
+    """
+    Test weighted_true_range kernel with invalid base calculation.
+
+    The provided value for calculation of Weighted True Range is invalid.
+
+    Kernel must raise ValueError if base calculation is invalid.
+    """
+
+    exception_message = "Provided diff_index is invalid. Base calculation is faulty."
+
+    with pytest.raises(
+        ValueError,
+        match=exception_message,
+    ) as exception:
+        kernels.weighted_true_range(999, 1, 1, 1, 1, 0.9, 0.1)
+
+    assert str(exception.value) == exception_message
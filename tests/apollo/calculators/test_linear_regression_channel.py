@@ -77,9 +77,8 @@ def test__calculate_linear_regression_channel__for_correct_indices(
     """
     Test calculate_linear_regression_channel method for correct indices.
 
-    Since channel calculation relies on using numerical indices
-    for linear regression, dataframe must be reset before calculation;
-    and reset back to date after calculation.
+    Channel calculation uses positions within the rolling
+    window for linear regression and must not alter the index.
 
     Resulting dataframe must have "date" as index.
     Resulting dataframe must have "date" as index dtype.
@@ -151,6 +150,105 @@ def test__calculate_linear_regression_channel__for_correct_calculation(
     pd.testing.assert_series_equal(dataframe["u_bound"], control_dataframe["u_bound"])
 
 
+@pytest.mark.usefixtures("dataframe")
+@pytest.mark.parametrize("parity_window_size", [5, 10, 15, 20])
+@pytest.mark.parametrize("parity_channel_sd_spread", [0.1, 1.0])
+def test__calculate_linear_regression_channel__for_parity_with_linregress(
+    dataframe: pd.DataFrame,
+    parity_window_size: int,
+    parity_channel_sd_spread: float,
+) -> None:
+    """
+    Test calculate_linear_regression_channel method for parity with linregress.
+
+    Resulting slopes and bounds derived from rolling sums must
+    match rolling linregress output within numerical tolerance
+    for every window size used throughout parameter files.
+    """
+
+    t_slope = np.full((1, parity_window_size - 1), np.nan).flatten().tolist()
+    l_bound = np.full((1, parity_window_size - 1), np.nan).flatten().tolist()
+    u_bound = np.full((1, parity_window_size - 1), np.nan).flatten().tolist()
+
+    control_dataframe = dataframe.copy()
+    control_dataframe.reset_index(inplace=True)
+
+    control_dataframe["adj close"].rolling(parity_window_size).apply(
+        mimic_calc_lin_reg,
+        args=(
+            t_slope,
+            l_bound,
+            u_bound,
+            parity_channel_sd_spread,
+        ),
+    )
+
+    control_dataframe.set_index("date", inplace=True)
+
+    control_dataframe["slope"] = t_slope
+    control_dataframe["l_bound"] = l_bound
+    control_dataframe["u_bound"] = u_bound
+
+    lrc_calculator = LinearRegressionChannelCalculator(
+        dataframe=dataframe,
+        window_size=parity_window_size,
+        channel_sd_spread=parity_channel_sd_spread,
+    )
+
+    lrc_calculator.calculate_linear_regression_channel()
+
+    for column in ["slope", "l_bound", "u_bound"]:
+        pd.testing.assert_series_equal(
+            dataframe[column],
+            control_dataframe[column],
+            rtol=1e-9,
+            atol=1e-9,
+        )
+
+
+@pytest.mark.usefixtures("dataframe")
+def test__calculate_linear_regression_channel_batch__for_window_parity(
+    dataframe: pd.DataFrame,
+) -> None:
+    """
+    Test calculate_linear_regression_channel_batch for window parity.
+
+    Each column of resulting arrays must be identical to the column
+    calculated for the same window size alone.
+
+    Dataframe must be left untouched.
+    """
+
+    window_sizes = [5, 10, 15, 20]
+
+    control_dataframe = dataframe.copy()
+
+    batch_result = (
+        LinearRegressionChannelCalculator.calculate_linear_regression_channel_batch(
+            dataframe,
+            window_sizes,
+            CHANNEL_SD_SPREAD,
+        )
+    )
+
+    pd.testing.assert_frame_equal(dataframe, control_dataframe)
+
+    for i, window_size in enumerate(window_sizes):
+        window_dataframe = control_dataframe.copy()
+
+        LinearRegressionChannelCalculator(
+            window_dataframe,
+            window_size,
+            CHANNEL_SD_SPREAD,
+        ).calculate_linear_regression_channel()
+
+        for column in ("slope", "prev_slope", "l_bound", "u_bound"):
+            np.testing.assert_array_equal(
+                batch_result[column][:, i],
+                window_dataframe[column].to_numpy(),
+            )
+
+
 def mimic_calc_lin_reg(
     series: pd.Series,
     t_slope: list[float],
@@ -4,6 +4,7 @@ import numpy as np
 import pandas as pd
 import pytest
 
+from apollo.calculators.kernels import _swing_events
 from apollo.calculators.swing_events import SwingEventsCalculator
 
 UP_SWING = 1.0
@@ -100,6 +101,40 @@ def test__calculate_swing_events__for_correct_swing_events_calculation(
     pd.testing.assert_series_equal(dataframe["se"], control_dataframe["se"])
 
 
+@pytest.mark.usefixtures("dataframe", "window_size")
+def test__calculate_swing_events__for_parity_between_kernel_backends(
+    dataframe: pd.DataFrame,
+    window_size: int,
+) -> None:
+    """
+    Test calculate_swing_events method for parity between kernel backends.
+
+    Resulting SE column must be identical to the one
+    produced by pure Python fallback of the kernel,
+    regardless of whether compiled kernel is available.
+    """
+
+    control_swing_events = _swing_events(
+        dataframe["adj high"].to_numpy(dtype=np.float64),
+        dataframe["adj low"].to_numpy(dtype=np.float64),
+        dataframe["adj close"].to_numpy(dtype=np.float64),
+        window_size,
+        SWING_FILTER,
+        UP_SWING,
+        DOWN_SWING,
+    )
+
+    sm_calculator = SwingEventsCalculator(
+        dataframe=dataframe,
+        window_size=window_size,
+        swing_filter=SWING_FILTER,
+    )
+
+    sm_calculator.calculate_swing_events()
+
+    np.testing.assert_array_equal(dataframe["se"].to_numpy(), control_swing_events)
+
+
 def mimic_calc_se(
     series: pd.Series,
     dataframe: pd.DataFrame,
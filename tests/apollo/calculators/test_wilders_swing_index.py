@@ -69,36 +69,6 @@ def test__calculate_swing_index__for_correct_rolling_window(
     assert dataframe["sp"].isna().sum() == window_size
 
 
-@pytest.mark.usefixtures("dataframe", "window_size")
-def test__calc_wtr__with_invalid_base_calculation(
-    dataframe: pd.DataFrame,
-    window_size: int,
-) -> None:
-    """
-    Test calc_wtr method with invalid base calculation.
-
-    The provided value for calculation of Weighted True Range is invalid.
-
-    WildersSwingIndexCalculator must raise ValueError if base calculation is invalid.
-    """
-
-    wsi_calculator = WildersSwingIndexCalculator(
-        dataframe=dataframe,
-        window_size=window_size,
-        weighted_tr_multiplier=WEIGHTED_TR_MULTIPLIER,
-    )
-
-    exception_message = "Provided diff_index is invalid. Base calculation is faulty."
-
-    with pytest.raises(
-        ValueError,
-        match=exception_message,
-    ) as exception:
-        wsi_calculator._calc_wtr(999, 1, 1, 1, 1)  # noqa: SLF001
-
-    assert str(exception.value) == exception_message
-
-
 @pytest.mark.usefixtures("dataframe", "window_size")
 def test__calculate_swing_index__for_correct_sp_calculation(
     dataframe: pd.DataFrame,
@@ -161,6 +131,67 @@ def test__calculate_swing_index__for_correct_sp_calculation(
     pd.testing.assert_series_equal(dataframe["sp"], control_dataframe["sp"])
 
 
+@pytest.mark.usefixtures("dataframe")
+@pytest.mark.parametrize("parity_window_size", [5, 10, 15, 20])
+def test__calculate_swing_index__for_parity_with_rolling_calculation(
+    dataframe: pd.DataFrame,
+    parity_window_size: int,
+) -> None:
+    """
+    Test calculate_swing_index method for parity with rolling calculation.
+
+    Resulting SP column must be identical to the one produced
+    by rolling, per-window SI, ASI, and HLSP calculation
+    for every window size used throughout parameter files.
+    """
+
+    dataframe = precalculate_shared_values(dataframe)
+
+    control_dataframe = dataframe.copy()
+
+    swing_points: list[float] = (
+        np.full((1, parity_window_size - 1), np.nan).flatten().tolist()
+    )
+
+    control_dataframe["prev_open"] = control_dataframe["adj open"].shift(1)
+
+    control_dataframe["si"] = (
+        control_dataframe["adj close"]
+        .rolling(parity_window_size)
+        .apply(
+            mimic_calc_si,
+            args=(control_dataframe,),
+        )
+    )
+
+    control_dataframe["asi"] = (
+        control_dataframe["adj close"]
+        .rolling(parity_window_size)
+        .apply(
+            mimic_calc_asi,
+            args=(control_dataframe,),
+        )
+    )
+
+    control_dataframe["adj close"].rolling(parity_window_size).apply(
+        mimic_calc_hlsp,
+        args=(control_dataframe, parity_window_size, swing_points),
+    )
+
+    control_dataframe["sp"] = swing_points
+    control_dataframe["sp"] = control_dataframe["sp"].shift(1)
+
+    wsi_calculator = WildersSwingIndexCalculator(
+        dataframe=dataframe,
+        window_size=parity_window_size,
+        weighted_tr_multiplier=WEIGHTED_TR_MULTIPLIER,
+    )
+
+    wsi_calculator.calculate_swing_index()
+
+    pd.testing.assert_series_equal(dataframe["sp"], control_dataframe["sp"])
+
+
 def mimic_calc_si(series: pd.Series, dataframe: pd.DataFrame) -> float:
     """
     Mimicry of SI calculation for testing purposes.
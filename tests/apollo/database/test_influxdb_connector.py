@@ -0,0 +1,127 @@
+from unittest.mock import Mock, call, patch
+
+import pytest
+
+from apollo.connectors.database.influxdb_connector import (
+    InfluxDbConnector,
+    _clients,
+    close_influxdb_clients,
+    get_influxdb_client,
+)
+from apollo.settings import (
+    FREQUENCY,
+    INFLUXDB_ORG,
+    INFLUXDB_TOKEN,
+    INFLUXDB_URL,
+    TICKER,
+)
+
+PARENT_PROCESS_ID = 1
+CHILD_PROCESS_ID = 2
+
+CLIENT_PARAMETERS = {
+    "url": str(INFLUXDB_URL),
+    "org": INFLUXDB_ORG,
+    "token": INFLUXDB_TOKEN,
+}
+
+
+@pytest.fixture(autouse=True)
+def clear_influxdb_clients() -> None:
+    """Start each test without InfluxDB clients."""
+
+    _clients.clear()
+
+
+@patch("apollo.connectors.database.influxdb_connector.InfluxDBClient")
+def test__get_influxdb_client__for_reusing_client_within_process(
+    influxdb_client: Mock,
+) -> None:
+    """
+    Test get_influxdb_client function for reusing client within process.
+
+    Function must create client on first use only.
+    Function must return the same client to every connector of the process.
+    """
+
+    influxdb_client.return_value.query_api.return_value.query.return_value = []
+
+    for _ in range(2):
+        InfluxDbConnector().get_last_record_date(str(TICKER), str(FREQUENCY))
+
+    influxdb_client.assert_called_once_with(**CLIENT_PARAMETERS)
+
+    influxdb_client.return_value.close.assert_not_called()
+
+
+@patch("apollo.connectors.database.influxdb_connector.InfluxDBClient")
+def test__get_influxdb_client__for_creating_client_in_forked_process(
+    influxdb_client: Mock,
+) -> None:
+    """
+    Test get_influxdb_client function for creating client in forked process.
+
+    Function must not return client inherited from the parent process.
+    Function must create client of the forked process.
+    """
+
+    parent_client = Mock()
+    child_client = Mock()
+
+    influxdb_client.side_effect = [parent_client, child_client]
+
+    with patch(
+        "apollo.connectors.database.influxdb_connector.getpid",
+        return_value=PARENT_PROCESS_ID,
+    ):
+        assert get_influxdb_client(**CLIENT_PARAMETERS) is parent_client
+
+    with patch(
+        "apollo.connectors.database.influxdb_connector.getpid",
+        return_value=CHILD_PROCESS_ID,
+    ):
+        assert get_influxdb_client(**CLIENT_PARAMETERS) is child_client
+        assert get_influxdb_client(**CLIENT_PARAMETERS) is child_client
+
+    assert influxdb_client.call_args_list == [
+        call(**CLIENT_PARAMETERS),
+        call(**CLIENT_PARAMETERS),
+    ]
+
+
+@patch("apollo.connectors.database.influxdb_connector.InfluxDBClient")
+def test__close_influxdb_clients__for_closing_clients_of_current_process(
+    influxdb_client: Mock,
+) -> None:
+    """
+    Test close_influxdb_clients function for closing clients of current process.
+
+    Function must close client of the current process.
+    Function must leave client inherited from the parent process open.
+    Function must let the next request create client anew.
+    """
+
+    parent_client = Mock()
+    child_client = Mock()
+    new_child_client = Mock()
+
+    influxdb_client.side_effect = [parent_client, child_client, new_child_client]
+
+    with patch(
+        "apollo.connectors.database.influxdb_connector.getpid",
+        return_value=PARENT_PROCESS_ID,
+    ):
+        get_influxdb_client(**CLIENT_PARAMETERS)
+
+    with patch(
+        "apollo.connectors.database.influxdb_connector.getpid",
+        return_value=CHILD_PROCESS_ID,
+    ):
+        get_influxdb_client(**CLIENT_PARAMETERS)
+
+        close_influxdb_clients()
+
+        child_client.close.assert_called_once()
+        parent_client.close.assert_not_called()
+
+        assert get_influxdb_client(**CLIENT_PARAMETERS) is new_child_client
@@ -0,0 +1,223 @@
+from multiprocessing import Pool
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from apollo.connectors.database.local_store_connector import (
+    LocalStoreConnector,
+    hash_price_data,
+)
+from apollo.settings import FREQUENCY, TICKER
+from tests.fixtures.files_and_directories import TEMP_TEST_DIR
+
+PRCS_DIR = Path(f"{TEMP_TEST_DIR}/price_data")
+
+CONCURRENT_WRITERS = 6
+WRITE_AND_READ_CYCLES = 30
+
+
+def write_and_read_price_data(dataframe: pd.DataFrame, writer: int) -> int:
+    """
+    Write and read back price data of the same ticker as other writers.
+
+    :param dataframe: Dataframe with price data.
+    :param writer: Number of the writer, selects the written records.
+    :returns: Number of reads that returned price data.
+    """
+
+    local_store_connector = LocalStoreConnector(directory=PRCS_DIR)
+
+    reads = 0
+
+    for cycle in range(WRITE_AND_READ_CYCLES):
+        # Writers alternate between the same and distinct contents
+        written_dataframe = dataframe.iloc[: len(dataframe) - (writer + cycle) % 3]
+
+        local_store_connector.write_price_data(
+            ticker=str(TICKER),
+            frequency=str(FREQUENCY),
+            dataframe=written_dataframe,
+        )
+
+        price_dataframe = local_store_connector.read_price_data(
+            ticker=str(TICKER),
+            frequency=str(FREQUENCY),
+            start_date="",
+            end_date="",
+            max_period=True,
+        )
+
+        if price_dataframe is None:
+            continue
+
+        # Price data of any writer is complete
+        pd.testing.assert_frame_equal(
+            price_dataframe,
+            dataframe.iloc[: len(price_dataframe)],
+        )
+
+        reads += 1
+
+    return reads
+
+
+@pytest.mark.usefixtures("dataframe", "clean_data")
+def test__read_price_data__for_read_only_memory_mapped_price_data(
+    dataframe: pd.DataFrame,
+) -> None:
+    """
+    Test read_price_data method for read-only memory-mapped price data.
+
+    Method must return None if no price data is stored.
+    Method must return price data identical to the written one.
+    Method must return read-only columns viewing stored arrays.
+    Method must return the requested range of price data.
+    """
+
+    local_store_connector = LocalStoreConnector(directory=PRCS_DIR)
+
+    assert (
+        local_store_connector.read_price_data(
+            ticker=str(TICKER),
+            frequency=str(FREQUENCY),
+            start_date="2024-02-01",
+            end_date="2024-03-01",
+            max_period=True,
+        )
+        is None
+    )
+
+    local_store_connector.write_price_data(
+        ticker=str(TICKER),
+        frequency=str(FREQUENCY),
+        dataframe=dataframe,
+    )
+
+    price_dataframe = local_store_connector.read_price_data(
+        ticker=str(TICKER),
+        frequency=str(FREQUENCY),
+        start_date="2024-02-01",
+        end_date="2024-03-01",
+        max_period=True,
+    )
+
+    assert price_dataframe is not None
+
+    pd.testing.assert_frame_equal(price_dataframe, dataframe)
+
+    close = price_dataframe["close"].to_numpy()
+
+    assert not close.flags.writeable
+    assert not close.flags.owndata
+
+    price_dataframe = local_store_connector.read_price_data(
+        ticker=str(TICKER),
+        frequency=str(FREQUENCY),
+        start_date="2024-02-01",
+        end_date="2024-03-01",
+        max_period=False,
+    )
+
+    assert price_dataframe is not None
+
+    pd.testing.assert_frame_equal(
+        price_dataframe,
+        dataframe[(dataframe.index >= "2024-02-01") & (dataframe.index < "2024-03-01")],
+    )
+
+
+@pytest.mark.usefixtures("dataframe", "clean_data")
+def test__write_price_data__for_replacing_stored_version(
+    dataframe: pd.DataFrame,
+) -> None:
+    """
+    Test write_price_data method for replacing stored version.
+
+    Method must point metadata to the version named by content hash.
+    Method must record last record date and its content hash.
+    Method must remove the previous version.
+    Method must keep price data removable.
+    """
+
+    local_store_connector = LocalStoreConnector(directory=PRCS_DIR)
+
+    local_store_connector.write_price_data(
+        ticker=str(TICKER),
+        frequency=str(FREQUENCY),
+        dataframe=dataframe.iloc[:-1],
+    )
+
+    previous_metadata = local_store_connector.read_metadata(
+        str(TICKER),
+        str(FREQUENCY),
+    )
+
+    local_store_connector.write_price_data(
+        ticker=str(TICKER),
+        frequency=str(FREQUENCY),
+        dataframe=dataframe,
+    )
+
+    metadata = local_store_connector.read_metadata(str(TICKER), str(FREQUENCY))
+
+    assert previous_metadata is not None
+    assert metadata == {
+        "version": hash_price_data(dataframe),
+        "columns": list(dataframe.columns),
+        "last_record_date": dataframe.index[-1].strftime("%Y-%m-%d"),
+        "last_record_hash": hash_price_data(dataframe.iloc[-1:]),
+    }
+
+    directory = PRCS_DIR / str(TICKER) / str(FREQUENCY)
+
+    assert (directory / metadata["version"]).is_dir()
+    assert not (directory / previous_metadata["version"]).exists()
+
+    local_store_connector.remove_price_data(str(TICKER), str(FREQUENCY))
+
+    assert local_store_connector.read_metadata(str(TICKER), str(FREQUENCY)) is None
+
+
+@pytest.mark.usefixtures("dataframe", "clean_data")
+def test__write_price_data__for_concurrent_writers(
+    dataframe: pd.DataFrame,
+) -> None:
+    """
+    Test write_price_data method for concurrent writers.
+
+    Method must not fail if other processes write the same ticker.
+    Readers must observe complete price data of one of the writers.
+    Method must leave no temporary files behind.
+    """
+
+    with Pool(CONCURRENT_WRITERS) as pool:
+        reads = pool.starmap(
+            write_and_read_price_data,
+            [(dataframe, writer) for writer in range(CONCURRENT_WRITERS)],
+        )
+
+    assert sum(reads) > 0
+
+    local_store_connector = LocalStoreConnector(directory=PRCS_DIR)
+
+    local_store_connector.write_price_data(
+        ticker=str(TICKER),
+        frequency=str(FREQUENCY),
+        dataframe=dataframe,
+    )
+
+    price_dataframe = local_store_connector.read_price_data(
+        ticker=str(TICKER),
+        frequency=str(FREQUENCY),
+        start_date="",
+        end_date="",
+        max_period=True,
+    )
+
+    assert price_dataframe is not None
+
+    pd.testing.assert_frame_equal(price_dataframe, dataframe)
+
+    # Temporary files of writers are not left behind
+    assert not list((PRCS_DIR / str(TICKER) / str(FREQUENCY)).glob("*.tmp"))
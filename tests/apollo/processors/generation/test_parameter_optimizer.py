@@ -1,33 +1,43 @@
 import logging
+from math import ceil
+from multiprocessing import Pool
 from typing import TYPE_CHECKING, cast
 from unittest import mock
 from unittest.mock import Mock, patch
 
 import pandas as pd
 import pytest
-
 from apollo.backtesters.backtesting_runner import BacktestingRunner
 from apollo.calculators.average_true_range import AverageTrueRangeCalculator
 from apollo.connectors.database.postgres_connector import PostgresConnector
+from apollo.core.strategy_catalogue_map import STRATEGY_CATALOGUE_MAP
 from apollo.errors.system_invariants import OptimizedPositionAlreadyExistsError
 from apollo.models.position import Position, PositionStatus
-from apollo.processors.generation.parameter_optimizer import ParameterOptimizer
+from apollo.processors.generation.parameter_optimizer import (
+    RANKING_STATISTICS,
+    ParameterOptimizer,
+)
 from apollo.settings import (
     BACKTESTING_CASH_SIZE,
     END_DATE,
     FREQUENCY,
     LONG_SIGNAL,
     MAX_PERIOD,
+    OPTIMIZATION_RESULTS_SIZE,
     SHORT_SIGNAL,
     START_DATE,
     STRATEGY,
     TICKER,
+    BacktestingEngine,
     ParameterOptimizerMode,
 )
+from apollo.utils.parameter_grid import ParameterGrid
+
 from tests.fixtures.window_size_and_dataframe import SameDataframe, SameSeries
 from tests.utils.precalculate_shared_values import precalculate_shared_values
 
 if TYPE_CHECKING:
+    from apollo.utils.multiprocessing_capable import ParallelJob
     from apollo.utils.types import ParameterKeysAndCombinations, ParameterSet
 
 RANGE_MIN = 1.0
@@ -35,6 +45,36 @@ RANGE_MAX = 2.0
 RANGE_STEP = 1.0
 
 
+def mimic_sweep_optimization(
+    sweep: ParameterGrid,
+    history_fraction: float = 1.0,
+) -> pd.DataFrame:
+    """
+    Mimic optimization over sweep with the best results at (7.0, 3.0).
+
+    :param sweep: Sweep of combinations.
+    :param history_fraction: Most recent fraction of price data.
+    :returns: DataFrame with the best result of the sweep.
+    """
+
+    combination = max(
+        sweep,
+        key=lambda combination: combination[-1],
+    )
+
+    return pd.DataFrame(
+        {
+            "Sharpe Ratio": [
+                -abs(combination[0] - 7.0) - abs(combination[1] - 3.0),
+            ],
+            "Return [%]": [0.0],
+            "# Trades": [1],
+            "combination": [combination],
+            "history_fraction": [history_fraction],
+        },
+    )
+
+
 def test__get_combination_ranges__for_correct_combination_ranges() -> None:
     """
     Test get_combination_ranges method for correct combination ranges.
@@ -157,8 +197,9 @@ def test__optimize_parameters__for_correctly_optimizing_parameters(
     """
     Test optimize_parameters method for correctly optimizing parameters.
 
-    Method must return Dataframe with backtested results.
-    Resulting Dataframe must contain "parameters" column.
+    Method must return Dataframe with the best backtested results.
+    Resulting Dataframe must contain "combination" column.
+    Resulting Dataframe must not contain private statistics.
     """
 
     parameter_optimizer = ParameterOptimizer(
@@ -205,7 +246,338 @@ def test__optimize_parameters__for_correctly_optimizing_parameters(
     )
 
     assert isinstance(backtested_dataframe, pd.DataFrame)
-    assert "parameters" in backtested_dataframe.columns
+    assert "combination" in backtested_dataframe.columns
+    assert "_trades" not in backtested_dataframe.columns
+
+    assert len(backtested_dataframe) == OPTIMIZATION_RESULTS_SIZE
+
+    # Results are ranked from the best to the worst
+    pd.testing.assert_frame_equal(
+        backtested_dataframe,
+        backtested_dataframe.sort_values(
+            RANKING_STATISTICS,
+            ascending=False,
+        ),
+    )
+
+    # Full results table is kept on request
+    with patch(
+        "apollo.processors.generation.parameter_optimizer.FULL_OPTIMIZATION_RESULTS",
+        "True",
+    ):
+        keys, combinations = parameter_optimizer._construct_parameter_combinations(  # noqa: SLF001
+            cast("ParameterSet", parameters),
+        )
+
+        full_backtested_dataframe = parameter_optimizer._optimize_parameters(  # noqa: SLF001
+            strategy_name=str(STRATEGY),
+            combinations=combinations,
+            price_dataframe=enhanced_dataframe,
+            parameter_set=cast("ParameterSet", parameters),
+            keys=keys,
+        )
+
+    assert len(full_backtested_dataframe) > OPTIMIZATION_RESULTS_SIZE
+
+    pd.testing.assert_frame_equal(
+        backtested_dataframe,
+        full_backtested_dataframe.head(OPTIMIZATION_RESULTS_SIZE),
+    )
+
+
+@pytest.mark.usefixtures("enhanced_dataframe")
+def test__optimize_parameters__for_modeling_signals_once_per_sweep(
+    enhanced_dataframe: pd.DataFrame,
+) -> None:
+    """
+    Test optimize_parameters method for modeling signals once per sweep.
+
+    Method must model trading signals once for each combination
+    of signal-affecting parameters, regardless of the number
+    of execution-only parameter combinations swept over them.
+
+    Method must precalculate indicators once for all window sizes.
+    Method must backtest combinations that can be iterated only once.
+    """
+
+    parameter_optimizer = ParameterOptimizer(
+        ParameterOptimizerMode.SINGLE_STRATEGY,
+    )
+
+    parameters = {
+        "window_size": {
+            "range": [5, 10],
+            "step": 5,
+        },
+        "sl_volatility_multiplier": {
+            "range": [RANGE_MIN, RANGE_MAX],
+            "step": RANGE_STEP,
+        },
+        "tp_volatility_multiplier": {
+            "range": [RANGE_MIN, RANGE_MAX],
+            "step": RANGE_STEP,
+        },
+        "kurtosis_threshold": {
+            "range": [RANGE_MIN, RANGE_MIN],
+            "step": RANGE_STEP,
+        },
+        "volatility_multiplier": {
+            "range": [RANGE_MIN, RANGE_MIN],
+            "step": RANGE_STEP,
+        },
+        "strategy_specific_parameters": [
+            "kurtosis_threshold",
+            "volatility_multiplier",
+        ],
+    }
+
+    keys, combinations = parameter_optimizer._construct_parameter_combinations(  # noqa: SLF001
+        cast("ParameterSet", parameters),
+    )
+
+    # Execution-only parameters must be ordered last
+    assert keys[-2:] == ["sl_volatility_multiplier", "tp_volatility_multiplier"]
+
+    strategy_class = STRATEGY_CATALOGUE_MAP[str(STRATEGY)]
+
+    with (
+        patch.object(
+            strategy_class,
+            "model_trading_signals",
+            autospec=True,
+            side_effect=strategy_class.model_trading_signals,
+        ) as model_trading_signals,
+        patch.object(
+            strategy_class,
+            "precalculate_indicators",
+            side_effect=strategy_class.precalculate_indicators,
+        ) as precalculate_indicators,
+    ):
+        # Combinations iterable only once must still be fully backtested
+        results = parameter_optimizer._optimize_parameters(  # noqa: SLF001
+            strategy_name=str(STRATEGY),
+            combinations=iter(combinations),
+            price_dataframe=enhanced_dataframe,
+            parameter_set=cast("ParameterSet", parameters),
+            keys=keys,
+        )
+
+    assert not results.empty
+
+    # Two window sizes, single value of each strategy specific parameter
+    assert model_trading_signals.call_count == len([5, 10])
+
+    precalculate_indicators.assert_called_once_with(
+        dataframe=SameDataframe(enhanced_dataframe),
+        window_sizes=[5, 10],
+        strategy_specific_parameters=[
+            {"kurtosis_threshold": RANGE_MIN, "volatility_multiplier": RANGE_MIN},
+        ]
+        * len([5, 10]),
+    )
+
+
+@pytest.mark.usefixtures("enhanced_dataframe")
+def test__optimize_parameters_on_shared_data__for_using_attached_price_data(
+    enhanced_dataframe: pd.DataFrame,
+) -> None:
+    """
+    Test optimize_parameters_on_shared_data method for using attached price data.
+
+    Method must run the optimization process over price data
+    attached to the worker process by the pool initializer for the strategy.
+    Method must run the optimization process over the most recent
+    fraction of price data if history fraction is provided.
+    """
+
+    parameter_optimizer = ParameterOptimizer(
+        ParameterOptimizerMode.SINGLE_STRATEGY,
+    )
+
+    combinations = [(RANGE_MIN, RANGE_MAX)]
+    keys = ["sl_volatility_multiplier", "tp_volatility_multiplier"]
+    parameter_set = cast("ParameterSet", {})
+
+    with (
+        patch(
+            "apollo.processors.generation.parameter_optimizer.get_shared_dataframe",
+            return_value=enhanced_dataframe,
+        ) as get_shared_dataframe,
+        patch.object(
+            ParameterOptimizer,
+            "_optimize_parameters",
+        ) as optimize_parameters,
+    ):
+        parameter_optimizer._optimize_parameters_on_shared_data(  # noqa: SLF001
+            combinations,
+            strategy_name=str(STRATEGY),
+            parameter_set=parameter_set,
+            keys=keys,
+        )
+
+    get_shared_dataframe.assert_called_once_with(str(STRATEGY))
+
+    optimize_parameters.assert_called_once_with(
+        strategy_name=str(STRATEGY),
+        combinations=combinations,
+        price_dataframe=enhanced_dataframe,
+        parameter_set=parameter_set,
+        keys=keys,
+    )
+
+    with (
+        patch(
+            "apollo.processors.generation.parameter_optimizer.get_shared_dataframe",
+            return_value=enhanced_dataframe,
+        ),
+        patch.object(
+            ParameterOptimizer,
+            "_optimize_parameters",
+        ) as optimize_parameters,
+    ):
+        parameter_optimizer._optimize_parameters_on_shared_data(  # noqa: SLF001
+            combinations,
+            strategy_name=str(STRATEGY),
+            parameter_set=parameter_set,
+            keys=keys,
+            history_fraction=0.25,
+        )
+
+    pd.testing.assert_frame_equal(
+        optimize_parameters.call_args.kwargs["price_dataframe"],
+        enhanced_dataframe.iloc[-ceil(len(enhanced_dataframe) * 0.25) :],
+    )
+
+
+@pytest.mark.usefixtures("enhanced_dataframe")
+def test__optimize_parameters__for_ranking_sweep_with_native_engine(
+    enhanced_dataframe: pd.DataFrame,
+) -> None:
+    """
+    Test optimize_parameters method for ranking sweep with native engine.
+
+    Native engine must fully backtest only the best combination of each sweep.
+    Best combination must be the same as the one found by backtesting library.
+    Native engine must keep every combination if full results are requested.
+    """
+
+    parameter_optimizer = ParameterOptimizer(
+        ParameterOptimizerMode.SINGLE_STRATEGY,
+    )
+
+    parameters = {
+        "window_size": {
+            "range": [5, 10],
+            "step": 5,
+        },
+        "sl_volatility_multiplier": {
+            "range": [0.5, 1.5],
+            "step": 0.5,
+        },
+        "tp_volatility_multiplier": {
+            "range": [0.5, 1.5],
+            "step": 0.5,
+        },
+        "kurtosis_threshold": {
+            "range": [RANGE_MIN, RANGE_MIN],
+            "step": RANGE_STEP,
+        },
+        "volatility_multiplier": {
+            "range": [RANGE_MIN, RANGE_MIN],
+            "step": RANGE_STEP,
+        },
+        "strategy_specific_parameters": [
+            "kurtosis_threshold",
+            "volatility_multiplier",
+        ],
+    }
+
+    results = {}
+
+    for engine in BacktestingEngine:
+        parameter_optimizer._backtesting_engine = engine  # noqa: SLF001
+
+        keys, combinations = parameter_optimizer._construct_parameter_combinations(  # noqa: SLF001
+            cast("ParameterSet", parameters),
+        )
+
+        results[engine] = parameter_optimizer._optimize_parameters(  # noqa: SLF001
+            strategy_name=str(STRATEGY),
+            combinations=combinations,
+            price_dataframe=enhanced_dataframe,
+            parameter_set=cast("ParameterSet", parameters),
+            keys=keys,
+        ).sort_values(RANKING_STATISTICS, ascending=False)
+
+    # Single row for each window size
+    assert len(results[BacktestingEngine.NATIVE]) == len([5, 10])
+
+    pd.testing.assert_series_equal(
+        results[BacktestingEngine.NATIVE].iloc[0][[*RANKING_STATISTICS, "combination"]],
+        results[BacktestingEngine.BACKTESTING_PY].iloc[0][
+            [*RANKING_STATISTICS, "combination"]
+        ],
+    )
+
+    # Full results table is kept on request
+    with patch(
+        "apollo.processors.generation.parameter_optimizer.FULL_OPTIMIZATION_RESULTS",
+        "True",
+    ):
+        full_results = parameter_optimizer._optimize_parameters(  # noqa: SLF001
+            strategy_name=str(STRATEGY),
+            combinations=combinations,
+            price_dataframe=enhanced_dataframe,
+            parameter_set=cast("ParameterSet", parameters),
+            keys=keys,
+        )
+
+    # Every combination of the grid is present
+    assert sorted(full_results["combination"]) == sorted(combinations)
+
+
+@pytest.mark.usefixtures("enhanced_dataframe")
+def test__rank_execution_combinations__for_leaving_dataframe_intact(
+    enhanced_dataframe: pd.DataFrame,
+) -> None:
+    """
+    Test rank_execution_combinations method for leaving dataframe intact.
+
+    Method must rank every supplied combination.
+    Method must not rename columns of the supplied dataframe.
+    """
+
+    parameter_optimizer = ParameterOptimizer(
+        ParameterOptimizerMode.SINGLE_STRATEGY,
+    )
+
+    dataframe = enhanced_dataframe.copy()
+
+    STRATEGY_CATALOGUE_MAP[str(STRATEGY)](
+        dataframe=dataframe,
+        window_size=5,
+        kurtosis_threshold=RANGE_MIN,
+        volatility_multiplier=RANGE_MIN,
+    ).model_trading_signals()
+
+    modeled_dataframe = dataframe.copy()
+
+    execution_combinations = [
+        (RANGE_MIN, RANGE_MIN),
+        (RANGE_MIN, RANGE_MAX),
+        (RANGE_MAX, RANGE_MIN),
+        (RANGE_MAX, RANGE_MAX),
+    ]
+
+    ranked_combinations = parameter_optimizer._rank_execution_combinations(  # noqa: SLF001
+        dataframe,
+        ["sl_volatility_multiplier", "tp_volatility_multiplier"],
+        execution_combinations,
+    )
+
+    assert sorted(ranked_combinations) == execution_combinations
+
+    pd.testing.assert_frame_equal(dataframe, modeled_dataframe)
 
 
 @pytest.mark.usefixtures("dataframe", "window_size")
@@ -359,7 +731,9 @@ def test__optimize_parameters__for_correct_optimization_process(
     Method must call Price Data Enhancer to enhance price data.
     Method must construct parameter combinations and create batches.
     Method must call process method in parallel for each combination batch.
+    Method must not pass price data in arguments of each batch.
     Method must call output results with combined dataframes of backtesting processes.
+    Method must describe combinations of the results with parameter names.
     """
 
     parameter_optimizer = ParameterOptimizer(
@@ -401,7 +775,7 @@ def test__optimize_parameters__for_correct_optimization_process(
             "_output_results",
         ) as output_results,
     ):
-        # Mock the return value of the map method as
+        # Mock the return value of the map_async method as
         # list of dataframes with backtesting results
         backtesting_results = [
             pd.DataFrame(
@@ -409,6 +783,7 @@ def test__optimize_parameters__for_correct_optimization_process(
                     "Return [%]": [0.0],
                     "Sharpe Ratio": [0.0],
                     "# Trades": [0],
+                    "combination": [(RANGE_MIN, RANGE_MIN)],
                 },
             ),
             pd.DataFrame(
@@ -416,10 +791,13 @@ def test__optimize_parameters__for_correct_optimization_process(
                     "Return [%]": [0.0],
                     "Sharpe Ratio": [0.0],
                     "# Trades": [0],
+                    "combination": [(RANGE_MAX, RANGE_MAX)],
                 },
             ),
         ]
-        multiprocessing_pool.starmap.return_value = backtesting_results
+        multiprocessing_pool.map_async.return_value.get.return_value = (
+            backtesting_results
+        )
 
         # Mock the return value of _construct_parameter_combinations
         keys, combinations = cast(
@@ -436,11 +814,8 @@ def test__optimize_parameters__for_correct_optimization_process(
         )
         construct_parameter_combinations.return_value = (keys, combinations)
 
-        # Create batches and arguments for each process
+        # Create batches for each process
         batches = parameter_optimizer._create_batches(combinations)  # noqa: SLF001
-        batch_arguments = [
-            (str(STRATEGY), batch, dataframe, parameter_set, keys) for batch in batches
-        ]
 
         parameter_optimizer.optimize_parameters()
 
@@ -465,10 +840,29 @@ def test__optimize_parameters__for_correct_optimization_process(
         )
 
         # Assert that we called our processing method in parallel
-        multiprocessing_pool.starmap.assert_called_once_with(
-            parameter_optimizer._optimize_parameters,  # noqa: SLF001
-            batch_arguments,
+        # over the price data shared with worker processes
+        multiprocessing_pool.map_async.assert_called_once()
+
+        process_batch, processed_batches = multiprocessing_pool.map_async.call_args.args
+
+        assert process_batch.func == (
+            parameter_optimizer._optimize_parameters_on_shared_data  # noqa: SLF001
+        )
+        assert process_batch.keywords == {
+            "strategy_name": str(STRATEGY),
+            "parameter_set": parameter_set,
+            "keys": keys,
+        }
+        assert processed_batches == batches
+
+        # Combinations are described with parameter names once merged
+        control_dataframe = pd.concat(backtesting_results).drop(
+            columns=["combination"],
         )
+        control_dataframe["parameters"] = [
+            str(dict(zip(keys, combination, strict=True)))
+            for combination in [(RANGE_MIN, RANGE_MIN), (RANGE_MAX, RANGE_MAX)]
+        ]
 
         # Assert that we called the output results
         # with combined dataframes of backtesting processes
@@ -477,9 +871,236 @@ def test__optimize_parameters__for_correct_optimization_process(
             strategy=str(STRATEGY),
             # Please see tests/fixtures/window_size_and_dataframe.py
             # for explanation on SameDataframe class
-            results_dataframe=SameDataframe(pd.concat(backtesting_results)),
+            results_dataframe=SameDataframe(control_dataframe),
+        )
+
+
+@pytest.mark.usefixtures("dataframe")
+def test__run_optimization_process__for_sharing_pool_between_strategies(
+    dataframe: pd.DataFrame,
+) -> None:
+    """
+    Test run_optimization_process method for sharing pool between strategies.
+
+    Method must create single pool of processes for all strategies.
+    Method must attach price data of each strategy to the pool processes.
+    Method must queue batches of all strategies before waiting for results.
+    Method must output results of each strategy separately.
+    """
+
+    parameter_optimizer = ParameterOptimizer(
+        ParameterOptimizerMode.MULTIPLE_STRATEGIES,
+    )
+
+    parameter_optimizer._configuration = Mock()  # noqa: SLF001
+    parameter_optimizer._price_data_provider = Mock()  # noqa: SLF001
+    parameter_optimizer._price_data_enhancer = Mock()  # noqa: SLF001
+
+    parameter_optimizer._price_data_provider.get_price_data.return_value = dataframe  # noqa: SLF001
+    parameter_optimizer._price_data_enhancer.enhance_price_data.return_value = dataframe  # noqa: SLF001
+
+    parameter_optimizer._configuration.get_parameter_set.return_value = {  # noqa: SLF001
+        "sl_volatility_multiplier": {
+            "range": [RANGE_MIN, RANGE_MAX],
+            "step": RANGE_STEP,
+        },
+        "tp_volatility_multiplier": {
+            "range": [RANGE_MIN, RANGE_MAX],
+            "step": RANGE_STEP,
+        },
+        "additional_data_enhancers": [],
+    }
+
+    strategies = ["Strategy1", "Strategy2"]
+
+    # Each strategy gets its own results from the pool
+    strategy_results = {
+        strategy: [
+            pd.DataFrame(
+                {
+                    "Sharpe Ratio": [float(position)],
+                    "combination": [(RANGE_MIN, RANGE_MAX)],
+                },
+            ),
+        ]
+        for position, strategy in enumerate(strategies)
+    }
+
+    with (
+        patch(
+            "apollo.processors.generation.parameter_optimizer.Pool",
+        ) as pool_class,
+        patch.object(
+            ParameterOptimizer,
+            "_output_results",
+        ) as output_results,
+    ):
+        pool = pool_class.return_value.__enter__.return_value
+
+        pool.map_async.side_effect = lambda function, _: Mock(
+            get=Mock(return_value=strategy_results[function.keywords["strategy_name"]]),
+        )
+
+        parameter_optimizer._run_optimization_process(  # noqa: SLF001
+            ticker=str(TICKER),
+            strategies=strategies,
+        )
+
+    pool_class.assert_called_once()
+
+    shared_price_dataframes = pool_class.call_args.kwargs["initargs"][0]
+
+    assert list(shared_price_dataframes) == strategies
+    assert pool.map_async.call_count == len(strategies)
+
+    output_results.assert_has_calls(
+        [
+            mock.call(
+                ticker=str(TICKER),
+                strategy=strategy,
+                results_dataframe=SameDataframe(
+                    pd.DataFrame(
+                        {
+                            "Sharpe Ratio": [float(position)],
+                            "parameters": [
+                                str(
+                                    {
+                                        "sl_volatility_multiplier": RANGE_MIN,
+                                        "tp_volatility_multiplier": RANGE_MAX,
+                                    },
+                                ),
+                            ],
+                        },
+                    ),
+                ),
+            )
+            for position, strategy in enumerate(strategies)
+        ],
+    )
+
+
+def test__search_adaptively__for_spending_budget_on_promising_sweeps() -> None:
+    """
+    Test search_adaptively method for spending budget on promising sweeps.
+
+    Method must backtest as many sweeps of each job as the budget allows.
+    Method must backtest each sweep at most once, as a whole.
+    Method must find the best sweep without backtesting every one.
+    """
+
+    parameter_optimizer = ParameterOptimizer(
+        ParameterOptimizerMode.MULTIPLE_STRATEGIES,
+    )
+    parameter_optimizer._available_cores = 2  # noqa: SLF001
+    parameter_optimizer._search_budget = 40  # noqa: SLF001
+
+    # Two signal-affecting parameters with sweep of two values
+    values = [float(value) for value in range(10)]
+    grid = ParameterGrid([values, values, [RANGE_MIN, RANGE_MAX]])
+    sweep_size = 2
+
+    jobs: list[ParallelJob] = [
+        {
+            "function": mimic_sweep_optimization,
+            "inputs": grid,
+            "granularity": sweep_size,
+        },
+        {
+            "function": mimic_sweep_optimization,
+            "inputs": grid[: len(grid) // 5],
+            "granularity": sweep_size,
+        },
+    ]
+
+    with Pool(processes=2) as pool:
+        results = parameter_optimizer._search_adaptively(  # noqa: SLF001
+            pool,
+            jobs,
+            [[len(values), len(values)], [len(values) // 5, len(values)]],
+        )
+
+    # Second job has fewer sweeps than the budget
+    assert [len(job_results) for job_results in results] == [40, 20]
+
+    for job_results in results:
+        results_dataframe = pd.concat(job_results)
+
+        # Each sweep is backtested once, with its best result
+        assert results_dataframe["combination"].map(lambda c: c[:2]).is_unique
+        assert set(results_dataframe["combination"].map(lambda c: c[-1])) == {
+            RANGE_MAX,
+        }
+
+    assert pd.concat(results[0])["Sharpe Ratio"].max() == 0.0
+
+
+def test__search_successive_halving__for_promoting_best_sweeps(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """
+    Test search_successive_halving method for promoting best sweeps.
+
+    Method must backtest every sweep over the shortest history first.
+    Method must promote the best third of sweeps to each longer history.
+    Method must return results of finalists backtested over the whole history.
+    Method must log backtested and surviving sweeps of each rung.
+    """
+
+    caplog.set_level(logging.INFO)
+
+    parameter_optimizer = ParameterOptimizer(
+        ParameterOptimizerMode.MULTIPLE_STRATEGIES,
+    )
+    parameter_optimizer._available_cores = 2  # noqa: SLF001
+
+    # Two signal-affecting parameters with sweep of two values
+    values = [float(value) for value in range(10)]
+    grid = ParameterGrid([values, values, [RANGE_MIN, RANGE_MAX]])
+    sweep_size = 2
+
+    jobs: list[ParallelJob] = [
+        {
+            "function": mimic_sweep_optimization,
+            "inputs": grid,
+            "granularity": sweep_size,
+        },
+        {
+            "function": mimic_sweep_optimization,
+            "inputs": grid[: len(grid) // 5],
+            "granularity": sweep_size,
+        },
+    ]
+
+    with Pool(processes=2) as pool:
+        results = parameter_optimizer._search_successive_halving(  # noqa: SLF001
+            pool,
+            jobs,
         )
 
+    assert [len(job_results) for job_results in results] == [12, 3]
+
+    first_results = pd.concat(results[0])
+
+    assert set(first_results["history_fraction"]) == {1.0}
+    assert first_results["combination"].map(lambda c: c[:2]).is_unique
+    assert first_results["Sharpe Ratio"].max() == 0.0
+
+    # Finalists of the second job are the closest to the best sweep
+    assert sorted(pd.concat(results[1])["Sharpe Ratio"]) == [-7.0, -7.0, -6.0]
+
+    assert (
+        "Successive halving rung 1 complete. History fraction: 0.111, "
+        "backtested sweeps: [100, 20], surviving sweeps: [34, 7]"
+    ) in caplog.text
+    assert (
+        "Successive halving rung 2 complete. History fraction: 0.333, "
+        "backtested sweeps: [34, 7], surviving sweeps: [12, 3]"
+    ) in caplog.text
+    assert (
+        "Successive halving rung 3 complete. History fraction: 1.000, "
+        "backtested sweeps: [12, 3], surviving sweeps: [12, 3]"
+    ) in caplog.text
+
 
 def test__optimize_parameters__for_raising_error_if_position_exists() -> None:
     """
@@ -558,7 +1179,7 @@ def test__optimize_parameters__for_multiple_strategies() -> None:
     """
     Test optimize_parameters for multiple strategies.
 
-    Method must call process method in parallel for each strategy.
+    Method must call process method once for the whole strategy catalogue.
     Method must call update_position_on_optimization after all strategies are processed.
     """
 
@@ -596,17 +1217,9 @@ def test__optimize_parameters__for_multiple_strategies() -> None:
     ) as _run_optimization_process:
         parameter_optimizer.optimize_parameters()
 
-        _run_optimization_process.assert_has_calls(
-            [
-                mock.call(
-                    ticker=str(TICKER),
-                    strategy="Strategy1",
-                ),
-                mock.call(
-                    ticker=str(TICKER),
-                    strategy="Strategy2",
-                ),
-            ],
+        _run_optimization_process.assert_called_once_with(
+            ticker=str(TICKER),
+            strategies=["Strategy1", "Strategy2"],
         )
 
         parameter_optimizer._database_connector.update_position_by_status.assert_called_once_with(  # noqa: SLF001
@@ -129,6 +129,29 @@ def test__calculate_measures__for_correctly_calculating_screening_measures(
     assert "ker" in screened_dataframe.columns
 
 
+@patch("apollo.processors.generation.ticker_screener.close_influxdb_clients")
+def test__calculate_measures__for_closing_influxdb_clients(
+    close_influxdb_clients: Mock,
+) -> None:
+    """
+    Test calculate_measures method for closing InfluxDB clients.
+
+    Method must close InfluxDB clients of the process once the batch is done,
+    since pool workers exit without running exit handlers.
+    """
+
+    ticker_screener = TickerScreener()
+
+    ticker_screener._price_data_provider = Mock()  # noqa: SLF001
+    ticker_screener._price_data_provider.get_price_data.side_effect = (  # noqa: SLF001
+        EmptyYahooApiResponseError
+    )
+
+    ticker_screener._calculate_measures([str(TICKER)])  # noqa: SLF001
+
+    close_influxdb_clients.assert_called_once_with()
+
+
 def test__calculate_measures__for_skipping_ticker_if_api_returned_empty_response(
     caplog: pytest.LogCaptureFixture,
 ) -> None:
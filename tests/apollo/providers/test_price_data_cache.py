@@ -0,0 +1,146 @@
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from apollo.providers.price_data_cache import PriceDataCache
+
+
+@pytest.mark.usefixtures("dataframe")
+def test__price_data_cache__for_least_recently_used_eviction(
+    dataframe: pd.DataFrame,
+) -> None:
+    """
+    Test PriceDataCache for least recently used eviction.
+
+    Least recently used entry must be evicted once cache is full.
+    Hits, misses and evictions must be counted.
+    """
+
+    price_data_cache = PriceDataCache(max_size=2, time_to_live=60.0)
+
+    price_data_cache.put("first", dataframe)
+    price_data_cache.put("second", dataframe)
+
+    # Mark the first entry as recently used
+    assert price_data_cache.get("first") is not None
+
+    price_data_cache.put("third", dataframe)
+
+    assert price_data_cache.get("second") is None
+    assert price_data_cache.get("first") is not None
+    assert price_data_cache.get("third") is not None
+
+    assert price_data_cache.statistics == {
+        "hits": 3,
+        "misses": 1,
+        "expirations": 0,
+        "evictions": 1,
+        "size": 2,
+    }
+
+
+@pytest.mark.usefixtures("dataframe")
+def test__price_data_cache__for_expiring_entries(
+    dataframe: pd.DataFrame,
+) -> None:
+    """
+    Test PriceDataCache for expiring entries.
+
+    Entry must be served until its time to live passes.
+    Expired entry must be removed and counted as miss.
+    """
+
+    price_data_cache = PriceDataCache(max_size=2, time_to_live=60.0)
+
+    with patch(
+        "apollo.providers.price_data_cache.monotonic",
+        return_value=0.0,
+    ) as monotonic:
+        price_data_cache.put("first", dataframe)
+
+        monotonic.return_value = 59.0
+
+        assert price_data_cache.get("first") is not None
+
+        monotonic.return_value = 60.0
+
+        assert price_data_cache.get("first") is None
+
+    assert price_data_cache.statistics == {
+        "hits": 1,
+        "misses": 1,
+        "expirations": 1,
+        "evictions": 0,
+        "size": 0,
+    }
+
+
+@pytest.mark.usefixtures("dataframe")
+def test__price_data_cache__for_read_only_views(
+    dataframe: pd.DataFrame,
+) -> None:
+    """
+    Test PriceDataCache for read-only views.
+
+    Cached price data must be identical to the provided one.
+    Cached price data must not change if the provided one does.
+    Views must not allow modifying cached values, but allow adding columns.
+    """
+
+    price_data_cache = PriceDataCache(max_size=2, time_to_live=60.0)
+
+    control_dataframe = dataframe.copy()
+
+    price_dataframe = price_data_cache.put("first", dataframe)
+
+    dataframe["close"] = 0.0
+
+    pd.testing.assert_frame_equal(price_dataframe, control_dataframe)
+
+    with pytest.raises(ValueError, match="read-only"):
+        price_dataframe.loc[price_dataframe.index[0], "close"] = 0.0
+
+    price_dataframe["vix close"] = 0.0
+
+    cached_dataframe = price_data_cache.get("first")
+
+    assert cached_dataframe is not None
+    assert "vix close" not in cached_dataframe.columns
+
+    pd.testing.assert_frame_equal(cached_dataframe, control_dataframe)
+
+
+@pytest.mark.usefixtures("dataframe")
+def test__price_data_cache__for_reusing_read_only_arrays(
+    dataframe: pd.DataFrame,
+) -> None:
+    """
+    Test PriceDataCache for reusing read-only arrays.
+
+    Read-only columns must be cached without copying.
+    Read-only views of writable columns must be copied.
+    """
+
+    price_data_cache = PriceDataCache(max_size=2, time_to_live=60.0)
+
+    read_only_close = dataframe["close"].to_numpy(copy=True)
+    read_only_close.setflags(write=False)
+
+    writable_open = dataframe["open"].to_numpy(copy=True)
+
+    read_only_open = writable_open.view()
+    read_only_open.setflags(write=False)
+
+    price_dataframe = price_data_cache.put(
+        "first",
+        pd.DataFrame(
+            {"close": read_only_close, "open": read_only_open},
+            index=dataframe.index,
+            copy=False,
+        ),
+    )
+
+    assert np.shares_memory(price_dataframe["close"].to_numpy(), read_only_close)
+    assert not np.shares_memory(price_dataframe["open"].to_numpy(), writable_open)
@@ -1,5 +1,6 @@
-from datetime import datetime
-from unittest.mock import Mock
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import ANY, Mock, call, patch
 from zoneinfo import ZoneInfo
 
 import pandas as pd
@@ -8,6 +9,8 @@ from freezegun import freeze_time
 
 from apollo.connectors.api.yahoo_api_connector import YahooApiConnector
 from apollo.connectors.database.influxdb_connector import InfluxDbConnector
+from apollo.connectors.database.local_store_connector import LocalStoreConnector
+from apollo.providers.price_data_cache import PRICE_DATA_CACHE
 from apollo.providers.price_data_provider import PriceDataProvider
 from apollo.settings import (
     DEFAULT_DATE_FORMAT,
@@ -17,9 +20,18 @@ from apollo.settings import (
     START_DATE,
     TICKER,
 )
+from apollo.utils.price_data_availability_helper import PriceDataAvailabilityHelper
+from tests.fixtures.files_and_directories import TEMP_TEST_DIR
 from tests.fixtures.window_size_and_dataframe import SameDataframe
 
 
+@pytest.fixture(autouse=True)
+def clear_price_data_cache() -> None:
+    """Start each test with empty price data cache."""
+
+    PRICE_DATA_CACHE.clear()
+
+
 @pytest.mark.usefixtures("api_response_dataframe")
 def test__get_price_data__with_valid_parameters_and_no_data_present(
     api_response_dataframe: pd.DataFrame,
@@ -164,9 +176,12 @@ def test__get_price_data__with_valid_parameters_and_data_present_no_refresh(
     pd.testing.assert_frame_equal(dataframe, price_dataframe)
 
 
-@pytest.mark.usefixtures("api_response_dataframe")
+# After exchange close on the last queried date
+@freeze_time(f"{END_DATE} 23:00:00", tick=False)
+@pytest.mark.usefixtures("api_response_dataframe", "dataframe")
 def test__get_price_data__with_valid_parameters_and_data_present_to_refresh(
     api_response_dataframe: pd.DataFrame,
+    dataframe: pd.DataFrame,
 ) -> None:
     """
     Test get_price_data method with valid parameters.
@@ -174,8 +189,10 @@ def test__get_price_data__with_valid_parameters_and_data_present_to_refresh(
     And data present in the database and needs refresh.
 
     Data Provider must call InfluxDB connector to get last record date.
-    Data Provider must call API connector to request price data.
-    Data Provider must call InfluxDB connector to write price data.
+    Data Provider must call API connector to request price data after last record.
+    Data Provider must call InfluxDB connector to read overlapping price data.
+    Data Provider must call InfluxDB connector to write only newer price data.
+    Data Provider must call InfluxDB connector to read price data.
     Data Provider must return a pandas Dataframe with price data.
     """
 
@@ -213,13 +230,17 @@ def test__get_price_data__with_valid_parameters_and_data_present_to_refresh(
             expected_dataframe_to_write[column] * adjustment_factor
         )
 
-    last_queried_datetime: datetime = expected_dataframe_to_write.index[-1]
-    last_queried_date = last_queried_datetime.date()
+    last_record_datetime: datetime = expected_dataframe_to_write.index[0]
+    last_record_date = last_record_datetime.date()
 
     price_data_provider._database_connector = Mock(InfluxDbConnector)  # noqa: SLF001
     price_data_provider._database_connector.get_last_record_date.return_value = (  # noqa: SLF001
-        last_queried_date
+        last_record_date
     )
+    price_data_provider._database_connector.read_price_data.side_effect = [  # noqa: SLF001
+        expected_dataframe_to_write.iloc[:1],
+        dataframe,
+    ]
 
     price_dataframe = price_data_provider.get_price_data(
         ticker=str(TICKER),
@@ -234,14 +255,149 @@ def test__get_price_data__with_valid_parameters_and_data_present_to_refresh(
         frequency=str(FREQUENCY),
     )
 
+    overlap_start_date = (last_record_date - timedelta(days=7)).strftime(
+        DEFAULT_DATE_FORMAT,
+    )
+    overlap_end_date = (
+        datetime.strptime(str(END_DATE), DEFAULT_DATE_FORMAT) + timedelta(days=1)
+    ).strftime(DEFAULT_DATE_FORMAT)
+
     price_data_provider._api_connector.request_price_data.assert_called_once_with(  # noqa: SLF001
+        ticker=str(TICKER),
+        frequency=str(FREQUENCY),
+        start_date=overlap_start_date,
+        end_date=overlap_end_date,
+        max_period=False,
+    )
+
+    assert price_data_provider._database_connector.read_price_data.call_args_list == [  # noqa: SLF001
+        call(
+            ticker=str(TICKER),
+            frequency=str(FREQUENCY),
+            start_date=overlap_start_date,
+            end_date=overlap_end_date,
+            max_period=False,
+        ),
+        call(
+            ticker=str(TICKER),
+            frequency=str(FREQUENCY),
+            start_date=str(START_DATE),
+            end_date=str(END_DATE),
+            max_period=bool(MAX_PERIOD),
+        ),
+    ]
+
+    price_data_provider._database_connector.write_price_data.assert_called_once_with(  # noqa: SLF001
+        frequency=str(FREQUENCY),
+        # Please see tests/fixtures/window_size_and_dataframe.py
+        # for explanation on SameDataframe class
+        dataframe=SameDataframe(expected_dataframe_to_write.iloc[1:]),
+    )
+
+    pd.testing.assert_frame_equal(price_dataframe, dataframe)
+
+
+@freeze_time(f"{END_DATE} 23:00:00", tick=False)
+@pytest.mark.usefixtures("api_response_dataframe")
+@pytest.mark.parametrize("max_period", [True, False])
+def test__get_price_data__with_valid_parameters_and_corporate_action(
+    api_response_dataframe: pd.DataFrame,
+    max_period: bool,
+) -> None:
+    """
+    Test get_price_data method with valid parameters.
+
+    And data present in the database re-adjusted by a corporate action.
+
+    Data Provider must call API connector to request price data after last record.
+    Data Provider must call API connector to request maximum period of price data.
+    Data Provider must call InfluxDB connector to write price data.
+    Data Provider must return a pandas Dataframe with requested price data.
+    """
+
+    price_data_provider = PriceDataProvider()
+
+    price_data_provider._api_connector = Mock(YahooApiConnector)  # noqa: SLF001
+
+    # Each request is answered with a fresh response,
+    # since provider prepares responses in place
+    price_data_provider._api_connector.request_price_data.side_effect = [  # noqa: SLF001
+        api_response_dataframe.copy(),
+        api_response_dataframe.copy(),
+    ]
+
+    # We copy the dataframe to avoid
+    # modifying the inputs between tests
+    expected_dataframe_to_write = api_response_dataframe.copy()
+
+    expected_dataframe_to_write.reset_index(inplace=True)
+
+    expected_dataframe_to_write.columns = [
+        "_".join(map(str, column)).lower()
+        for column in expected_dataframe_to_write.columns
+    ]
+    expected_dataframe_to_write.columns = [
+        column.split("_")[0] if "_" in column else column
+        for column in expected_dataframe_to_write.columns
+    ]
+
+    expected_dataframe_to_write.set_index("date", inplace=True)
+    expected_dataframe_to_write.insert(0, "ticker", TICKER)
+
+    adjustment_factor = (
+        expected_dataframe_to_write["adj close"] / expected_dataframe_to_write["close"]
+    )
+
+    for column in ["open", "high", "low", "volume"]:
+        expected_dataframe_to_write[f"adj {column}"] = (
+            expected_dataframe_to_write[column] * adjustment_factor
+        )
+
+    last_record_datetime: datetime = expected_dataframe_to_write.index[0]
+    last_record_date = last_record_datetime.date()
+
+    # Stored record was adjusted before a dividend
+    stored_dataframe = expected_dataframe_to_write.iloc[:1].copy()
+    stored_dataframe["adj close"] = stored_dataframe["close"]
+
+    price_data_provider._database_connector = Mock(InfluxDbConnector)  # noqa: SLF001
+    price_data_provider._database_connector.get_last_record_date.return_value = (  # noqa: SLF001
+        last_record_date
+    )
+    price_data_provider._database_connector.read_price_data.return_value = (  # noqa: SLF001
+        stored_dataframe
+    )
+
+    price_dataframe = price_data_provider.get_price_data(
         ticker=str(TICKER),
         frequency=str(FREQUENCY),
         start_date=str(START_DATE),
         end_date=str(END_DATE),
-        max_period=bool(MAX_PERIOD),
+        max_period=max_period,
     )
 
+    assert price_data_provider._api_connector.request_price_data.call_args_list == [  # noqa: SLF001
+        call(
+            ticker=str(TICKER),
+            frequency=str(FREQUENCY),
+            start_date=(last_record_date - timedelta(days=7)).strftime(
+                DEFAULT_DATE_FORMAT,
+            ),
+            end_date=(
+                datetime.strptime(str(END_DATE), DEFAULT_DATE_FORMAT)
+                + timedelta(days=1)
+            ).strftime(DEFAULT_DATE_FORMAT),
+            max_period=False,
+        ),
+        call(
+            ticker=str(TICKER),
+            frequency=str(FREQUENCY),
+            start_date=str(START_DATE),
+            end_date=str(END_DATE),
+            max_period=True,
+        ),
+    ]
+
     price_data_provider._database_connector.write_price_data.assert_called_once_with(  # noqa: SLF001
         frequency=str(FREQUENCY),
         # Please see tests/fixtures/window_size_and_dataframe.py
@@ -249,10 +405,18 @@ def test__get_price_data__with_valid_parameters_and_data_present_to_refresh(
         dataframe=SameDataframe(expected_dataframe_to_write),
     )
 
-    pd.testing.assert_frame_equal(price_dataframe, expected_dataframe_to_write)
+    # End date is exclusive, so that the last record is left out of range
+    pd.testing.assert_frame_equal(
+        price_dataframe,
+        expected_dataframe_to_write
+        if max_period
+        else expected_dataframe_to_write.iloc[:-1],
+    )
 
 
-@freeze_time(f"{END_DATE} 17:00:00")
+# Assume today date is Wednesday, 2013-01-02
+# Assume current time is trading hours 12:00 ET = 17:00 UTC
+@freeze_time("2013-01-02 17:00:00")
 @pytest.mark.usefixtures("api_response_dataframe")
 def test__get_price_data__with_valid_parameters_and_intraday_data(
     api_response_dataframe: pd.DataFrame,
@@ -269,6 +433,10 @@ def test__get_price_data__with_valid_parameters_and_intraday_data(
     Data Provider must return a pandas Dataframe with price data.
     """
 
+    # Last queried record is today, since END_DATE
+    # (New Year's Day) is an exchange holiday without session
+    api_response_dataframe.index += pd.Timedelta(days=1)
+
     price_data_provider = PriceDataProvider()
 
     price_data_provider._api_connector = Mock(YahooApiConnector)  # noqa: SLF001
@@ -392,3 +560,129 @@ def test__price_data_provider__with_invalid_dates() -> None:
         )
 
     assert str(exception.value) == exception_message
+
+
+def test__get_price_data__with_valid_parameters_and_data_cached(
+    dataframe: pd.DataFrame,
+) -> None:
+    """
+    Test get_price_data method with valid parameters.
+
+    And data requested earlier in the process.
+
+    Data Provider must call InfluxDB connector only on the first request.
+    Data Provider must return read-only views of the same price data.
+    Data Provider must allow adding columns to the returned views.
+    """
+
+    price_data_provider = PriceDataProvider()
+
+    price_data_provider._api_connector = Mock(YahooApiConnector)  # noqa: SLF001
+
+    price_data_provider._database_connector = Mock(InfluxDbConnector)  # noqa: SLF001
+    price_data_provider._database_connector.read_price_data.return_value = dataframe  # noqa: SLF001
+    price_data_provider._database_connector.get_last_record_date.return_value = (  # noqa: SLF001
+        datetime.now(
+            tz=ZoneInfo("UTC"),
+        ).date()
+    )
+
+    price_dataframe = price_data_provider.get_price_data(
+        ticker=str(TICKER),
+        frequency=str(FREQUENCY),
+        start_date=str(START_DATE),
+        end_date=str(END_DATE),
+        max_period=bool(MAX_PERIOD),
+    )
+
+    price_dataframe["vix close"] = 0.0
+
+    other_price_dataframe = price_data_provider.get_price_data(
+        ticker=str(TICKER),
+        frequency=str(FREQUENCY),
+        start_date=str(START_DATE),
+        end_date=str(END_DATE),
+        max_period=bool(MAX_PERIOD),
+    )
+
+    price_data_provider._database_connector.get_last_record_date.assert_called_once()  # noqa: SLF001
+    price_data_provider._database_connector.read_price_data.assert_called_once()  # noqa: SLF001
+
+    pd.testing.assert_frame_equal(other_price_dataframe, dataframe)
+
+    with pytest.raises(ValueError, match="read-only"):
+        other_price_dataframe["close"].to_numpy()[0] = 0.0
+
+
+@pytest.mark.usefixtures("dataframe", "clean_data")
+def test__get_price_data__with_local_store_synced_from_database(
+    dataframe: pd.DataFrame,
+) -> None:
+    """
+    Test get_price_data method with local store synced from database.
+
+    Data Provider must call InfluxDB connector to read all price data once.
+    Data Provider must call InfluxDB connector to read only newer price data.
+    Data Provider must not call InfluxDB connector if local store is current.
+    Data Provider must return price data from local store.
+    """
+
+    price_data_provider = PriceDataProvider()
+
+    price_data_provider._local_store_connector = LocalStoreConnector(  # noqa: SLF001
+        directory=Path(f"{TEMP_TEST_DIR}/price_data"),
+    )
+
+    price_data_provider._database_connector = Mock(InfluxDbConnector)  # noqa: SLF001
+    price_data_provider._database_connector.get_last_record_date.side_effect = [  # noqa: SLF001
+        dataframe.index[-2].date(),
+        dataframe.index[-1].date(),
+        dataframe.index[-1].date(),
+    ]
+    price_data_provider._database_connector.read_price_data.side_effect = [  # noqa: SLF001
+        dataframe.iloc[:-1],
+        dataframe.iloc[-2:],
+    ]
+
+    price_dataframes = []
+
+    # Stored price data is up to date
+    with patch.object(
+        PriceDataAvailabilityHelper,
+        "check_if_price_data_needs_update",
+        return_value=False,
+    ):
+        for _ in range(3):
+            # Each request reaches storage
+            PRICE_DATA_CACHE.clear()
+
+            price_dataframes.append(
+                price_data_provider.get_price_data(
+                    ticker=str(TICKER),
+                    frequency=str(FREQUENCY),
+                    start_date=str(START_DATE),
+                    end_date=str(END_DATE),
+                    max_period=True,
+                ),
+            )
+
+    assert price_data_provider._database_connector.read_price_data.call_args_list == [  # noqa: SLF001
+        call(
+            ticker=str(TICKER),
+            frequency=str(FREQUENCY),
+            start_date=str(START_DATE),
+            end_date=str(END_DATE),
+            max_period=True,
+        ),
+        call(
+            ticker=str(TICKER),
+            frequency=str(FREQUENCY),
+            start_date=dataframe.index[-2].strftime(DEFAULT_DATE_FORMAT),
+            end_date=ANY,
+            max_period=False,
+        ),
+    ]
+
+    pd.testing.assert_frame_equal(price_dataframes[0], dataframe.iloc[:-1])
+    pd.testing.assert_frame_equal(price_dataframes[1], dataframe)
+    pd.testing.assert_frame_equal(price_dataframes[2], dataframe)
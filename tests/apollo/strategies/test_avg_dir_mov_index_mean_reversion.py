@@ -5,6 +5,7 @@ from apollo.calculators.average_directional_movement_index import (
     AverageDirectionalMovementIndexCalculator,
 )
 from apollo.calculators.average_true_range import AverageTrueRangeCalculator
+from apollo.calculators.calculation_cache import CALCULATION_CACHE
 from apollo.calculators.engulfing_vix_pattern import EngulfingVIXPatternCalculator
 from apollo.settings import LONG_SIGNAL, NO_SIGNAL, SHORT_SIGNAL
 from apollo.strategies.avg_dir_mov_index_mean_reversion import (
@@ -101,3 +102,58 @@ def test__average_directional_movement_index_mean_reversion__with_valid_paramete
         control_dataframe["signal"],
         enhanced_dataframe["signal"],
     )
+
+
+@pytest.mark.usefixtures("enhanced_dataframe")
+def test__precalculate_indicators__for_identical_signals_from_cache(
+    enhanced_dataframe: pd.DataFrame,
+) -> None:
+    """
+    Test precalculate_indicators method for identical signals from cache.
+
+    ATR and ADX of each window size must be served from the cache,
+    signals must be identical to signals modeled without precalculation.
+    """
+
+    window_sizes = [5, 10]
+
+    control_dataframes = {}
+
+    for window_size in window_sizes:
+        CALCULATION_CACHE.clear()
+
+        control_dataframes[window_size] = enhanced_dataframe.copy()
+
+        AverageDirectionalMovementIndexMeanReversion(
+            dataframe=control_dataframes[window_size],
+            window_size=window_size,
+        ).model_trading_signals()
+
+    CALCULATION_CACHE.clear()
+
+    price_dataframe = enhanced_dataframe.copy()
+
+    AverageDirectionalMovementIndexMeanReversion.precalculate_indicators(
+        enhanced_dataframe,
+        window_sizes,
+        [{}],
+    )
+
+    # Price data must be left untouched
+    pd.testing.assert_frame_equal(enhanced_dataframe, price_dataframe)
+
+    for window_size in window_sizes:
+        window_dataframe = enhanced_dataframe.copy()
+
+        AverageDirectionalMovementIndexMeanReversion(
+            dataframe=window_dataframe,
+            window_size=window_size,
+        ).model_trading_signals()
+
+        pd.testing.assert_frame_equal(
+            window_dataframe,
+            control_dataframes[window_size],
+        )
+
+    # Only VIX pattern, which has no batch calculator, is calculated
+    assert CALCULATION_CACHE.statistics["misses"] == 1
@@ -2,6 +2,7 @@ import pandas as pd
 import pytest
 
 from apollo.calculators.average_true_range import AverageTrueRangeCalculator
+from apollo.calculators.calculation_cache import CALCULATION_CACHE
 from apollo.calculators.engulfing_vix_pattern import (
     EngulfingVIXPatternCalculator,
 )
@@ -91,3 +92,34 @@ def test__lin_reg_chan_mean_reversion__with_valid_parameters(
         control_dataframe["signal"],
         enhanced_dataframe["signal"],
     )
+
+
+@pytest.mark.usefixtures("enhanced_dataframe")
+def test__precalculate_indicators__for_valid_channel_sd_spreads_only(
+    enhanced_dataframe: pd.DataFrame,
+) -> None:
+    """
+    Test precalculate_indicators method for valid channel SD spreads only.
+
+    ATR must be cached for each window size.
+    Channel must be cached for each window size and valid spread,
+    spreads the strategy would reject must be skipped.
+    """
+
+    window_sizes = [5, 10]
+
+    CALCULATION_CACHE.clear()
+
+    LinearRegressionChannelMeanReversion.precalculate_indicators(
+        enhanced_dataframe,
+        window_sizes,
+        [
+            {"channel_sd_spread": 0.5},
+            {"channel_sd_spread": 1.0},
+            {"channel_sd_spread": 1},
+            {},
+        ],
+    )
+
+    # ATR and channel of two spreads for each window size
+    assert CALCULATION_CACHE.statistics["size"] == len(window_sizes) * 3
@@ -1,6 +1,16 @@
-from multiprocessing import cpu_count
+import logging
+from multiprocessing import Pool, cpu_count
+from unittest.mock import Mock
 
-from apollo.utils.multiprocessing_capable import MultiprocessingCapable
+import pytest
+
+from apollo.settings import SchedulingMode
+from apollo.utils.multiprocessing_capable import (
+    CHUNKS_PER_PROCESS,
+    TARGET_CHUNK_DURATION,
+    MultiprocessingCapable,
+    ParallelJob,
+)
 
 
 def test__multiprocessing_capable__for_correct_number_of_cpu_cores() -> None:
@@ -47,3 +57,244 @@ def test__create_batches__for_correct_inputs_batching() -> None:
     )
 
     assert control_batches == batches
+
+
+def test__create_batches__for_batches_aligned_to_granularity() -> None:
+    """
+    Test create_batches method for batches aligned to granularity.
+
+    create_batches() must cut batches at multiples of granularity only,
+    spreading whole units as equally as possible.
+    """
+
+    multiprocessing_capable = MultiprocessingCapable()
+    multiprocessing_capable._available_cores = 3  # noqa: SLF001
+
+    granularity = 4
+
+    # Seven whole units of four items, the last one incomplete
+    inputs = list(range(27))
+
+    batches = multiprocessing_capable._create_batches(  # noqa: SLF001
+        inputs,
+        granularity,
+    )
+
+    assert batches == [inputs[:12], inputs[12:20], inputs[20:]]
+    assert all(len(batch) % granularity == 0 for batch in batches[:-1])
+
+
+def mimic_batch_processing(batch: list[int]) -> list[int]:
+    """
+    Mimic processing of a batch, raising on negative items.
+
+    :param batch: Batch of items to process.
+    :returns: Processed items.
+    """
+
+    if any(item < 0 for item in batch):
+        raise ValueError("Negative item.")
+
+    return [item * 2 for item in batch]
+
+
+def test__process_in_parallel__for_equal_batches_in_static_mode() -> None:
+    """
+    Test process_in_parallel method for equal batches in static mode.
+
+    Method must map the function over equal batches of inputs.
+    """
+
+    multiprocessing_capable = MultiprocessingCapable()
+    multiprocessing_capable._scheduling_mode = SchedulingMode.STATIC  # noqa: SLF001
+
+    pool = Mock()
+
+    inputs = list(range(10))
+
+    multiprocessing_capable._process_in_parallel(  # noqa: SLF001
+        pool,
+        mimic_batch_processing,
+        inputs,
+    )
+
+    pool.map.assert_called_once_with(
+        mimic_batch_processing,
+        multiprocessing_capable._create_batches(inputs),  # noqa: SLF001
+    )
+
+
+def test__process_in_parallel__for_ordered_results_in_dynamic_mode(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """
+    Test process_in_parallel method for ordered results in dynamic mode.
+
+    Method must process all inputs in chunks of whole units
+    and return results in order of inputs.
+    Method must log scheduling statistics.
+    """
+
+    caplog.set_level(logging.INFO)
+
+    multiprocessing_capable = MultiprocessingCapable()
+    multiprocessing_capable._available_cores = 2  # noqa: SLF001
+    multiprocessing_capable._scheduling_mode = SchedulingMode.DYNAMIC  # noqa: SLF001
+
+    inputs = list(range(60))
+    granularity = 3
+
+    with Pool(processes=2) as pool:
+        results = multiprocessing_capable._process_in_parallel(  # noqa: SLF001
+            pool,
+            mimic_batch_processing,
+            inputs,
+            granularity=granularity,
+        )
+
+    # Every chunk holds whole units
+    assert all(len(result) % granularity == 0 for result in results)
+    assert [item for result in results for item in result] == [
+        item * 2 for item in inputs
+    ]
+
+    assert "Scheduling statistics" in caplog.text
+
+
+@pytest.mark.parametrize(
+    "scheduling_mode",
+    [SchedulingMode.STATIC, SchedulingMode.DYNAMIC],
+)
+def test__process_jobs_in_parallel__for_results_of_each_job(
+    scheduling_mode: SchedulingMode,
+) -> None:
+    """
+    Test process_jobs_in_parallel method for results of each job.
+
+    Method must process inputs of all jobs within the same pool
+    and return results of each job in order of its inputs.
+    """
+
+    multiprocessing_capable = MultiprocessingCapable()
+    multiprocessing_capable._available_cores = 2  # noqa: SLF001
+    multiprocessing_capable._scheduling_mode = scheduling_mode  # noqa: SLF001
+
+    jobs: list[ParallelJob] = [
+        {
+            "function": mimic_batch_processing,
+            "inputs": list(range(30)),
+            "granularity": 3,
+        },
+        {
+            "function": mimic_batch_processing,
+            "inputs": [],
+            "granularity": 1,
+        },
+        {
+            "function": mimic_batch_processing,
+            "inputs": list(range(100, 105)),
+            "granularity": 1,
+        },
+    ]
+
+    with Pool(processes=2) as pool:
+        results = multiprocessing_capable._process_jobs_in_parallel(  # noqa: SLF001
+            pool,
+            jobs,
+        )
+
+    assert [
+        [item for result in job_results for item in result] for job_results in results
+    ] == [[item * 2 for item in job["inputs"]] for job in jobs]
+
+
+def test__process_in_parallel__for_raising_error_in_dynamic_mode() -> None:
+    """
+    Test process_in_parallel method for raising error in dynamic mode.
+
+    Method must re-raise error raised by processing of any chunk.
+    """
+
+    multiprocessing_capable = MultiprocessingCapable()
+    multiprocessing_capable._available_cores = 2  # noqa: SLF001
+    multiprocessing_capable._scheduling_mode = SchedulingMode.DYNAMIC  # noqa: SLF001
+
+    exception_message = "Negative item."
+
+    with (
+        Pool(processes=2) as pool,
+        pytest.raises(
+            ValueError,
+            match=exception_message,
+        ) as exception,
+    ):
+        multiprocessing_capable._process_in_parallel(  # noqa: SLF001
+            pool,
+            mimic_batch_processing,
+            [1, 2, -3, 4],
+        )
+
+    assert str(exception.value) == exception_message
+
+
+def test__get_chunk_size__for_sizing_chunks_by_measured_cost() -> None:
+    """
+    Test get_chunk_size method for sizing chunks by measured cost.
+
+    Method must probe with a single unit until cost is measured.
+    Method must size chunks to the target duration in whole units.
+    Method must shrink chunks as inputs run out.
+    """
+
+    multiprocessing_capable = MultiprocessingCapable()
+    multiprocessing_capable._available_cores = 2  # noqa: SLF001
+
+    unit = 8
+    items_per_target_duration = 100
+
+    chunk_sizes = [
+        # Nothing processed yet
+        multiprocessing_capable._get_chunk_size(  # noqa: SLF001
+            remaining_items=1_000,
+            busy_time=0.0,
+            processed_items=0,
+            granularity=unit,
+        ),
+        # Item costs fraction of the target duration
+        multiprocessing_capable._get_chunk_size(  # noqa: SLF001
+            remaining_items=1_000,
+            busy_time=TARGET_CHUNK_DURATION,
+            processed_items=items_per_target_duration,
+            granularity=1,
+        ),
+        # Size is rounded up to whole units
+        multiprocessing_capable._get_chunk_size(  # noqa: SLF001
+            remaining_items=1_000,
+            busy_time=TARGET_CHUNK_DURATION,
+            processed_items=items_per_target_duration,
+            granularity=unit,
+        ),
+        # Remaining items are spread between processes
+        multiprocessing_capable._get_chunk_size(  # noqa: SLF001
+            remaining_items=40,
+            busy_time=TARGET_CHUNK_DURATION,
+            processed_items=items_per_target_duration,
+            granularity=1,
+        ),
+        # Unless other jobs are left to keep processes busy
+        multiprocessing_capable._get_chunk_size(  # noqa: SLF001
+            remaining_items=40,
+            busy_time=TARGET_CHUNK_DURATION,
+            processed_items=items_per_target_duration,
+            granularity=1,
+            last_job=False,
+        ),
+    ]
+
+    assert chunk_sizes == [
+        unit,
+        items_per_target_duration,
+        (items_per_target_duration // unit + 1) * unit,
+        40 // (2 * CHUNKS_PER_PROCESS),
+        40,
+    ]
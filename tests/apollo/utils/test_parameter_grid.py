@@ -0,0 +1,96 @@
+import pickle
+from itertools import product
+
+import pytest
+
+from apollo.utils.multiprocessing_capable import MultiprocessingCapable
+from apollo.utils.parameter_grid import ParameterGrid
+
+RANGES = [[5.0, 10.0, 15.0], [0.5], [1.0, 2.0], [0.1, 0.2, 0.3, 0.4]]
+
+
+def test__parameter_grid__for_parity_with_product() -> None:
+    """
+    Test Parameter Grid for parity with product.
+
+    Grid must yield the same combinations in the same order
+    as the product of parameter ranges.
+    Combination at each index must be the same as the one yielded.
+    """
+
+    control_combinations = list(product(*RANGES))
+
+    parameter_grid = ParameterGrid(RANGES)
+
+    assert len(parameter_grid) == len(control_combinations)
+    assert list(parameter_grid) == control_combinations
+
+    assert [parameter_grid[index] for index in range(len(parameter_grid))] == (
+        control_combinations
+    )
+    assert parameter_grid[-1] == control_combinations[-1]
+
+
+def test__parameter_grid__for_lazy_slices() -> None:
+    """
+    Test Parameter Grid for lazy slices.
+
+    Slices must be grids with the same combinations as slices of the product.
+    Slices must not hold the combinations, only bounds of the slice.
+    """
+
+    control_combinations = list(product(*RANGES))
+
+    parameter_grid = ParameterGrid(RANGES)
+
+    for start, stop in [(0, 5), (7, 19), (20, 100), (10, 5)]:
+        grid_slice = parameter_grid[start:stop]
+
+        assert isinstance(grid_slice, ParameterGrid)
+        assert list(grid_slice) == control_combinations[start:stop]
+
+    assert list(parameter_grid[3:20][2:5]) == control_combinations[5:8]
+
+    # Pickled slice is no bigger than the whole grid
+    assert len(pickle.dumps(parameter_grid[10:20])) <= len(
+        pickle.dumps(parameter_grid),
+    )
+
+    # Batches of the grid are its slices
+    batches = MultiprocessingCapable()._create_batches(parameter_grid)  # noqa: SLF001
+
+    assert all(isinstance(batch, ParameterGrid) for batch in batches)
+    assert [combination for batch in batches for combination in batch] == (
+        control_combinations
+    )
+
+
+def test__parameter_grid__for_raising_on_invalid_access() -> None:
+    """
+    Test Parameter Grid for raising on invalid access.
+
+    Grid must raise IndexError if index is out of range.
+    Grid must raise ValueError if slice is not contiguous.
+    """
+
+    parameter_grid = ParameterGrid(RANGES)
+
+    exception_message = "Parameter grid index out of range."
+
+    with pytest.raises(
+        IndexError,
+        match=exception_message,
+    ) as exception:
+        parameter_grid[len(parameter_grid)]
+
+    assert str(exception.value) == exception_message
+
+    exception_message = "Parameter grid can only be sliced contiguously."
+
+    with pytest.raises(
+        ValueError,
+        match=exception_message,
+    ) as exception:
+        parameter_grid[::2]
+
+    assert str(exception.value) == exception_message
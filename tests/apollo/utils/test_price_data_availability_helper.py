@@ -1,9 +1,14 @@
-from datetime import datetime
+from datetime import date, datetime, time
+from unittest.mock import patch
 from zoneinfo import ZoneInfo
 
+import pandas_market_calendars as mcal
 from freezegun import freeze_time
 
-from apollo.utils.price_data_availability_helper import PriceDataAvailabilityHelper
+from apollo.utils.price_data_availability_helper import (
+    PriceDataAvailabilityHelper,
+    get_exchange_sessions,
+)
 
 
 # Assume today date is Friday, 2024-07-12
@@ -289,3 +294,92 @@ def test__check_if_price_data_includes_intraday__with_last_query_before_today_id
     )
 
     assert result is False
+
+
+# Assume today date is Friday, 2024-07-05
+# Assume current time is trading hours 10:00 ET = 14:00 UTC
+@freeze_time("2024-07-05 14:00")
+def test__check_if_price_data_needs_update__with_last_record_before_holiday() -> None:
+    """
+    Test check_if_price_data_needs_update with last record before exchange holiday.
+
+    And previous business day is exchange holiday = no data for it from exchange.
+
+    Function should return False.
+    """
+
+    # Assume last available record date is Wednesday, 2024-07-03
+    last_record_date = datetime(2024, 7, 3, tzinfo=ZoneInfo("UTC")).date()
+
+    result = PriceDataAvailabilityHelper.check_if_price_data_needs_update(
+        last_record_date,
+    )
+
+    assert result is False
+
+
+# Assume today date is Wednesday, 2024-07-03
+# Assume current time is after early close 14:00 ET = 18:00 UTC
+@freeze_time("2024-07-03 18:00")
+def test__check_if_price_data_needs_update__with_last_record_prev_b_day_ec() -> None:
+    """
+    Test check_if_price_data_needs_update with last record being previous business day.
+
+    And time is past exchange early close time = data should be available.
+
+    Function should return True.
+    """
+
+    # Assume last available record date is Tuesday, 2024-07-02
+    last_record_date = datetime(2024, 7, 2, tzinfo=ZoneInfo("UTC")).date()
+
+    result = PriceDataAvailabilityHelper.check_if_price_data_needs_update(
+        last_record_date,
+    )
+
+    assert result is True
+
+
+# Assume today date is Wednesday, 2024-07-03
+# Assume current time is after early close 14:00 ET = 18:00 UTC
+@freeze_time("2024-07-03 18:00")
+def test__check_if_price_data_includes_intraday__with_last_query_after_ec() -> None:
+    """
+    Test check_if_price_data_includes_intraday with last query today after early close.
+
+    Function should return False.
+    """
+
+    # Assume last queried record date is Wednesday, 2024-07-03
+    last_queried_date = datetime(2024, 7, 3, tzinfo=ZoneInfo("UTC")).date()
+
+    result = PriceDataAvailabilityHelper.check_if_price_data_includes_intraday(
+        last_queried_date,
+    )
+
+    assert result is False
+
+
+@patch("apollo.utils.price_data_availability_helper._exchange_sessions", {})
+def test__get_exchange_sessions__for_sessions_computed_once_per_year() -> None:
+    """
+    Test get_exchange_sessions function for sessions computed once per year.
+
+    Function must leave out exchange holidays.
+    Function must reflect early closes in session close time.
+    Function must compute sessions of the year only once.
+    """
+
+    with patch(
+        "apollo.utils.price_data_availability_helper.mcal.get_calendar",
+        wraps=mcal.get_calendar,
+    ) as get_calendar:
+        exchange_sessions = get_exchange_sessions(2024)
+
+        assert get_exchange_sessions(2024) is exchange_sessions
+
+    get_calendar.assert_called_once()
+
+    assert date(2024, 7, 4) not in exchange_sessions.index
+    assert exchange_sessions.loc[date(2024, 7, 3), "close"].time() == time(13)
+    assert exchange_sessions.loc[date(2024, 7, 5), "close"].time() == time(16)
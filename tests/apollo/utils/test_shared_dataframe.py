@@ -0,0 +1,115 @@
+from multiprocessing import Pool
+from pathlib import Path
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from apollo.utils.shared_dataframe import (
+    SharedDataframe,
+    attach_shared_dataframes,
+    get_shared_dataframe,
+    load_shared_dataframe,
+)
+
+
+def mimic_worker_process(column: str) -> float:
+    """
+    Mimic worker process reading from the attached dataframe.
+
+    :param column: Column to sum.
+    :returns: Sum of the column values.
+    """
+
+    return float(get_shared_dataframe("prices")[column].sum())
+
+
+@pytest.mark.usefixtures("enhanced_dataframe")
+def test__shared_dataframe__for_read_only_views_of_published_dataframe(
+    enhanced_dataframe: pd.DataFrame,
+) -> None:
+    """
+    Test Shared Dataframe for read-only views of published dataframe.
+
+    Loaded dataframe must be identical to the published one.
+    Loaded columns must be read-only views of the same memory-mapped arrays.
+    """
+
+    with SharedDataframe(enhanced_dataframe) as descriptor:
+        shared_dataframe = load_shared_dataframe(descriptor)
+        other_shared_dataframe = load_shared_dataframe(descriptor)
+
+        pd.testing.assert_frame_equal(shared_dataframe, enhanced_dataframe)
+
+        shared_close = shared_dataframe["close"].to_numpy()
+
+        assert not shared_close.flags.writeable
+        assert not shared_close.flags.owndata
+
+        # Copies of the shared dataframe are writable
+        assert shared_dataframe.copy()["close"].to_numpy().flags.writeable
+
+        pd.testing.assert_frame_equal(other_shared_dataframe, enhanced_dataframe)
+
+
+@pytest.mark.usefixtures("enhanced_dataframe")
+def test__shared_dataframe__for_removing_published_arrays_on_exit(
+    enhanced_dataframe: pd.DataFrame,
+) -> None:
+    """
+    Test Shared Dataframe for removing published arrays on exit.
+
+    Published arrays must be removed once the context is exited,
+    even if the context is exited with an exception.
+    """
+
+    with SharedDataframe(enhanced_dataframe) as descriptor:
+        assert Path(descriptor["directory"]).is_dir()
+
+    assert not Path(descriptor["directory"]).exists()
+
+    with (
+        pytest.raises(ValueError, match="Run failed"),
+        SharedDataframe(enhanced_dataframe) as descriptor,
+    ):
+        raise ValueError("Run failed.")
+
+    assert not Path(descriptor["directory"]).exists()
+
+
+@pytest.mark.usefixtures("enhanced_dataframe")
+@patch("apollo.utils.shared_dataframe._attached_dataframes", {})
+def test__get_shared_dataframe__for_attached_dataframe_in_worker_processes(
+    enhanced_dataframe: pd.DataFrame,
+) -> None:
+    """
+    Test get_shared_dataframe function for attached dataframe in worker processes.
+
+    Function must raise RuntimeError if no dataframe is attached to the process.
+    Worker processes must read dataframe attached by pool initializer.
+    """
+
+    exception_message = "Shared dataframe prices is not attached to this process."
+
+    with pytest.raises(
+        RuntimeError,
+        match=exception_message,
+    ) as exception:
+        get_shared_dataframe("prices")
+
+    assert str(exception.value) == exception_message
+
+    with (
+        SharedDataframe(enhanced_dataframe) as descriptor,
+        Pool(
+            processes=2,
+            initializer=attach_shared_dataframes,
+            initargs=({"prices": descriptor},),
+        ) as pool,
+    ):
+        results = pool.map(mimic_worker_process, ["close", "volume"])
+
+    assert results == [
+        float(enhanced_dataframe["close"].sum()),
+        float(enhanced_dataframe["volume"].sum()),
+    ]
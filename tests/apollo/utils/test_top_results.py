@@ -0,0 +1,99 @@
+import numpy as np
+import pandas as pd
+
+from apollo.utils.top_results import TopResults
+
+RANKING_STATISTICS = ["Sharpe Ratio", "Return [%]", "# Trades"]
+
+
+def create_results(
+    sharpe_ratio: float,
+    total_return: float,
+    number_of_trades: int,
+    parameters: str,
+) -> pd.Series:
+    """
+    Create results of single backtesting run.
+
+    :param sharpe_ratio: Sharpe Ratio of the run.
+    :param total_return: Return of the run.
+    :param number_of_trades: Number of trades of the run.
+    :param parameters: Parameters of the run.
+    :returns: Series with backtesting statistics and parameters.
+    """
+
+    return pd.Series(
+        {
+            "Sharpe Ratio": sharpe_ratio,
+            "Return [%]": total_return,
+            "# Trades": number_of_trades,
+            "_trades": pd.DataFrame(),
+            "parameters": parameters,
+        },
+    )
+
+
+def test__top_results__for_keeping_best_results() -> None:
+    """
+    Test Top Results for keeping best results.
+
+    Top Results must keep only the best results, from the best to the worst.
+    Results must be ranked by each statistic in order of importance.
+    Missing statistics must rank last.
+    Earlier results must win ties.
+    Private statistics must be dropped.
+    """
+
+    top_results = TopResults(ranking_statistics=RANKING_STATISTICS, max_size=3)
+
+    for results in [
+        create_results(1.0, 10.0, 5, "a"),
+        create_results(np.nan, 50.0, 1, "b"),
+        create_results(2.0, 5.0, 3, "c"),
+        create_results(1.0, 10.0, 7, "d"),
+        create_results(1.0, 10.0, 5, "e"),
+        create_results(0.5, 20.0, 9, "f"),
+    ]:
+        top_results.add(results)
+
+    results_dataframe = top_results.to_dataframe()
+
+    assert len(top_results) == len(results_dataframe)
+    assert list(results_dataframe["parameters"]) == ["c", "d", "a"]
+    assert "_trades" not in results_dataframe.columns
+
+
+def test__top_results__for_keeping_all_results_without_max_size() -> None:
+    """
+    Test Top Results for keeping all results without max size.
+
+    Top Results must keep every result ranked the same way
+    as sorting the whole results table would.
+    """
+
+    generator = np.random.default_rng(0)
+
+    top_results = TopResults(ranking_statistics=RANKING_STATISTICS, max_size=None)
+
+    results = [
+        create_results(
+            float(generator.choice([0.5, 1.0, np.nan])),
+            float(generator.choice([5.0, 10.0])),
+            int(generator.integers(0, 3)),
+            str(position),
+        )
+        for position in range(50)
+    ]
+
+    for run_results in results:
+        top_results.add(run_results)
+
+    control_dataframe = (
+        pd.DataFrame(results)
+        .drop(columns=["_trades"])
+        .sort_values(RANKING_STATISTICS, ascending=False)
+    )
+
+    assert list(top_results.to_dataframe()["parameters"]) == list(
+        control_dataframe["parameters"],
+    )
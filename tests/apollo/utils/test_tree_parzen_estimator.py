@@ -0,0 +1,92 @@
+import numpy as np
+
+from apollo.utils.tree_parzen_estimator import TreeParzenEstimator
+
+RADICES = [20, 20, 5]
+
+
+def mimic_objective(digits: list[int]) -> float:
+    """
+    Mimic objective with single peak in the grid.
+
+    :param digits: Position of value for each parameter.
+    :returns: Score of the candidate, higher is better.
+    """
+
+    return -float(np.abs(np.array(digits) - np.array([15, 4, 2])).sum())
+
+
+def decode(index: int) -> list[int]:
+    """
+    Decode index of the candidate into positions of values.
+
+    :param index: Index of the candidate.
+    :returns: Position of value for each parameter.
+    """
+
+    digits = []
+
+    for radix in reversed(RADICES):
+        index, digit = divmod(index, radix)
+        digits.append(digit)
+
+    return digits[::-1]
+
+
+def test__tree_parzen_estimator__for_proposing_each_candidate_once() -> None:
+    """
+    Test Tree-structured Parzen Estimator for proposing each candidate once.
+
+    Estimator must never propose the same candidate twice.
+    Estimator must stop proposing once every candidate was proposed.
+    """
+
+    estimator = TreeParzenEstimator([3, 4], seed=0)
+
+    proposals = []
+
+    while not estimator.exhausted:
+        round_proposals = estimator.propose(5)
+
+        for index in round_proposals:
+            estimator.observe(index, (float(index % 3),))
+
+        proposals.extend(round_proposals)
+
+    assert sorted(proposals) == list(range(3 * 4))
+    assert estimator.propose(5) == []
+
+
+def test__tree_parzen_estimator__for_focusing_on_promising_regions() -> None:
+    """
+    Test Tree-structured Parzen Estimator for focusing on promising regions.
+
+    Estimator must find better candidates than random search
+    with the same budget of evaluations.
+    """
+
+    budget = 100
+
+    estimator = TreeParzenEstimator(RADICES, seed=0)
+
+    for _ in range(budget // 10):
+        for index in estimator.propose(10):
+            estimator.observe(index, (mimic_objective(decode(index)),))
+
+    best_score = max(
+        mimic_objective(decode(index))
+        for index in estimator._observations  # noqa: SLF001
+    )
+
+    generator = np.random.default_rng(0)
+
+    random_best_scores = [
+        max(
+            mimic_objective(decode(int(index)))
+            for index in generator.choice(np.prod(RADICES), size=budget, replace=False)
+        )
+        for _ in range(20)
+    ]
+
+    assert best_score > np.median(random_best_scores)
+    assert best_score == mimic_objective([15, 4, 2])